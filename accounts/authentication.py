@@ -0,0 +1,61 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+
+
+# 액세스 토큰의 클레임만으로 만든 사용자
+# id / role / name / is_staff 는 DB 조회 없이 사용하고,
+# 그 외 속성에 접근하거나 get_instance() 를 호출할 때만 User 를 한 번 불러온다
+class ClaimsUser:
+    is_authenticated = True
+    is_anonymous = False
+    is_active = True
+
+    def __init__(self, token):
+        self.token = token
+        self.id = self.pk = int(token[api_settings.USER_ID_CLAIM])
+        self.role = token['role']
+        self.name = token.get('name', '')
+        self.is_staff = token.get('is_staff', False)
+        self._instance = None
+
+    def get_instance(self):
+        if self._instance is None:
+            try:
+                self._instance = User.objects.get(pk=self.id)
+            except User.DoesNotExist:
+                # 토큰 발급 뒤 삭제된 사용자 (500 대신 인증 실패로 응답)
+                raise AuthenticationFailed('사용자를 찾을 수 없습니다.', code='user_not_found')
+        return self._instance
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.get_instance(), name)
+
+    def __eq__(self, other):
+        if isinstance(other, (ClaimsUser, User)):
+            return self.pk == other.pk
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __str__(self):
+        return f"[{self.role}] {self.name}"
+
+
+# 역할 클레임이 있는 토큰은 DB 조회 없이 인증
+# 토큰이 유효한 동안(ACCESS_TOKEN_LIFETIME)에는 비활성화/역할 변경이 반영되지 않음
+class ClaimsJWTAuthentication(JWTAuthentication):
+    @staticmethod
+    def has_claims(validated_token):
+        return 'role' in validated_token and api_settings.USER_ID_CLAIM in validated_token
+
+    def get_user(self, validated_token):
+        if not self.has_claims(validated_token):
+            # 역할 클레임이 없는 이전 토큰
+            return super().get_user(validated_token)
+        return ClaimsUser(validated_token)
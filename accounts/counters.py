@@ -0,0 +1,105 @@
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+
+from communications.models import Message
+from .models import Notification, UnreadCounter, User
+
+NOTIFICATIONS = 'notifications'
+MESSAGES = 'messages'
+
+
+def _ensure(user_ids):
+    UnreadCounter.objects.bulk_create(
+        [UnreadCounter(user_id=user_id) for user_id in user_ids],
+        ignore_conflicts=True,
+    )
+
+
+# user_ids 각각의 카운터를 amount 만큼 증가
+def increment(field, user_ids, amount=1):
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    _ensure(user_ids)
+    UnreadCounter.objects.filter(user_id__in=user_ids).update(**{field: F(field) + amount})
+
+
+# {user_id: 증가량} 을 증가량별로 묶어 UPDATE
+def increment_many(field, counts):
+    by_amount = defaultdict(list)
+    for user_id, amount in Counter(counts).items():
+        by_amount[amount].append(user_id)
+    for amount, user_ids in by_amount.items():
+        increment(field, user_ids, amount)
+
+
+def decrement(field, user_id, amount=1):
+    if amount <= 0:
+        return
+    UnreadCounter.objects.filter(user_id=user_id).update(**{field: Greatest(F(field) - amount, Value(0))})
+
+
+def _count_notifications(user_ids):
+    queryset = Notification.objects.filter(is_read=False, user_id__in=user_ids)
+    rows = queryset.order_by().values('user_id').annotate(count=Count('id'))
+    return {row['user_id']: row['count'] for row in rows}
+
+
+def _count_messages(user_ids):
+    queryset = Message.objects.filter(read_at__isnull=True, recipient_id__in=user_ids)
+    rows = queryset.order_by().values('recipient_id').annotate(count=Count('id'))
+    return {row['recipient_id']: row['count'] for row in rows}
+
+
+# 배지 조회: 카운터 행 PK 조회 한 번
+# 카운터가 아직 없는 사용자는 한 번만 실제 개수를 세어 생성
+def get_counts(user_id):
+    counter = UnreadCounter.objects.filter(user_id=user_id).first()
+    if counter is None:
+        counter = UnreadCounter(
+            user_id=user_id,
+            notifications=_count_notifications([user_id]).get(user_id, 0),
+            messages=_count_messages([user_id]).get(user_id, 0),
+        )
+        UnreadCounter.objects.bulk_create([counter], ignore_conflicts=True)
+    return {NOTIFICATIONS: counter.notifications, MESSAGES: counter.messages}
+
+
+# 실제 개수와 어긋난 카운터를 보정하고 보정한 행 수를 반환
+# - 사용자 id 순으로 batch_size 명씩 나눠 배치마다 트랜잭션 하나 (서버 측 커서/전체 개수 맵 없음)
+# - 배치의 카운터 행을 먼저 잠그고 나서 개수를 세므로, 그 사이의 increment/decrement 는
+#   잠금을 기다렸다가 보정된 값 위에 반영됨 (읽고 덮어쓰는 사이에 증가분을 잃지 않음)
+def reconcile(batch_size=1000):
+    fixed = 0
+    last_id = 0
+    while True:
+        user_ids = list(
+            User.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        if not user_ids:
+            return fixed
+        last_id = user_ids[-1]
+        with transaction.atomic():
+            fixed += _reconcile_batch(user_ids)
+
+
+def _reconcile_batch(user_ids):
+    # 카운터가 없던 사용자도 잠글 수 있도록 0 으로 먼저 만들어 둠
+    _ensure(user_ids)
+    locked = list(UnreadCounter.objects.select_for_update().filter(user_id__in=user_ids).order_by('user_id'))
+    notifications = _count_notifications(user_ids)
+    messages = _count_messages(user_ids)
+
+    drifted = []
+    for counter in locked:
+        expected_notifications = notifications.get(counter.user_id, 0)
+        expected_messages = messages.get(counter.user_id, 0)
+        if counter.notifications != expected_notifications or counter.messages != expected_messages:
+            counter.notifications = expected_notifications
+            counter.messages = expected_messages
+            drifted.append(counter)
+    UnreadCounter.objects.bulk_update(drifted, [NOTIFICATIONS, MESSAGES])
+    return len(drifted)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from accounts import counters
+
+
+# 주기 실행 (예: cron 10분 간격)
+class Command(BaseCommand):
+    help = '읽지 않은 알림/메시지 카운터를 실제 개수와 맞춥니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        fixed = counters.reconcile(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'보정된 카운터: {fixed}'))
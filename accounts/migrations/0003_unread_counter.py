@@ -0,0 +1,59 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    Notification = apps.get_model('accounts', 'Notification')
+    Message = apps.get_model('communications', 'Message')
+    UnreadCounter = apps.get_model('accounts', 'UnreadCounter')
+
+    counts = {}
+    rows = (
+        Notification.objects.filter(is_read=False)
+        .order_by().values('user_id').annotate(count=Count('id'))
+    )
+    for row in rows:
+        counts.setdefault(row['user_id'], [0, 0])[0] = row['count']
+    rows = (
+        Message.objects.filter(read_at__isnull=True, recipient__isnull=False)
+        .order_by().values('recipient_id').annotate(count=Count('id'))
+    )
+    for row in rows:
+        counts.setdefault(row['recipient_id'], [0, 0])[1] = row['count']
+
+    UnreadCounter.objects.bulk_create(
+        [
+            UnreadCounter(user_id=user_id, notifications=notifications, messages=messages)
+            for user_id, (notifications, messages) in counts.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_notification_lecture'),
+        ('lectures', '0002_lecture_cursor_index'),
+        ('communications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnreadCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='unread_counter', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+                ('notifications', models.IntegerField(default=0, verbose_name='읽지 않은 알림 수')),
+                ('messages', models.IntegerField(default=0, verbose_name='읽지 않은 메시지 수')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='accounts_no_user_id_e684d6_idx'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 20:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_notification_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='calendar_token_version',
+            field=models.PositiveIntegerField(default=0, verbose_name='일정 구독 토큰 버전'),
+        ),
+    ]
@@ -27,6 +27,8 @@ class User(AbstractUser):
     )
     bio = models.TextField('강사 이력 (소개)', blank=True, null=True)
     portfolio_content = models.TextField('포트폴리오 상세 내용', blank=True, null=True)
+    # 일정 구독(iCalendar) 토큰 버전 (재발급하면 올려서 이전 구독 URL 을 무효화)
+    calendar_token_version = models.PositiveIntegerField('일정 구독 토큰 버전', default=0)
     first_name = None
     last_name = None
 
@@ -54,13 +56,34 @@ class Notification(models.Model):
     message = models.TextField('알림 내용')
     is_read = models.BooleanField('읽음 여부', default=False)
     created_at = models.DateTimeField('알림 생성 시각', auto_now_add=True)
+    updated_at = models.DateTimeField('수정일', auto_now=True)
 
     class Meta:
         ordering = ['-created_at'] # 최신 순
         indexes = [
             models.Index(fields=['user', 'is_read']),
+            # 사용자별 알림 목록 커서 페이지네이션
+            models.Index(fields=['user', '-created_at', '-id']),
         ]
 
     def __str__(self):
         # user 모델 인스턴스
-        return f"[{self.user.name}님] {self.message[:20]}..."
\ No newline at end of file
+        return f"[{self.user.name}님] {self.message[:20]}..."
+
+
+# 읽지 않은 알림/메시지 수 (헤더 배지용 비정규화 카운터)
+# 생성/읽음 처리 시 증감하고, reconcile_unread_counters 명령으로 주기적으로 보정
+class UnreadCounter(models.Model):
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='unread_counter',
+        verbose_name='사용자'
+    )
+
+    notifications = models.IntegerField('읽지 않은 알림 수', default=0)
+    messages = models.IntegerField('읽지 않은 메시지 수', default=0)
+
+    def __str__(self):
+        return f"{self.user_id} - 알림 {self.notifications} / 메시지 {self.messages}"
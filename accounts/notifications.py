@@ -0,0 +1,147 @@
+from collections import Counter
+from itertools import islice
+
+from django.db import transaction
+
+from communications.pubsub import publish_to_users
+from config.tasks import enqueue
+from sync.changes import Kind, record_user_changes
+from lectures.models import Lecture, Application
+from . import counters
+from .models import User, Notification
+
+BATCH_SIZE = 1000
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+# 쿼리셋을 첫 필드(고유 키) 순으로 batch_size 행씩 끊어 읽음 (keyset 페이지네이션)
+# bulk_create_notifications 는 청크마다 커밋하므로 .iterator() 의 서버 측 커서를 쓰지 않음
+# (트랜잭션 풀링 PgBouncer 에서는 커서가 커밋을 넘어 유지되지 않음)
+def iterate_by_key(queryset, key, *fields, batch_size=BATCH_SIZE):
+    queryset = queryset.order_by(key).values_list(key, *fields)
+    last = None
+    while True:
+        page = queryset if last is None else queryset.filter(**{f'{key}__gt': last})
+        rows = list(page[:batch_size])
+        if not rows:
+            return
+        last = rows[-1][0]
+        yield from rows
+
+
+# 실시간 푸시 이벤트 (user_id, 종류, 데이터)
+def notification_event(notification):
+    return (notification.user_id, 'notification', {
+        'id': notification.id,
+        'lecture': notification.lecture_id,
+        'message': notification.message,
+        'created_at': notification.created_at,
+    })
+
+
+# Notification 을 청크 단위로 만들어 bulk_create
+# notifications 는 generator 여도 되며 전체를 메모리에 올리지 않는다
+# bulk_create 는 post_save 를 보내지 않으므로 읽지 않은 알림 카운터, 푸시, 동기화 변경 기록은 청크마다 직접 반영
+def bulk_create_notifications(notifications, batch_size=BATCH_SIZE):
+    created = 0
+    for chunk in chunked(notifications, batch_size):
+        with transaction.atomic():
+            Notification.objects.bulk_create(chunk, batch_size=batch_size)
+            counters.increment_many(counters.NOTIFICATIONS, Counter(n.user_id for n in chunk))
+            record_user_changes(Kind.NOTIFICATION, [(n.id, n.user_id) for n in chunk])
+            publish_to_users(notification_event(n) for n in chunk)
+        created += len(chunk)
+    return created
+
+
+# 강의 모집 시작 알림 (활성 강사 전체)
+def notify_recruitment_open(lecture_id):
+    lecture = Lecture.objects.filter(id=lecture_id).only('id', 'title').first()
+    if lecture is None:
+        return 0
+
+    message = f"'{lecture.title}' 강의의 강사 모집이 시작되었습니다."
+    instructors = iterate_by_key(User.objects.filter(role=User.Role.INSTRUCTOR, is_active=True), 'id')
+    return bulk_create_notifications(
+        Notification(user_id=user_id, lecture_id=lecture.id, message=message)
+        for user_id, in instructors
+    )
+
+
+# 배정 결과 알림 (배정 대상 강의의 지원자 전체)
+def notify_allocation_results(lecture_ids):
+    rows = iterate_by_key(
+        Application.objects.filter(
+            lecture_id__in=lecture_ids,
+            assignment_status__in=[
+                Application.AssignmentStatus.ASSIGNED,
+                Application.AssignmentStatus.REJECTED,
+            ],
+        ),
+        'id', 'user_id', 'lecture_id', 'lecture__title', 'assignment_status', 'assigned_role',
+    )
+    role_labels = dict(Application.LectureRole.choices)
+
+    def build():
+        for _, user_id, lecture_id, title, status, assigned_role in rows:
+            if status == Application.AssignmentStatus.ASSIGNED:
+                message = f"'{title}' 강의에 {role_labels[assigned_role]}(으)로 배정되었습니다."
+            else:
+                message = f"'{title}' 강의 배정이 완료되었으나 배정되지 않았습니다."
+            yield Notification(user_id=user_id, lecture_id=lecture_id, message=message)
+
+    return bulk_create_notifications(build())
+
+
+# 모집 마감 알림 (마감된 강의의 지원자 전체)
+def notify_recruitment_closed(lecture_ids):
+    rows = iterate_by_key(
+        Application.objects.filter(lecture_id__in=lecture_ids), 'id', 'user_id', 'lecture_id', 'lecture__title'
+    )
+    return bulk_create_notifications(
+        Notification(
+            user_id=user_id,
+            lecture_id=lecture_id,
+            message=f"'{title}' 강의의 강사 모집이 마감되어 배정을 진행합니다.",
+        )
+        for _, user_id, lecture_id, title in rows
+    )
+
+
+# 배정 완료 후 남아 있던 미배정 지원 정리 알림
+def notify_pending_settled(application_ids):
+    rows = iterate_by_key(
+        Application.objects.filter(id__in=application_ids), 'id', 'user_id', 'lecture_id', 'lecture__title'
+    )
+    return bulk_create_notifications(
+        Notification(
+            user_id=user_id,
+            lecture_id=lecture_id,
+            message=f"'{title}' 강의 배정이 완료되었으나 배정되지 않았습니다.",
+        )
+        for _, user_id, lecture_id, title in rows
+    )
+
+
+def enqueue_recruitment_open(lecture_id):
+    enqueue(notify_recruitment_open, lecture_id)
+
+
+def enqueue_allocation_results(lecture_ids):
+    if lecture_ids:
+        enqueue(notify_allocation_results, list(lecture_ids))
+
+
+def enqueue_recruitment_closed(lecture_ids):
+    if lecture_ids:
+        enqueue(notify_recruitment_closed, list(lecture_ids))
+
+
+def enqueue_pending_settled(application_ids):
+    if application_ids:
+        enqueue(notify_pending_settled, list(application_ids))
@@ -0,0 +1,32 @@
+from rest_framework.permissions import BasePermission, SAFE_METHODS
+
+from .models import User
+
+
+# 매니저 전용
+class IsManager(BasePermission):
+    message = '매니저만 접근할 수 있습니다.'
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and user.role == User.Role.MANAGER)
+
+
+# 강사 전용
+class IsInstructor(BasePermission):
+    message = '강사만 접근할 수 있습니다.'
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and user.role == User.Role.INSTRUCTOR)
+
+
+# 조회는 로그인 사용자 모두, 작성/수정/삭제는 매니저만
+class IsManagerOrReadOnly(BasePermission):
+    message = '매니저만 작성할 수 있습니다.'
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not (user and user.is_authenticated):
+            return False
+        return request.method in SAFE_METHODS or user.role == User.Role.MANAGER
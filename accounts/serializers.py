@@ -0,0 +1,79 @@
+from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from config.serializers import ValuesSerializer
+
+from .models import User, Notification
+
+
+def add_role_claims(token, user):
+    token['role'] = user.role
+    token['name'] = user.name
+    token['is_staff'] = user.is_staff
+    return token
+
+
+# 로그인 토큰 발급: 권한 검사에 필요한 역할/이름을 클레임으로 넣음
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        return add_role_claims(super().get_token(user), user)
+
+
+# 액세스 토큰 재발급: 리프레시 토큰의 클레임을 그대로 복사하지 않고 DB 의 현재 역할/이름으로 다시 채움
+# (기본 동작이면 역할 변경이 리프레시 토큰 만료까지 반영되지 않음)
+# 상위 클래스는 토큰과 사용자를 돌려주지 않으므로, 토큰 파싱과 사용자 조회를 한 번씩만 하도록 validate 를 다시 씀
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        try:
+            user = User.objects.get(**{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]})
+        except (KeyError, User.DoesNotExist):
+            user = None
+        # 삭제/비활성 사용자는 거부
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages['no_active_account'], 'no_active_account')
+
+        data = {'access': str(add_role_claims(refresh.access_token, user))}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION and hasattr(refresh, 'blacklist'):
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data['refresh'] = str(refresh)
+        return data
+
+
+class UserSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = [
+            'id',
+            'username',
+            'email',
+            'name',
+            'phone_number',
+            'role',
+            'profile_photo_url',
+            'bio',
+            'portfolio_content',
+        ]
+        read_only_fields = ['id', 'username', 'role']
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Notification
+        fields = ['id', 'lecture', 'message', 'is_read', 'created_at']
+        read_only_fields = fields
+
+
+# 알림 목록 (.values() 기반, NotificationSerializer 와 같은 응답)
+class NotificationValuesSerializer(ValuesSerializer):
+    class Meta:
+        model = Notification
+        fields = NotificationSerializer.Meta.fields
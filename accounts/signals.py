@@ -0,0 +1,15 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from communications.pubsub import publish_to_users
+from . import counters
+from .notifications import notification_event
+from .models import Notification
+
+
+# 단건 생성된 알림은 수신자 카운터 증가 및 푸시 (bulk_create 경로는 notifications.py 에서 직접 반영)
+@receiver(post_save, sender=Notification)
+def notification_saved(sender, instance, created, **kwargs):
+    if created and not instance.is_read:
+        counters.increment(counters.NOTIFICATIONS, [instance.user_id])
+        publish_to_users([notification_event(instance)])
@@ -1,3 +1,255 @@
-from django.test import TestCase
+import threading
+import time
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.db import connection, connections, transaction
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from communications.models import Message
+from communications.pubsub import user_channel
+from communications.services import send_message
+from lectures.models import Lecture
+from sync.models import ChangeLog
+from . import counters
+from .authentication import ClaimsJWTAuthentication, ClaimsUser
+from .models import Notification, UnreadCounter, User
+from .notifications import bulk_create_notifications, iterate_by_key, notify_recruitment_open
+
+
+def create_user(username, role=User.Role.INSTRUCTOR):
+    return User.objects.create_user(
+        username=username, email=f'{username}@example.com', password='password', name=username, role=role
+    )
+
+
+# 역할 클레임이 든 토큰은 DB 조회 없이, 클레임이 없는 이전 토큰은 DB 에서 사용자 조회
+class ClaimsJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        self.user = create_user('instructor')
+        self.client = APIClient()
+
+    def login(self, username='instructor'):
+        return self.login_pair(username)['access']
+
+    def login_pair(self, username='instructor'):
+        response = self.client.post('/api/accounts/token/', {'username': username, 'password': 'password'})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def authenticate(self, token):
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        return ClaimsJWTAuthentication().authenticate(request)
+
+    def test_claims_token_authenticates_without_query(self):
+        token = self.login()
+
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate(token)
+            self.assertIsInstance(user, ClaimsUser)
+            self.assertEqual((user.id, user.role, user.name), (self.user.id, User.Role.INSTRUCTOR, 'instructor'))
+            self.assertEqual(user, self.user)
+        # 클레임에 없는 속성은 한 번만 조회
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, 'instructor@example.com')
+            self.assertEqual(user.username, 'instructor')
+
+    # 클레임 토큰은 만료(ACCESS_TOKEN_LIFETIME) 전까지 역할 변경/비활성화가 반영되지 않고, 다시 발급받을 때 반영됨
+    def test_claims_token_keeps_role_until_reissued(self):
+        token = self.login()
+        User.objects.filter(id=self.user.id).update(role=User.Role.MANAGER, is_active=False)
+
+        user, _ = self.authenticate(token)
+        self.assertEqual((user.role, user.is_active), (User.Role.INSTRUCTOR, True))
+        self.assertEqual(self.client.post(
+            '/api/accounts/token/', {'username': 'instructor', 'password': 'password'}
+        ).status_code, 401)
+
+    def test_refresh_reissues_claims_from_database(self):
+        refresh = self.login_pair()['refresh']
+        User.objects.filter(id=self.user.id).update(role=User.Role.MANAGER, name='매니저')
+
+        # 토큰 파싱/사용자 조회는 한 번씩
+        with self.assertNumQueries(1):
+            response = self.client.post('/api/accounts/token/refresh/', {'refresh': refresh})
+        self.assertEqual(response.status_code, 200)
+        user, _ = self.authenticate(response.json()['access'])
+        self.assertEqual((user.role, user.name), (User.Role.MANAGER, '매니저'))
+
+        User.objects.filter(id=self.user.id).update(is_active=False)
+        self.assertEqual(self.client.post('/api/accounts/token/refresh/', {'refresh': refresh}).status_code, 401)
+
+    def test_deleted_user_is_rejected(self):
+        pair = self.login_pair()
+        self.user.delete()
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {pair["access"]}')
+        self.assertEqual(self.client.get('/api/accounts/me/').status_code, 401)
+        self.client.credentials()
+        self.assertEqual(self.client.post('/api/accounts/token/refresh/', {'refresh': pair['refresh']}).status_code, 401)
+
+    def test_token_without_claims_falls_back_to_database(self):
+        token = str(AccessToken.for_user(self.user))
+        User.objects.filter(id=self.user.id).update(role=User.Role.MANAGER)
+
+        with self.assertNumQueries(1):
+            user, _ = self.authenticate(token)
+        self.assertIsInstance(user, User)
+        self.assertEqual(user.role, User.Role.MANAGER)
+
+        User.objects.filter(id=self.user.id).update(is_active=False)
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(token)
+
+    def test_api_uses_role_from_claims(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.login()}')
+        self.assertEqual(self.client.get('/api/lectures/calendar/').status_code, 200)
+        self.assertEqual(self.client.get('/api/lectures/applications/export/').status_code, 403)
+
+        manager = create_user('manager', role=User.Role.MANAGER)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(manager)}')
+        self.assertEqual(self.client.get('/api/lectures/calendar/').status_code, 403)
+
+
+# 읽지 않은 알림/메시지 카운터
+class UnreadCounterTests(TestCase):
+    def setUp(self):
+        self.users = [create_user(f'user{i}') for i in range(5)]
+        self.user = self.users[0]
+
+    def counts(self, user):
+        counter = UnreadCounter.objects.get(user=user)
+        return counter.notifications, counter.messages
+
+    def test_increment_and_decrement(self):
+        counters.increment(counters.NOTIFICATIONS, [self.user.id, self.users[1].id])
+        counters.increment_many(counters.MESSAGES, {self.user.id: 3, self.users[1].id: 1})
+        counters.decrement(counters.MESSAGES, self.user.id)
+        # 0 아래로는 내려가지 않음
+        counters.decrement(counters.MESSAGES, self.users[1].id, 5)
+
+        self.assertEqual(self.counts(self.user), (1, 2))
+        self.assertEqual(self.counts(self.users[1]), (1, 0))
+
+    def test_signals_and_read_views_keep_counter(self):
+        notifications = [Notification.objects.create(user=self.user, message=f'알림{i}') for i in range(3)]
+        send_message(self.users[1].id, self.user.id, '안녕하세요')
+        self.assertEqual(self.counts(self.user), (3, 1))
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        client.post(f'/api/accounts/notifications/{notifications[0].id}/read/')
+        self.assertEqual(client.get('/api/accounts/unread-counts/').json(), {'notifications': 2, 'messages': 1})
+        client.post('/api/accounts/notifications/read-all/')
+        self.assertEqual(self.counts(self.user), (0, 1))
+
+    def test_get_counts_creates_missing_counter_from_real_counts(self):
+        Notification.objects.bulk_create([Notification(user=self.user, message='알림') for _ in range(2)])
+
+        self.assertEqual(counters.get_counts(self.user.id), {'notifications': 2, 'messages': 0})
+        self.assertEqual(self.counts(self.user), (2, 0))
+
+    def test_reconcile_fixes_drifted_and_missing_counters_in_batches(self):
+        # 시그널 없이 넣은 알림/메시지 (카운터 없음)와 틀어진 카운터
+        Notification.objects.bulk_create([Notification(user=user, message='알림') for user in self.users[:3]])
+        Message.objects.bulk_create([Message(sender=self.user, recipient=self.users[4], content='안녕하세요')])
+        UnreadCounter.objects.create(user=self.users[3], notifications=7, messages=2)
+        UnreadCounter.objects.create(user=self.users[2], notifications=1)
+
+        # 사용자 5명을 2명씩 나눠 처리, 배치마다 트랜잭션 하나 (SAVEPOINT 로 보임)
+        with CaptureQueriesContext(connection) as queries:
+            fixed = counters.reconcile(batch_size=2)
+
+        self.assertEqual(fixed, 4)
+        self.assertEqual(
+            [self.counts(user) for user in self.users],
+            [(1, 0), (1, 0), (1, 0), (0, 0), (0, 1)],
+        )
+        self.assertEqual(sum(query['sql'].startswith('SAVEPOINT') for query in queries.captured_queries), 3)
+        self.assertEqual(counters.reconcile(batch_size=2), 0)
+
+
+# reconcile 이 카운터를 잠그고 세는 동안 들어온 알림은 잠금을 기다렸다가 보정된 값 위에 더해져야 함
+@skipUnless(connection.vendor == 'postgresql', 'PostgreSQL 전용 동시성 테스트')
+class UnreadCounterConcurrencyTests(TransactionTestCase):
+    def test_reconcile_does_not_lose_concurrent_increment(self):
+        user = create_user('instructor')
+        Notification.objects.create(user=user, message='알림')
+        counted = threading.Event()
+        original = counters._count_notifications
+
+        def slow_count(user_ids):
+            result = original(user_ids)
+            counted.set()
+            time.sleep(0.5)
+            return result
+
+        def notify():
+            counted.wait()
+            try:
+                with transaction.atomic():
+                    Notification.objects.create(user=user, message='알림')
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=notify)
+        thread.start()
+        with mock.patch.object(counters, '_count_notifications', side_effect=slow_count):
+            counters.reconcile()
+        thread.join()
+
+        self.assertEqual(UnreadCounter.objects.get(user=user).notifications, 2)
+
+
+# 알림 일괄 생성: 청크마다 트랜잭션 하나로 카운터, 변경 기록, 푸시까지 반영
+class BulkNotificationTests(TestCase):
+    def setUp(self):
+        self.users = [create_user(f'user{i}') for i in range(2)]
+
+    def test_chunks_update_counters_change_log_and_publish(self):
+        backend = mock.Mock()
+        notifications = (Notification(user=self.users[i % 2], message=f'알림{i}') for i in range(5))
+
+        with mock.patch('communications.pubsub.get_backend', return_value=backend):
+            with self.captureOnCommitCallbacks(execute=True):
+                with CaptureQueriesContext(connection) as queries:
+                    created = bulk_create_notifications(notifications, batch_size=2)
+
+        self.assertEqual(created, 5)
+        self.assertEqual(sum(query['sql'].startswith('SAVEPOINT') for query in queries.captured_queries), 3)
+        self.assertEqual([UnreadCounter.objects.get(user=user).notifications for user in self.users], [3, 2])
+        self.assertEqual(
+            sorted(ChangeLog.objects.filter(kind=ChangeLog.Kind.NOTIFICATION).values_list('object_id', 'user_id')),
+            sorted(Notification.objects.values_list('id', 'user_id')),
+        )
+        # 청크마다 커밋 후 한 번씩 발행
+        self.assertEqual(backend.publish_many.call_count, 3)
+        published = [event for call in backend.publish_many.call_args_list for event in call.args[0]]
+        self.assertEqual(
+            sorted(event['data']['id'] for _, event in published),
+            sorted(Notification.objects.values_list('id', flat=True)),
+        )
+        self.assertEqual(published[0][0], user_channel(self.users[0].id))
+
+    def test_iterate_by_key_pages_without_server_side_cursor(self):
+        users = self.users + [create_user(f'user{i}') for i in range(2, 5)]
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(iterate_by_key(User.objects.all(), 'id', 'username', batch_size=2))
+
+        self.assertEqual(rows, [(user.id, user.username) for user in users])
+        # 2 + 2 + 1 행, 그리고 빈 페이지 확인
+        self.assertEqual(len(queries.captured_queries), 4)
+
+    def test_notify_recruitment_open_reaches_active_instructors(self):
+        create_user('manager', role=User.Role.MANAGER)
+        User.objects.filter(id=self.users[1].id).update(is_active=False)
+        lecture = Lecture.objects.create(title='로봇 캠프')
+
+        self.assertEqual(notify_recruitment_open(lecture.id), 1)
+        notification = Notification.objects.get()
+        self.assertEqual((notification.user_id, notification.lecture_id), (self.users[0].id, lecture.id))
+        self.assertIn('로봇 캠프', notification.message)
@@ -0,0 +1,14 @@
+from django.urls import path
+from rest_framework_simplejwt.views import TokenRefreshView
+
+from . import views
+
+urlpatterns = [
+    path('token/', views.RoleTokenObtainPairView.as_view(), name='token-obtain'),
+    path('token/refresh/', TokenRefreshView.as_view(), name='token-refresh'),
+    path('me/', views.MeView.as_view(), name='me'),
+    path('unread-counts/', views.UnreadCountView.as_view(), name='unread-counts'),
+    path('notifications/', views.AsyncNotificationListView.as_view(), name='notification-list'),
+    path('notifications/read-all/', views.NotificationReadAllView.as_view(), name='notification-read-all'),
+    path('notifications/<int:pk>/read/', views.NotificationReadView.as_view(), name='notification-read'),
+]
@@ -1,3 +1,103 @@
-from django.shortcuts import render
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import generics, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.views import TokenObtainPairView
 
-# Create your views here.
+from config.async_views import AsyncAPIView
+from config.routers import ReplicaReadMixin
+from config.serializers import ValuesListMixin
+from sync.changes import Kind, record_user_changes
+from . import counters
+from .models import Notification
+from .pagination import NotificationCursorPagination
+from .serializers import NotificationValuesSerializer, RoleTokenObtainPairSerializer, UserSerializer
+
+
+# 로그인 (액세스/리프레시 토큰 발급)
+# POST /api/accounts/token/
+class RoleTokenObtainPairView(TokenObtainPairView):
+    serializer_class = RoleTokenObtainPairSerializer
+
+
+# 내 정보
+# GET, PATCH /api/accounts/me/
+# 프로필 전체가 필요하므로 이 뷰에서만 User 행을 불러옴
+class MeView(APIView):
+    def get_object(self):
+        user = self.request.user
+        return user.get_instance() if hasattr(user, 'get_instance') else user
+
+    def get(self, request):
+        return Response(UserSerializer(self.get_object()).data)
+
+    def patch(self, request):
+        serializer = UserSerializer(self.get_object(), data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+
+# 헤더 배지용 읽지 않은 알림/메시지 수
+# GET /api/accounts/unread-counts/
+class UnreadCountView(APIView):
+    def get(self, request):
+        return Response(counters.get_counts(request.user.id))
+
+
+# 내 알림 목록
+# GET /api/accounts/notifications/?is_read=
+class NotificationListView(ValuesListMixin, ReplicaReadMixin, generics.ListAPIView):
+    serializer_class = NotificationValuesSerializer
+    pagination_class = NotificationCursorPagination
+
+    def get_queryset(self):
+        queryset = Notification.objects.filter(user_id=self.request.user.id)
+        is_read = self.request.query_params.get('is_read')
+        if is_read in ('true', 'false'):
+            queryset = queryset.filter(is_read=is_read == 'true')
+        return queryset
+
+
+# 내 알림 목록 (비동기)
+class AsyncNotificationListView(AsyncAPIView):
+    sync_view = NotificationListView
+    replica_reads = True
+
+    async def get(self, request, *args, **kwargs):
+        return await self.alist(request, **kwargs)
+
+
+# 알림 읽음 처리
+# POST /api/accounts/notifications/<id>/read/
+class NotificationReadView(APIView):
+    def post(self, request, pk):
+        with transaction.atomic():
+            updated = Notification.objects.filter(
+                id=pk, user_id=request.user.id, is_read=False
+            ).update(is_read=True, updated_at=timezone.now())
+            counters.decrement(counters.NOTIFICATIONS, request.user.id, updated)
+            if updated:
+                record_user_changes(Kind.NOTIFICATION, [(pk, request.user.id)])
+
+        if not updated and not Notification.objects.filter(id=pk, user_id=request.user.id).exists():
+            return Response({'detail': '알림을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# 알림 모두 읽음 처리
+# POST /api/accounts/notifications/read-all/
+class NotificationReadAllView(APIView):
+    def post(self, request):
+        with transaction.atomic():
+            # 동기화 변경 기록을 남기기 위해 읽음 처리할 ID 를 먼저 읽음
+            ids = list(
+                Notification.objects.filter(user_id=request.user.id, is_read=False).values_list('id', flat=True)
+            )
+            updated = Notification.objects.filter(
+                id__in=ids, is_read=False
+            ).update(is_read=True, updated_at=timezone.now())
+            counters.decrement(counters.NOTIFICATIONS, request.user.id, updated)
+            record_user_changes(Kind.NOTIFICATION, [(notification_id, request.user.id) for notification_id in ids])
+        return Response({'updated': updated})
@@ -0,0 +1,12 @@
+from config.cache import bump_versions
+
+ANNOUNCEMENT_LIST = 'announcements'
+
+
+def announcement_namespace(announcement_id):
+    return f'announcement:{announcement_id}'
+
+
+# 공지사항 상세/목록 응답 캐시 무효화
+def invalidate_announcements(announcement_ids):
+    bump_versions([ANNOUNCEMENT_LIST, *(announcement_namespace(announcement_id) for announcement_id in announcement_ids)])
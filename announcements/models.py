@@ -19,11 +19,14 @@ class Announcement(models.Model):
     content = models.TextField('공지사항 내용')
 
     created_at = models.DateTimeField('작성일', auto_now_add=True)
+    updated_at = models.DateTimeField('수정일', auto_now=True)
 
     class Meta:
         ordering = ['-created_at']  # 최신 순
         indexes = [
             models.Index(fields=['author']),
+            # 목록 커서 페이지네이션 (created_at, id) 순서
+            models.Index(fields=['-created_at', '-id']),
         ]
 
     def __str__(self):
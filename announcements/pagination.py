@@ -0,0 +1,9 @@
+from config.pagination import AsyncCursorPagination
+
+
+# 공지사항 목록 커서 페이지네이션
+class AnnouncementCursorPagination(AsyncCursorPagination):
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from .models import Announcement
+
+
+class AnnouncementSerializer(serializers.ModelSerializer):
+    author_name = serializers.CharField(source='author.name', read_only=True, default=None)
+
+    class Meta:
+        model = Announcement
+        fields = ['id', 'author', 'author_name', 'title', 'content', 'created_at']
+        read_only_fields = ['author', 'created_at']
@@ -0,0 +1,13 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .caching import invalidate_announcements
+from .models import Announcement
+
+
+# 공지사항이 바뀌면 응답 캐시 무효화 (커밋 후)
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+def invalidate_announcement_cache(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_announcements([instance.id]))
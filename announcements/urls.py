@@ -0,0 +1,8 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('', views.AsyncAnnouncementListView.as_view(), name='announcement-list'),
+    path('<int:pk>/', views.AsyncAnnouncementDetailView.as_view(), name='announcement-detail'),
+]
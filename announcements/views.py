@@ -1,3 +1,77 @@
-from django.shortcuts import render
+from rest_framework import generics
+from rest_framework.response import Response
 
-# Create your views here.
+from accounts.permissions import IsManagerOrReadOnly
+from config.async_views import AsyncAPIView
+from config.cache import acached, cached
+from config.routers import ReplicaReadMixin
+from .caching import ANNOUNCEMENT_LIST, announcement_namespace
+from .models import Announcement
+from .pagination import AnnouncementCursorPagination
+from .serializers import AnnouncementSerializer
+
+
+# 공지사항 목록 / 작성 (매니저)
+# GET, POST /api/announcements/
+class AnnouncementListCreateView(ReplicaReadMixin, generics.ListCreateAPIView):
+    serializer_class = AnnouncementSerializer
+    pagination_class = AnnouncementCursorPagination
+    permission_classes = [IsManagerOrReadOnly]
+    queryset = Announcement.objects.select_related('author')
+
+    def list(self, request, *args, **kwargs):
+        data = cached(
+            'announcement-list',
+            [ANNOUNCEMENT_LIST],
+            request.get_full_path(),
+            lambda: super(AnnouncementListCreateView, self).list(request, *args, **kwargs).data,
+        )
+        return Response(data)
+
+    def perform_create(self, serializer):
+        serializer.save(author_id=self.request.user.id)
+
+
+# 공지사항 상세 / 수정, 삭제 (매니저)
+# GET, PUT, PATCH, DELETE /api/announcements/<id>/
+class AnnouncementDetailView(generics.RetrieveUpdateDestroyAPIView):
+    serializer_class = AnnouncementSerializer
+    permission_classes = [IsManagerOrReadOnly]
+    queryset = Announcement.objects.select_related('author')
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = self.kwargs['pk']
+        data = cached(
+            'announcement-detail',
+            [announcement_namespace(pk)],
+            pk,
+            lambda: super(AnnouncementDetailView, self).retrieve(request, *args, **kwargs).data,
+        )
+        return Response(data)
+
+
+# 공지사항 목록 / 상세 조회 (비동기). 작성/수정/삭제는 sync_view 로 처리
+class AsyncAnnouncementListView(AsyncAPIView):
+    sync_view = AnnouncementListCreateView
+    replica_reads = True
+
+    async def get(self, request, *args, **kwargs):
+        return await acached(
+            'announcement-list',
+            [ANNOUNCEMENT_LIST],
+            request.get_full_path(),
+            lambda: self.alist(request, **kwargs),
+        )
+
+
+class AsyncAnnouncementDetailView(AsyncAPIView):
+    sync_view = AnnouncementDetailView
+
+    async def get(self, request, *args, **kwargs):
+        pk = kwargs['pk']
+        return await acached(
+            'announcement-detail',
+            [announcement_namespace(pk)],
+            pk,
+            lambda: self.aretrieve(request, **kwargs),
+        )
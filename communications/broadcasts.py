@@ -0,0 +1,170 @@
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery
+from django.utils import timezone
+
+from accounts import counters
+from accounts.models import User, Notification
+from accounts.notifications import BATCH_SIZE, bulk_create_notifications
+from config.tasks import enqueue
+from lectures.models import Application
+from .models import Broadcast, Message, Conversation
+from .pubsub import publish_to_users
+
+NOTIFICATION_PREVIEW_LENGTH = 50
+
+
+# 수신자 id (id 순서, 발신자 제외)
+def recipient_ids(broadcast):
+    if broadcast.audience == Broadcast.Audience.LECTURE:
+        queryset = (
+            Application.objects
+            .filter(
+                lecture_id=broadcast.lecture_id,
+                assignment_status=Application.AssignmentStatus.ASSIGNED,
+                user__is_active=True,
+            )
+            .values_list('user_id', flat=True)
+            .order_by('user_id')
+            .distinct()
+        )
+        return queryset.exclude(user_id=broadcast.sender_id) if broadcast.sender_id else queryset
+    queryset = (
+        User.objects
+        .filter(role=User.Role.INSTRUCTOR, is_active=True)
+        .values_list('id', flat=True)
+        .order_by('id')
+    )
+    return queryset.exclude(id=broadcast.sender_id) if broadcast.sender_id else queryset
+
+
+def _after(queryset, broadcast):
+    field = 'user_id' if broadcast.audience == Broadcast.Audience.LECTURE else 'id'
+    return queryset.filter(**{f'{field}__gt': broadcast.last_recipient_id})
+
+
+# 단체 메시지 생성 후 커밋되면 작업 큐에서 발송
+# lecture_id 를 주면 해당 강의에 배정된 강사, 없으면 활성 강사 전체
+def create_broadcast(sender_id, content, lecture_id=None):
+    broadcast = Broadcast(
+        sender_id=sender_id,
+        content=content,
+        lecture_id=lecture_id,
+        audience=Broadcast.Audience.LECTURE if lecture_id else Broadcast.Audience.INSTRUCTORS,
+    )
+    with transaction.atomic():
+        broadcast.total_count = recipient_ids(broadcast).count()
+        broadcast.save()
+        enqueue(deliver_broadcast, broadcast.id)
+    return broadcast
+
+
+# 수신자 batch_size 명씩 발송 (청크마다 트랜잭션 하나)
+# 발송 위치(last_recipient_id)를 청크와 함께 커밋하므로 중간에 실패해도 다시 호출하면 이어서 발송하고,
+# 단체 메시지 행을 잠그고 진행하므로 같은 단체 메시지를 동시에 발송해도 수신자가 중복되지 않음
+def deliver_broadcast(broadcast_id, batch_size=BATCH_SIZE):
+    try:
+        while _deliver_chunk(broadcast_id, batch_size):
+            pass
+    except Exception:
+        Broadcast.objects.filter(id=broadcast_id).exclude(status=Broadcast.Status.COMPLETED).update(
+            status=Broadcast.Status.FAILED
+        )
+        raise
+
+
+def _deliver_chunk(broadcast_id, batch_size):
+    with transaction.atomic():
+        broadcast = Broadcast.objects.select_for_update().filter(id=broadcast_id).first()
+        if broadcast is None or broadcast.status == Broadcast.Status.COMPLETED:
+            return False
+
+        user_ids = list(_after(recipient_ids(broadcast), broadcast)[:batch_size])
+        if not user_ids:
+            broadcast.status = Broadcast.Status.COMPLETED
+            broadcast.total_count = broadcast.sent_count
+            broadcast.completed_at = timezone.now()
+            broadcast.save(update_fields=['status', 'total_count', 'completed_at'])
+            return False
+
+        messages = Message.objects.bulk_create(
+            [
+                Message(sender_id=broadcast.sender_id, recipient_id=user_id, broadcast=broadcast)
+                for user_id in user_ids
+            ],
+            batch_size=batch_size,
+        )
+        # bulk_create 는 post_save 를 보내지 않으므로 카운터, 대화 요약, 알림, 푸시를 청크마다 직접 반영
+        counters.increment(counters.MESSAGES, user_ids)
+        _update_conversations(broadcast, messages)
+        _notify(broadcast, user_ids)
+        publish_to_users(
+            (message.recipient_id, 'message', {
+                'id': message.id,
+                'sender': message.sender_id,
+                'content': broadcast.content,
+                'sent_at': message.sent_at,
+            })
+            for message in messages
+        )
+
+        broadcast.sent_count += len(messages)
+        broadcast.total_count = max(broadcast.total_count, broadcast.sent_count)
+        broadcast.last_recipient_id = user_ids[-1]
+        broadcast.status = Broadcast.Status.SENDING
+        broadcast.save(update_fields=['sent_count', 'total_count', 'last_recipient_id', 'status'])
+    return True
+
+
+# 청크의 대화 요약 갱신 (수신자 수와 관계없이 조회/UPDATE 몇 번, 없는 대화는 bulk_create)
+def _update_conversations(broadcast, messages):
+    sender_id = broadcast.sender_id
+    if sender_id is None:
+        return
+    user_ids = [message.recipient_id for message in messages]
+    values = {
+        'last_message_preview': broadcast.content[:Conversation.PREVIEW_LENGTH],
+        'last_sent_at': max(message.sent_at for message in messages),
+    }
+
+    def message_of(column):
+        return Subquery(
+            Message.objects.filter(broadcast_id=broadcast.id, recipient_id=OuterRef(column)).values('id')[:1]
+        )
+
+    # 수신자 → 발신자 (읽지 않은 수 +1)
+    inbound = Conversation.objects.filter(owner_id__in=user_ids, counterpart_id=sender_id)
+    existing = set(inbound.values_list('owner_id', flat=True))
+    inbound.update(last_message_id=message_of('owner_id'), unread_count=F('unread_count') + 1, **values)
+
+    # 발신자 → 수신자
+    outbound = Conversation.objects.filter(owner_id=sender_id, counterpart_id__in=user_ids)
+    existing_outbound = set(outbound.values_list('counterpart_id', flat=True))
+    outbound.update(last_message_id=message_of('counterpart_id'), **values)
+
+    Conversation.objects.bulk_create(
+        [
+            Conversation(
+                owner_id=message.recipient_id,
+                counterpart_id=sender_id,
+                last_message_id=message.id,
+                unread_count=1,
+                **values,
+            )
+            for message in messages if message.recipient_id not in existing
+        ] + [
+            Conversation(owner_id=sender_id, counterpart_id=message.recipient_id, last_message_id=message.id, **values)
+            for message in messages if message.recipient_id not in existing_outbound
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def _notify(broadcast, user_ids):
+    sender_name = User.objects.filter(id=broadcast.sender_id).values_list('name', flat=True).first() or '매니저'
+    preview = broadcast.content[:NOTIFICATION_PREVIEW_LENGTH]
+    message = f"{sender_name}님의 단체 메시지: {preview}"
+    bulk_create_notifications(
+        Notification(user_id=user_id, lecture_id=broadcast.lecture_id, message=message)
+        for user_id in user_ids
+    )
+
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from communications.broadcasts import deliver_broadcast
+from communications.models import Broadcast
+
+
+# 끝나지 않은 단체 메시지 이어서 발송 (배포/재시작 후, 실패한 발송 재시도)
+# 발송 위치가 청크마다 저장되어 있어 이미 받은 수신자에게는 다시 보내지 않음
+class Command(BaseCommand):
+    help = '완료되지 않은 단체 메시지를 이어서 발송합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        broadcast_ids = list(
+            Broadcast.objects
+            .exclude(status=Broadcast.Status.COMPLETED)
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+        for broadcast_id in broadcast_ids:
+            deliver_broadcast(broadcast_id, batch_size=options['batch_size'])
+            self.stdout.write(f'단체 메시지 {broadcast_id} 발송 완료')
+        self.stdout.write(f'단체 메시지 {len(broadcast_ids)}건 처리')
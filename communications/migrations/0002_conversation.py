@@ -0,0 +1,113 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+# 기존 메시지 이력으로 대화 요약 생성
+# 대화 소유자를 id 순으로 BATCH_SIZE 명씩 나눠, 해당 소유자의 요약만 메모리에 두고 저장
+def backfill_conversations(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    last_id = 0
+    while True:
+        owner_ids = list(
+            User.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:BATCH_SIZE]
+        )
+        if not owner_ids:
+            return
+        last_id = owner_ids[-1]
+        backfill_owners(apps, owner_ids[0], last_id)
+
+
+def backfill_owners(apps, first_id, last_id):
+    Message = apps.get_model('communications', 'Message')
+    Conversation = apps.get_model('communications', 'Conversation')
+
+    summaries = {}
+    messages = (
+        Message.objects
+        .filter(
+            models.Q(sender_id__gte=first_id, sender_id__lte=last_id)
+            | models.Q(recipient_id__gte=first_id, recipient_id__lte=last_id),
+            sender__isnull=False,
+            recipient__isnull=False,
+        )
+        .order_by('sent_at', 'id')
+        .values_list('id', 'sender_id', 'recipient_id', 'content', 'sent_at', 'read_at')
+        .iterator(chunk_size=2000)
+    )
+    for message_id, sender_id, recipient_id, content, sent_at, read_at in messages:
+        for owner_id, counterpart_id, unread in (
+            (sender_id, recipient_id, 0),
+            (recipient_id, sender_id, 1 if read_at is None else 0),
+        ):
+            if not first_id <= owner_id <= last_id:
+                continue
+            summary = summaries.setdefault((owner_id, counterpart_id), {'unread_count': 0})
+            summary['last_message_id'] = message_id
+            summary['last_message_preview'] = content[:100]
+            summary['last_sent_at'] = sent_at
+            summary['unread_count'] += unread
+
+    Conversation.objects.bulk_create(
+        [
+            Conversation(owner_id=owner_id, counterpart_id=counterpart_id, **summary)
+            for (owner_id, counterpart_id), summary in summaries.items()
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communications', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_message_preview', models.CharField(blank=True, max_length=100, verbose_name='마지막 메시지 미리보기')),
+                ('last_sent_at', models.DateTimeField(verbose_name='마지막 메시지 시각')),
+                ('unread_count', models.IntegerField(default=0, verbose_name='읽지 않은 메시지 수')),
+            ],
+            options={
+                'ordering': ['-last_sent_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['sender', 'recipient', '-sent_at', '-id'], name='communicati_sender__1d9045_idx'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='counterpart',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='대화 상대'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='communications.message', verbose_name='마지막 메시지'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='owner',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='conversations', to=settings.AUTH_USER_MODEL, verbose_name='대화 소유자'),
+        ),
+        migrations.AddIndex(
+            model_name='conversation',
+            index=models.Index(fields=['owner', '-last_sent_at', '-id'], name='communicati_owner_i_a7ee38_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='conversation',
+            constraint=models.UniqueConstraint(fields=('owner', 'counterpart'), name='unique_conversation_pair'),
+        ),
+        migrations.RunPython(backfill_conversations, migrations.RunPython.noop),
+    ]
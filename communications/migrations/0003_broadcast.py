@@ -0,0 +1,58 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communications', '0002_conversation'),
+        ('lectures', '0011_lecture_status_start_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='message',
+            name='content',
+            field=models.TextField(blank=True, verbose_name='메시지 내용'),
+        ),
+        migrations.CreateModel(
+            name='Broadcast',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('audience', models.CharField(choices=[('lecture', '강의 배정 강사'), ('instructors', '전체 강사')], max_length=20, verbose_name='수신 대상')),
+                ('content', models.TextField(verbose_name='메시지 내용')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('sending', '발송중'), ('completed', '완료'), ('failed', '실패')], default='pending', max_length=20, verbose_name='발송 상태')),
+                ('total_count', models.IntegerField(default=0, verbose_name='수신자 수')),
+                ('sent_count', models.IntegerField(default=0, verbose_name='발송 수')),
+                ('last_recipient_id', models.BigIntegerField(default=0, verbose_name='마지막 수신자 ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성 시각')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='완료 시각')),
+                ('lecture', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='broadcasts', to='lectures.lecture', verbose_name='대상 강의')),
+                ('sender', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='broadcasts', to=settings.AUTH_USER_MODEL, verbose_name='발신자')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='broadcast',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='messages', to='communications.broadcast', verbose_name='단체 메시지'),
+        ),
+        migrations.AddConstraint(
+            model_name='message',
+            constraint=models.UniqueConstraint(condition=models.Q(('broadcast__isnull', False)), fields=('broadcast', 'recipient'), name='unique_broadcast_recipient'),
+        ),
+        migrations.AddIndex(
+            model_name='broadcast',
+            index=models.Index(fields=['sender', '-created_at', '-id'], name='communicati_sender__d18a16_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='broadcast',
+            index=models.Index(fields=['status'], name='communicati_status_c84d35_idx'),
+        ),
+    ]
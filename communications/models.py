@@ -2,6 +2,64 @@ from django.db import models
 from django.conf import settings
 
 
+# Broadcast
+# 매니저가 여러 강사에게 한 번에 보내는 메시지 (본문은 여기에만 저장)
+# 수신자별 Message 행은 broadcasts.deliver_broadcast 가 작업 큐에서 청크 단위로 생성
+class Broadcast(models.Model):
+    # 수신 대상
+    class Audience(models.TextChoices):
+        LECTURE = 'lecture', '강의 배정 강사'
+        INSTRUCTORS = 'instructors', '전체 강사'
+
+    # 발송 상태
+    class Status(models.TextChoices):
+        PENDING = 'pending', '대기'
+        SENDING = 'sending', '발송중'
+        COMPLETED = 'completed', '완료'
+        FAILED = 'failed', '실패'
+
+    sender = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name='broadcasts',
+        verbose_name='발신자',
+        null=True
+    )
+
+    audience = models.CharField('수신 대상', max_length=20, choices=Audience.choices)
+
+    lecture = models.ForeignKey(
+        'lectures.Lecture',
+        on_delete=models.SET_NULL,
+        related_name='broadcasts',
+        verbose_name='대상 강의',
+        blank=True,
+        null=True
+    )
+
+    content = models.TextField('메시지 내용')
+
+    status = models.CharField('발송 상태', max_length=20, choices=Status.choices, default=Status.PENDING)
+    total_count = models.IntegerField('수신자 수', default=0)
+    sent_count = models.IntegerField('발송 수', default=0)
+
+    # 발송을 이어서 할 위치 (수신자 id 순서로 이 id 까지 발송됨, 청크와 같은 트랜잭션에서 갱신)
+    last_recipient_id = models.BigIntegerField('마지막 수신자 ID', default=0)
+
+    created_at = models.DateTimeField('생성 시각', auto_now_add=True)
+    completed_at = models.DateTimeField('완료 시각', blank=True, null=True)
+
+    class Meta:
+        ordering = ['-created_at']  # 최신 순
+        indexes = [
+            models.Index(fields=['sender', '-created_at', '-id']),
+            models.Index(fields=['status']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_audience_display()} ({self.content[:20]}...)"
+
+
 #  Message
 class Message(models.Model):
     # 발신자
@@ -22,7 +80,17 @@ class Message(models.Model):
         null=True
     )
 
-    content = models.TextField('메시지 내용')
+    # 단체 메시지의 수신자 행이면 본문은 broadcast.content (content 는 빈 문자열)
+    broadcast = models.ForeignKey(
+        Broadcast,
+        on_delete=models.CASCADE,
+        related_name='messages',
+        verbose_name='단체 메시지',
+        blank=True,
+        null=True
+    )
+
+    content = models.TextField('메시지 내용', blank=True)
 
     sent_at = models.DateTimeField('발송 시각', auto_now_add=True)
 
@@ -30,13 +98,74 @@ class Message(models.Model):
 
     class Meta:
         ordering = ['-sent_at']  # 최신 순
+        constraints = [
+            # 같은 단체 메시지를 한 사람에게 두 번 보내지 않음
+            models.UniqueConstraint(
+                fields=['broadcast', 'recipient'],
+                condition=models.Q(broadcast__isnull=False),
+                name='unique_broadcast_recipient',
+            ),
+        ]
         indexes = [
             models.Index(fields=['sender']),
             models.Index(fields=['recipient']),
             models.Index(fields=['sender', 'recipient']),
+            # 대화별 메시지 목록 커서 페이지네이션
+            models.Index(fields=['sender', 'recipient', '-sent_at', '-id']),
         ]
 
     def __str__(self):
         sender_name = self.sender.name if self.sender else '알 수 없음'
         recipient_name = self.recipient.name if self.recipient else '알 수 없음'
-        return f"{sender_name} -> {recipient_name} ({self.content[:20]}...)"
\ No newline at end of file
+        return f"{sender_name} -> {recipient_name} ({self.text[:20]}...)"
+
+    # 본문 (단체 메시지는 Broadcast 에 한 번만 저장됨, 목록은 select_related('broadcast') 로 조회)
+    @property
+    def text(self):
+        return self.broadcast.content if self.broadcast_id else self.content
+
+
+# Conversation
+# 받은편지함용 대화 요약 (사용자 한 명 기준으로 상대방마다 한 행)
+# 메시지 생성/읽음 처리와 같은 트랜잭션에서 갱신됨
+class Conversation(models.Model):
+    PREVIEW_LENGTH = 100
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='conversations',
+        verbose_name='대화 소유자'
+    )
+
+    counterpart = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='대화 상대'
+    )
+
+    last_message = models.ForeignKey(
+        Message,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        verbose_name='마지막 메시지',
+        blank=True,
+        null=True
+    )
+
+    last_message_preview = models.CharField('마지막 메시지 미리보기', max_length=PREVIEW_LENGTH, blank=True)
+    last_sent_at = models.DateTimeField('마지막 메시지 시각')
+    unread_count = models.IntegerField('읽지 않은 메시지 수', default=0)
+
+    class Meta:
+        ordering = ['-last_sent_at']  # 최신 순
+        constraints = [
+            models.UniqueConstraint(fields=['owner', 'counterpart'], name='unique_conversation_pair'),
+        ]
+        indexes = [
+            models.Index(fields=['owner', '-last_sent_at', '-id']),
+        ]
+
+    def __str__(self):
+        return f"{self.owner_id} <-> {self.counterpart_id} ({self.last_message_preview[:20]}...)"
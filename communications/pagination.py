@@ -0,0 +1,25 @@
+from config.pagination import AsyncCursorPagination
+
+
+# 받은편지함 커서 페이지네이션 (owner, last_sent_at, id 인덱스 사용)
+class ConversationCursorPagination(AsyncCursorPagination):
+    ordering = ('-last_sent_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+# 대화별 메시지 커서 페이지네이션
+class MessageCursorPagination(AsyncCursorPagination):
+    ordering = ('-sent_at', '-id')
+    page_size = 30
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+# 단체 메시지 목록 (sender, created_at 인덱스)
+class BroadcastCursorPagination(AsyncCursorPagination):
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+QUEUE_SIZE = 100
+
+
+def user_channel(user_id):
+    return f'user:{user_id}'
+
+
+# 프로세스 내부 pub/sub (테스트, 로컬 실행용)
+# 구독자는 이벤트 루프에서, 발행은 어느 스레드에서나 가능. 프로세스 간에는 공유되지 않음
+class InMemoryBackend:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = {}
+
+    def publish_many(self, events):
+        with self._lock:
+            targets = [
+                (subscription, event)
+                for channel, event in events
+                for subscription in self._subscriptions.get(channel, ())
+            ]
+        for subscription, event in targets:
+            subscription.deliver(event)
+
+    def subscribe(self, channel):
+        subscription = InMemorySubscription(self, channel)
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
+
+
+class InMemorySubscription:
+    def __init__(self, backend, channel):
+        self.channel = channel
+        self._backend = backend
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+
+    def deliver(self, event):
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘 (연결 종료)
+            self._backend.unsubscribe(self)
+
+    def _put(self, event):
+        # 느린 구독자는 가장 오래된 이벤트를 버림
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self):
+        self._backend.unsubscribe(self)
+
+
+# Redis pub/sub (운영, 여러 프로세스 간 공유)
+class RedisBackend:
+    def __init__(self):
+        import redis
+
+        self._url = settings.PUBSUB_REDIS_URL
+        self._client = redis.Redis.from_url(self._url)
+
+    def publish_many(self, events):
+        pipeline = self._client.pipeline(transaction=False)
+        for channel, event in events:
+            pipeline.publish(channel, json.dumps(event, cls=DjangoJSONEncoder))
+        pipeline.execute()
+
+    def subscribe(self, channel):
+        return RedisSubscription(self._url, channel)
+
+
+class RedisSubscription:
+    def __init__(self, url, channel):
+        import redis.asyncio
+
+        self.channel = channel
+        self._client = redis.asyncio.Redis.from_url(url)
+        self._pubsub = self._client.pubsub()
+        self._subscribed = False
+
+    async def get(self, timeout):
+        if not self._subscribed:
+            await self._pubsub.subscribe(self.channel)
+            self._subscribed = True
+        message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if message is None:
+            return None
+        return json.loads(message['data'])
+
+    async def close(self):
+        await self._pubsub.aclose()
+        await self._client.aclose()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = import_string(settings.PUBSUB_BACKEND)()
+        return _backend
+
+
+# 사용자별 채널로 이벤트 발행 (트랜잭션 커밋 후)
+# events: (user_id, 이벤트 종류, 데이터) 목록
+def publish_to_users(events):
+    payload = [
+        (user_channel(user_id), {'type': event_type, 'data': data})
+        for user_id, event_type, data in events
+    ]
+    if payload:
+        transaction.on_commit(lambda: get_backend().publish_many(payload))
@@ -0,0 +1,72 @@
+from rest_framework import serializers
+
+from accounts.models import User
+from lectures.models import Lecture
+from .models import Broadcast, Message, Conversation
+
+
+class CounterpartSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ['id', 'name', 'profile_photo_url']
+
+
+class ConversationSerializer(serializers.ModelSerializer):
+    counterpart = CounterpartSerializer(read_only=True)
+
+    class Meta:
+        model = Conversation
+        fields = ['id', 'counterpart', 'last_message', 'last_message_preview', 'last_sent_at', 'unread_count']
+        read_only_fields = fields
+
+
+class MessageSerializer(serializers.ModelSerializer):
+    content = serializers.CharField(source='text', read_only=True)
+
+    class Meta:
+        model = Message
+        fields = ['id', 'sender', 'recipient', 'content', 'sent_at', 'read_at']
+        read_only_fields = fields
+
+
+class MessageCreateSerializer(serializers.Serializer):
+    recipient = serializers.PrimaryKeyRelatedField(queryset=User.objects.filter(is_active=True))
+    content = serializers.CharField()
+
+
+# 단체 메시지와 발송 진행 상황
+class BroadcastSerializer(serializers.ModelSerializer):
+    audience_display = serializers.CharField(source='get_audience_display', read_only=True)
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Broadcast
+        fields = [
+            'id',
+            'sender',
+            'audience',
+            'audience_display',
+            'lecture',
+            'content',
+            'status',
+            'status_display',
+            'total_count',
+            'sent_count',
+            'progress',
+            'created_at',
+            'completed_at',
+        ]
+        read_only_fields = fields
+
+    # 발송률(%)
+    def get_progress(self, obj):
+        if obj.status == Broadcast.Status.COMPLETED or not obj.total_count:
+            return 100 if obj.status == Broadcast.Status.COMPLETED else 0
+        return min(100, obj.sent_count * 100 // obj.total_count)
+
+
+# 단체 메시지 보내기 (lecture 가 없으면 활성 강사 전체)
+class BroadcastCreateSerializer(serializers.Serializer):
+    content = serializers.CharField()
+    lecture = serializers.PrimaryKeyRelatedField(queryset=Lecture.objects.all(), required=False, allow_null=True)
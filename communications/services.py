@@ -0,0 +1,140 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from accounts import counters
+from accounts.models import User
+from .models import Message, Conversation
+from .pubsub import publish_to_users
+
+
+# 메시지 저장, 수신자 카운터, 양쪽 대화 요약 갱신을 하나의 트랜잭션으로 처리하고 커밋 후 수신자에게 푸시
+# (post_save 에 맡기지 않고 여기서 직접 반영, bulk_create 경로인 단체 메시지도 같은 방식)
+def send_message(sender_id, recipient_id, content):
+    with transaction.atomic():
+        message = Message.objects.create(sender_id=sender_id, recipient_id=recipient_id, content=content)
+        counters.increment(counters.MESSAGES, [recipient_id])
+        update_conversations(message)
+        publish_to_users([(recipient_id, 'message', {
+            'id': message.id,
+            'sender': message.sender_id,
+            'content': message.text,
+            'sent_at': message.sent_at,
+        })])
+    return message
+
+
+# owner 기준 대화 요약을 message 로 갱신 (없으면 생성)
+def touch_conversation(owner_id, counterpart_id, message, unread_delta=0):
+    values = {
+        'last_message_id': message.id,
+        'last_message_preview': message.text[:Conversation.PREVIEW_LENGTH],
+        'last_sent_at': message.sent_at,
+    }
+    queryset = Conversation.objects.filter(owner_id=owner_id, counterpart_id=counterpart_id)
+    if queryset.update(unread_count=F('unread_count') + unread_delta, **values):
+        return
+
+    try:
+        with transaction.atomic():
+            Conversation.objects.create(
+                owner_id=owner_id,
+                counterpart_id=counterpart_id,
+                unread_count=unread_delta,
+                **values,
+            )
+    except IntegrityError:
+        # 동시에 다른 요청이 먼저 생성한 경우
+        queryset.update(unread_count=F('unread_count') + unread_delta, **values)
+
+
+# 메시지 생성 시 양쪽 대화 요약 갱신
+def update_conversations(message):
+    if not message.sender_id or not message.recipient_id:
+        return
+    unread = 1 if message.read_at is None else 0
+    touch_conversation(message.sender_id, message.recipient_id, message)
+    touch_conversation(message.recipient_id, message.sender_id, message, unread_delta=unread)
+
+
+# 수신자의 읽지 않은 메시지를 읽음 처리하고 카운터/대화 요약 감소
+# sender_id 를 주면 해당 발신자의 메시지만, message_ids 를 주면 해당 메시지만 처리
+def mark_messages_read(recipient_id, sender_id=None, message_ids=None):
+    queryset = Message.objects.filter(recipient_id=recipient_id, read_at__isnull=True)
+    if sender_id is not None:
+        queryset = queryset.filter(sender_id=sender_id)
+    if message_ids is not None:
+        queryset = queryset.filter(id__in=message_ids)
+
+    with transaction.atomic():
+        rows = list(queryset.select_for_update().values_list('id', 'sender_id'))
+        if not rows:
+            return 0
+        updated = Message.objects.filter(
+            id__in=[message_id for message_id, _ in rows], read_at__isnull=True
+        ).update(read_at=timezone.now())
+        counters.decrement(counters.MESSAGES, recipient_id, updated)
+
+        per_sender = {}
+        for _, message_sender_id in rows:
+            if message_sender_id:
+                per_sender[message_sender_id] = per_sender.get(message_sender_id, 0) + 1
+        for message_sender_id, count in per_sender.items():
+            Conversation.objects.filter(owner_id=recipient_id, counterpart_id=message_sender_id).update(
+                unread_count=Greatest(F('unread_count') - count, Value(0))
+            )
+    return updated
+
+
+# 메시지 이력 전체로 대화 요약을 다시 만듦 (bulk_create 로 메시지를 넣은 뒤 등)
+# 대화 소유자를 id 순으로 batch_size 명씩 나눠, 배치마다 트랜잭션 하나로 해당 소유자의 요약만 교체
+def rebuild_conversations(batch_size=1000):
+    total = 0
+    last_id = 0
+    while True:
+        owner_ids = list(
+            User.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        if not owner_ids:
+            return total
+        last_id = owner_ids[-1]
+        with transaction.atomic():
+            total += _rebuild_owner_conversations(owner_ids[0], last_id, batch_size)
+
+
+def _rebuild_owner_conversations(first_id, last_id, batch_size):
+    owners = (
+        Q(sender_id__gte=first_id, sender_id__lte=last_id)
+        | Q(recipient_id__gte=first_id, recipient_id__lte=last_id)
+    )
+    messages = (
+        Message.objects
+        .filter(owners, sender__isnull=False, recipient__isnull=False)
+        .order_by('sent_at', 'id')
+        .values_list('id', 'sender_id', 'recipient_id', 'content', 'broadcast__content', 'sent_at', 'read_at')
+    )
+    summaries = {}
+    for message_id, sender_id, recipient_id, content, broadcast_content, sent_at, read_at in messages:
+        content = content if broadcast_content is None else broadcast_content
+        for owner_id, counterpart_id, unread in (
+            (sender_id, recipient_id, 0),
+            (recipient_id, sender_id, 1 if read_at is None else 0),
+        ):
+            if not first_id <= owner_id <= last_id:
+                continue
+            summary = summaries.setdefault((owner_id, counterpart_id), {'unread_count': 0})
+            summary['last_message_id'] = message_id
+            summary['last_message_preview'] = content[:Conversation.PREVIEW_LENGTH]
+            summary['last_sent_at'] = sent_at
+            summary['unread_count'] += unread
+
+    Conversation.objects.filter(owner_id__gte=first_id, owner_id__lte=last_id).delete()
+    Conversation.objects.bulk_create(
+        [
+            Conversation(owner_id=owner_id, counterpart_id=counterpart_id, **summary)
+            for (owner_id, counterpart_id), summary in summaries.items()
+        ],
+        batch_size=batch_size,
+    )
+    return len(summaries)
@@ -1,3 +1,226 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.test import AsyncClient, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User, Notification, UnreadCounter
+from lectures.models import Lecture, Application
+from .broadcasts import deliver_broadcast
+from .models import Broadcast, Message, Conversation
+from .pubsub import InMemoryBackend, publish_to_users, user_channel
+from .services import mark_messages_read, rebuild_conversations, send_message
+from .views import stream_ticket
+
+
+def create_user(username, role=User.Role.INSTRUCTOR):
+    return User.objects.create_user(
+        username=username, email=f'{username}@example.com', password='password', name=username, role=role
+    )
+
+
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class BroadcastTests(TestCase):
+    def setUp(self):
+        self.manager = create_user('manager', role=User.Role.MANAGER)
+        self.instructors = [create_user(f'instructor{i}') for i in range(3)]
+        self.client = APIClient()
+        self.client.force_authenticate(self.manager)
+
+    def broadcast(self, **data):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/communications/broadcasts/', data, format='json')
+        self.assertEqual(response.status_code, 202)
+        return self.client.get(f"/api/communications/broadcasts/{response.json()['id']}/").json()
+
+    def test_broadcast_to_all_instructors(self):
+        progress = self.broadcast(content='전체 안내')
+
+        self.assertEqual(progress['status'], Broadcast.Status.COMPLETED)
+        self.assertEqual((progress['total_count'], progress['sent_count'], progress['progress']), (3, 3, 100))
+        self.assertEqual(Message.objects.filter(content='').count(), 3)
+        self.assertEqual(Notification.objects.count(), 3)
+
+        instructor = self.instructors[0]
+        self.assertEqual(UnreadCounter.objects.get(user=instructor).messages, 1)
+        conversation = Conversation.objects.get(owner=instructor, counterpart=self.manager)
+        self.assertEqual((conversation.last_message_preview, conversation.unread_count), ('전체 안내', 1))
+        self.assertEqual(Conversation.objects.filter(owner=self.manager).count(), 3)
+
+        self.client.force_authenticate(instructor)
+        messages = self.client.get(f'/api/communications/conversations/{self.manager.id}/messages/').json()
+        self.assertEqual([message['content'] for message in messages['results']], ['전체 안내'])
+
+    def test_broadcast_to_lecture_and_resume_is_idempotent(self):
+        lecture = Lecture.objects.create(title='로봇 캠프')
+        for instructor, status in zip(self.instructors, ['assigned', 'assigned', 'rejected']):
+            Application.objects.create(lecture=lecture, user=instructor, applied_role='main', assignment_status=status)
+
+        progress = self.broadcast(content='강의 안내', lecture=lecture.id)
+        self.assertEqual(progress['sent_count'], 2)
+
+        # 중단된 발송을 다시 시작해도 이미 받은 강사에게 다시 보내지 않음
+        Broadcast.objects.filter(id=progress['id']).update(status=Broadcast.Status.FAILED)
+        deliver_broadcast(progress['id'], batch_size=1)
+        self.assertEqual(
+            sorted(Message.objects.filter(broadcast_id=progress['id']).values_list('recipient_id', flat=True)),
+            [self.instructors[0].id, self.instructors[1].id],
+        )
+        self.assertEqual(Broadcast.objects.get(id=progress['id']).status, Broadcast.Status.COMPLETED)
+
+    def test_instructors_cannot_broadcast(self):
+        self.client.force_authenticate(self.instructors[0])
+        response = self.client.post('/api/communications/broadcasts/', {'content': '안내'}, format='json')
+        self.assertEqual(response.status_code, 403)
+
+
+
+# 1:1 메시지: 보내기와 같은 트랜잭션에서 카운터/양쪽 대화 요약 갱신, 읽음 처리 시 감소
+class MessageTests(TestCase):
+    def setUp(self):
+        self.manager = create_user('manager', role=User.Role.MANAGER)
+        self.instructors = [create_user(f'instructor{i}') for i in range(2)]
+        self.client = APIClient()
+        self.now = timezone.now()
+
+    def send(self, sender, recipient, content):
+        # 보낸 순서대로 시각이 달라지도록 1분씩 진행
+        self.now += timedelta(minutes=1)
+        with mock.patch('django.utils.timezone.now', return_value=self.now):
+            return send_message(sender.id, recipient.id, content)
+
+    def test_send_message_updates_counter_conversations_and_publishes_after_commit(self):
+        backend = mock.Mock()
+        with mock.patch('communications.pubsub.get_backend', return_value=backend):
+            with self.captureOnCommitCallbacks(execute=True):
+                message = self.send(self.manager, self.instructors[0], '안녕하세요')
+                backend.publish_many.assert_not_called()
+
+        self.assertEqual(UnreadCounter.objects.get(user=self.instructors[0]).messages, 1)
+        inbound = Conversation.objects.get(owner=self.instructors[0], counterpart=self.manager)
+        outbound = Conversation.objects.get(owner=self.manager, counterpart=self.instructors[0])
+        self.assertEqual((inbound.last_message_id, inbound.unread_count), (message.id, 1))
+        self.assertEqual((outbound.last_message_id, outbound.unread_count), (message.id, 0))
+        (channel, event), = backend.publish_many.call_args.args[0]
+        self.assertEqual((channel, event['data']['id']), (user_channel(self.instructors[0].id), message.id))
+
+    def test_inbox_lists_latest_conversation_first(self):
+        self.send(self.manager, self.instructors[0], '첫 번째')
+        self.send(self.manager, self.instructors[1], '두 번째')
+        self.send(self.instructors[0], self.manager, '답장')
+
+        self.client.force_authenticate(self.manager)
+        inbox = self.client.get('/api/communications/inbox/').json()['results']
+
+        self.assertEqual(
+            [(row['counterpart']['id'], row['last_message_preview'], row['unread_count']) for row in inbox],
+            [(self.instructors[0].id, '답장', 1), (self.instructors[1].id, '두 번째', 0)],
+        )
+
+    def test_mark_read_clears_unread_counts(self):
+        for i in range(3):
+            self.send(self.manager, self.instructors[0], f'안내{i}')
+        self.send(self.instructors[1], self.instructors[0], '질문')
+
+        self.client.force_authenticate(self.instructors[0])
+        response = self.client.post(f'/api/communications/conversations/{self.manager.id}/read/')
+
+        self.assertEqual(response.json(), {'updated': 3})
+        self.assertEqual(UnreadCounter.objects.get(user=self.instructors[0]).messages, 1)
+        unread = dict(
+            Conversation.objects.filter(owner=self.instructors[0]).values_list('counterpart_id', 'unread_count')
+        )
+        self.assertEqual(unread, {self.manager.id: 0, self.instructors[1].id: 1})
+        self.assertEqual(
+            self.client.post(f'/api/communications/conversations/{self.manager.id}/read/').json(), {'updated': 0}
+        )
+
+    def test_rebuild_matches_incremental_summaries(self):
+        self.send(self.manager, self.instructors[0], '안내')
+        self.send(self.instructors[0], self.manager, '답장')
+        self.send(self.instructors[1], self.instructors[0], '질문')
+        mark_messages_read(self.manager.id)
+        fields = ('owner_id', 'counterpart_id', 'last_message_id', 'last_message_preview', 'unread_count')
+        expected = sorted(Conversation.objects.values_list(*fields))
+
+        # 소유자 1명씩 나눠 다시 만들어도 결과가 같음
+        self.assertEqual(rebuild_conversations(batch_size=1), len(expected))
+        self.assertEqual(sorted(Conversation.objects.values_list(*fields)), expected)
+
+# 프로세스 내부 pub/sub: 사용자 채널의 구독자 모두에게, 커밋 후에만 전달
+class PubSubTests(TestCase):
+    async def test_publish_fans_out_to_channel_subscribers(self):
+        backend = InMemoryBackend()
+        first, second = backend.subscribe(user_channel(1)), backend.subscribe(user_channel(1))
+        other = backend.subscribe(user_channel(2))
+
+        backend.publish_many([(user_channel(1), {'type': 'message', 'data': {'id': 1}})])
+
+        for subscription in (first, second):
+            self.assertEqual(await subscription.get(timeout=1), {'type': 'message', 'data': {'id': 1}})
+        self.assertIsNone(await other.get(timeout=0.01))
+
+        await first.close()
+        backend.publish_many([(user_channel(1), {'type': 'message', 'data': {'id': 2}})])
+        self.assertEqual((await second.get(timeout=1))['data'], {'id': 2})
+        self.assertIsNone(await first.get(timeout=0.01))
+
+    def test_publish_to_users_waits_for_commit(self):
+        backend = mock.Mock()
+        with mock.patch('communications.pubsub.get_backend', return_value=backend):
+            with self.captureOnCommitCallbacks(execute=True):
+                publish_to_users([(1, 'notification', {'id': 1}), (2, 'notification', {'id': 2})])
+                backend.publish_many.assert_not_called()
+
+        backend.publish_many.assert_called_once_with([
+            (user_channel(1), {'type': 'notification', 'data': {'id': 1}}),
+            (user_channel(2), {'type': 'notification', 'data': {'id': 2}}),
+        ])
+
+
+# 이벤트 스트림 인증: 티켓 또는 Authorization 헤더, 실패는 모두 401
+class EventStreamAuthTests(TestCase):
+    def setUp(self):
+        self.user = create_user('instructor')
+
+    async def open(self, **kwargs):
+        response = await AsyncClient().get('/api/communications/events/', **kwargs)
+        if response.streaming:
+            first = await anext(aiter(response.streaming_content))
+            await response.streaming_content.aclose()
+            return response.status_code, first
+        return response.status_code, None
+
+    def test_ticket_is_issued_to_authenticated_users(self):
+        client = APIClient()
+        self.assertEqual(client.post('/api/communications/events/ticket/').status_code, 401)
+        client.force_authenticate(self.user)
+        response = client.post('/api/communications/events/ticket/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['expires_in'], 30)
+
+    async def test_stream_accepts_ticket_and_header(self):
+        self.assertEqual(await self.open(data={'ticket': stream_ticket(self.user.id)}), (200, b'retry: 3000\n\n'))
+        token = AccessToken.for_user(self.user)
+        self.assertEqual((await self.open(headers={'Authorization': f'Bearer {token}'}))[0], 200)
+
+    async def test_invalid_credentials_are_rejected(self):
+        self.assertEqual(await self.open(), (401, None))
+        self.assertEqual(await self.open(data={'ticket': 'invalid'}), (401, None))
+        self.assertEqual(await self.open(headers={'Authorization': 'Bearer invalid'}), (401, None))
+        # 액세스 토큰을 URL 로 받지 않음
+        self.assertEqual(await self.open(data={'token': str(AccessToken.for_user(self.user))}), (401, None))
+
+        token = AccessToken.for_user(self.user)
+        ticket = stream_ticket(self.user.id)
+        await User.objects.filter(id=self.user.id).aupdate(is_active=False)
+        # 비활성 사용자 (클레임 없는 토큰은 get_user 에서 AuthenticationFailed)
+        self.assertEqual(await self.open(headers={'Authorization': f'Bearer {token}'}), (401, None))
+        self.assertEqual(await self.open(data={'ticket': ticket}), (401, None))
+
+    async def test_expired_ticket_is_rejected(self):
+        ticket = stream_ticket(self.user.id)
+        with mock.patch('communications.views.STREAM_TICKET_SECONDS', -1):
+            self.assertEqual(await self.open(data={'ticket': ticket}), (401, None))
@@ -0,0 +1,14 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('events/', views.event_stream, name='event-stream'),
+    path('events/ticket/', views.EventStreamTicketView.as_view(), name='event-stream-ticket'),
+    path('inbox/', views.AsyncInboxView.as_view(), name='inbox'),
+    path('messages/', views.MessageCreateView.as_view(), name='message-create'),
+    path('conversations/<int:user_id>/messages/', views.ConversationMessageListView.as_view(), name='conversation-messages'),
+    path('conversations/<int:user_id>/read/', views.ConversationReadView.as_view(), name='conversation-read'),
+    path('broadcasts/', views.BroadcastListCreateView.as_view(), name='broadcast-list'),
+    path('broadcasts/<int:pk>/', views.BroadcastDetailView.as_view(), name='broadcast-detail'),
+]
@@ -1,3 +1,192 @@
-from django.shortcuts import render
+import json
 
-# Create your views here.
+from asgiref.sync import sync_to_async
+from django.core import signing
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from accounts.authentication import ClaimsJWTAuthentication
+from accounts.models import User
+from accounts.permissions import IsManager
+from config.async_views import AsyncAPIView
+from .broadcasts import create_broadcast
+from .models import Broadcast, Message, Conversation
+from .pubsub import get_backend, user_channel
+from .pagination import BroadcastCursorPagination, ConversationCursorPagination, MessageCursorPagination
+from .serializers import (
+    BroadcastSerializer,
+    BroadcastCreateSerializer,
+    ConversationSerializer,
+    MessageSerializer,
+    MessageCreateSerializer,
+)
+from .services import send_message, mark_messages_read
+
+
+# 받은편지함 (상대방별 마지막 메시지 + 읽지 않은 수)
+# GET /api/communications/inbox/
+class InboxView(generics.ListAPIView):
+    serializer_class = ConversationSerializer
+    pagination_class = ConversationCursorPagination
+
+    def get_queryset(self):
+        return Conversation.objects.filter(owner_id=self.request.user.id).select_related('counterpart')
+
+
+# 받은편지함 (비동기)
+class AsyncInboxView(AsyncAPIView):
+    sync_view = InboxView
+
+    async def get(self, request, *args, **kwargs):
+        return await self.alist(request, **kwargs)
+
+
+# 메시지 보내기
+# POST /api/communications/messages/
+class MessageCreateView(APIView):
+    def post(self, request):
+        serializer = MessageCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        recipient = serializer.validated_data['recipient']
+        if recipient.id == request.user.id:
+            raise ValidationError({'recipient': '자기 자신에게는 메시지를 보낼 수 없습니다.'})
+
+        message = send_message(request.user.id, recipient.id, serializer.validated_data['content'])
+        return Response(MessageSerializer(message).data, status=status.HTTP_201_CREATED)
+
+
+# 특정 상대와 주고받은 메시지
+# GET /api/communications/conversations/<user_id>/messages/
+class ConversationMessageListView(generics.ListAPIView):
+    serializer_class = MessageSerializer
+    pagination_class = MessageCursorPagination
+
+    def get_queryset(self):
+        me = self.request.user.id
+        other = self.kwargs['user_id']
+        return Message.objects.filter(
+            Q(sender_id=me, recipient_id=other) | Q(sender_id=other, recipient_id=me)
+        ).select_related('broadcast')
+
+
+# 특정 상대가 보낸 메시지 모두 읽음 처리
+# POST /api/communications/conversations/<user_id>/read/
+class ConversationReadView(APIView):
+    def post(self, request, user_id):
+        updated = mark_messages_read(request.user.id, sender_id=user_id)
+        return Response({'updated': updated})
+
+
+# 단체 메시지 (매니저 본인이 보낸 것)
+# GET  /api/communications/broadcasts/
+# POST /api/communications/broadcasts/ {"content": "...", "lecture": <id>|null}
+# 수신자 행은 작업 큐에서 만들어지므로 202 와 함께 진행 상황을 반환
+class BroadcastListCreateView(generics.ListAPIView):
+    serializer_class = BroadcastSerializer
+    pagination_class = BroadcastCursorPagination
+    permission_classes = [IsAuthenticated, IsManager]
+
+    def get_queryset(self):
+        return Broadcast.objects.filter(sender_id=self.request.user.id)
+
+    def post(self, request):
+        serializer = BroadcastCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        lecture = serializer.validated_data.get('lecture')
+        broadcast = create_broadcast(request.user.id, serializer.validated_data['content'], lecture.id if lecture else None)
+        return Response(BroadcastSerializer(broadcast).data, status=status.HTTP_202_ACCEPTED)
+
+
+# 단체 메시지 발송 진행 상황
+# GET /api/communications/broadcasts/<id>/
+class BroadcastDetailView(generics.RetrieveAPIView):
+    serializer_class = BroadcastSerializer
+    permission_classes = [IsAuthenticated, IsManager]
+
+    def get_queryset(self):
+        return Broadcast.objects.filter(sender_id=self.request.user.id)
+
+
+SSE_KEEPALIVE_SECONDS = 15
+STREAM_TICKET_SALT = 'communications.event-stream'
+# 스트림 티켓 유효 시간 (접속 직전에 발급받아 바로 사용)
+STREAM_TICKET_SECONDS = 30
+
+
+# EventSource 는 헤더를 지정할 수 없으므로 액세스 토큰 대신 짧게 유효한 티켓을 ?ticket= 으로 받음
+# (URL 은 접근 로그에 남으므로 토큰을 넣지 않음)
+def stream_ticket(user_id):
+    return signing.dumps(user_id, salt=STREAM_TICKET_SALT)
+
+
+def user_id_from_ticket(ticket):
+    try:
+        return signing.loads(ticket, salt=STREAM_TICKET_SALT, max_age=STREAM_TICKET_SECONDS)
+    except signing.BadSignature:
+        return None
+
+
+# 이벤트 스트림 접속 티켓 발급
+# POST /api/communications/events/ticket/
+class EventStreamTicketView(APIView):
+    def post(self, request):
+        return Response({'ticket': stream_ticket(request.user.id), 'expires_in': STREAM_TICKET_SECONDS})
+
+
+def _authenticate_stream(request):
+    ticket = request.GET.get('ticket')
+    if ticket:
+        user_id = user_id_from_ticket(ticket)
+        if user_id is None:
+            raise AuthenticationFailed('유효하지 않거나 만료된 티켓입니다.')
+        user = User.objects.filter(id=user_id, is_active=True).first()
+        if user is None:
+            raise AuthenticationFailed('유효하지 않거나 만료된 티켓입니다.')
+        return user
+    result = ClaimsJWTAuthentication().authenticate(request)
+    return result[0] if result else None
+
+
+# 실시간 이벤트 스트림 (Server-Sent Events)
+# GET /api/communications/events/?ticket= (또는 Authorization 헤더)
+# 새 메시지, 알림, 배정 결과를 푸시. ASGI(config/asgi.py) 로 서비스해야 연결마다 스레드를 점유하지 않음
+async def event_stream(request):
+    try:
+        user = await sync_to_async(_authenticate_stream)(request)
+    except (InvalidToken, TokenError):
+        return JsonResponse({'detail': '유효하지 않은 토큰입니다.'}, status=401)
+    except AuthenticationFailed as e:
+        # 없는/비활성 사용자의 토큰, 잘못된 티켓
+        return JsonResponse({'detail': str(e.detail)}, status=401)
+    if user is None:
+        user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({'detail': '자격 인증데이터(authentication credentials)가 제공되지 않았습니다.'}, status=401)
+
+    async def stream():
+        subscription = get_backend().subscribe(user_channel(user.id))
+        try:
+            yield 'retry: 3000\n\n'
+            while True:
+                event = await subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                if event is None:
+                    yield ': keep-alive\n\n'
+                    continue
+                data = json.dumps(event['data'], cls=DjangoJSONEncoder, ensure_ascii=False)
+                yield f"event: {event['type']}\ndata: {data}\n\n"
+        finally:
+            await subscription.close()
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -3,6 +3,12 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serve with an ASGI server (e.g. ``uvicorn config.asgi:application``) so that
+long-lived streams such as /api/communications/events/ and the async read
+views (config.async_views.AsyncAPIView: lecture/announcement lists and
+details, notifications, inbox) do not hold a worker thread per connection.
+Compare with the WSGI deployment using ``manage.py run_server_benchmark``.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -0,0 +1,167 @@
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
+from django.http import Http404, HttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.renderers import BrowsableAPIRenderer, TemplateHTMLRenderer
+from rest_framework.request import Request
+
+from accounts.authentication import ClaimsJWTAuthentication, ClaimsUser
+from .routers import ais_pinned, read_from_replica, replica_alias
+
+SAFE_ASYNC_METHODS = ('GET', 'HEAD')
+# 템플릿으로 렌더링하는 HTML 응답은 sync_view 로 넘김
+SYNC_RENDERERS = (BrowsableAPIRenderer, TemplateHTMLRenderer)
+
+
+# sync_view 의 authentication_classes(기본: DRF 설정) 순서대로 인증, (user, auth) 또는 None
+# - 역할 클레임이 있는 JWT 는 DB 조회 없이, 세션은 async 로 사용자 조회
+#   (GET/HEAD 만 처리하므로 세션 인증의 CSRF 검사는 원래도 하지 않음)
+# - 그 밖의 인증 클래스는 동기 스레드에서 authenticate() 를 그대로 호출
+async def aauthenticate(request, authenticators):
+    for authenticator in authenticators:
+        if isinstance(authenticator, ClaimsJWTAuthentication):
+            header = authenticator.get_header(request._request)
+            raw_token = authenticator.get_raw_token(header) if header is not None else None
+            if raw_token is None:
+                continue
+            token = authenticator.get_validated_token(raw_token)
+            if authenticator.has_claims(token):
+                return ClaimsUser(token), token
+            return await sync_to_async(authenticator.get_user)(token), token
+        if type(authenticator) is SessionAuthentication:
+            user = await request._request.auser()
+            if user and user.is_active:
+                return user, None
+            continue
+        result = await sync_to_async(authenticator.authenticate)(request)
+        if result is not None:
+            return result
+    return None
+
+
+# 읽기 전용 비동기 API 뷰 (ASGI 에서 느린 클라이언트가 워커 스레드를 점유하지 않도록)
+# - GET/HEAD 만 async ORM 으로 처리하고, 쓰기 등 그 밖의 메서드는 sync_view(DRF 뷰)로 넘김
+# - 쿼리셋/시리얼라이저/페이지네이션/인증/권한/스로틀/렌더러 설정은 sync_view 의 것을 그대로 사용
+# - 콘텐츠 협상 결과가 HTML(Browsable API 등)이면 sync_view 로 넘김
+# - get() 은 응답 데이터를 반환하고, 렌더링과 예외 처리는 dispatch 에서 DRF 와 같은 형식으로
+class AsyncAPIView(View):
+    sync_view = None
+    sync_callable = None
+    # ReplicaReadMixin 과 같은 조건으로 복제본에서 읽음
+    replica_reads = False
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        initkwargs.setdefault('sync_callable', cls.sync_view.as_view())
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method not in SAFE_ASYNC_METHODS:
+            return await sync_to_async(self.sync_callable)(request, *args, **kwargs)
+
+        view = self.get_sync_view(None, **kwargs)
+        request = Request(
+            request,
+            parsers=view.get_parsers(),
+            authenticators=view.get_authenticators(),
+            negotiator=view.get_content_negotiator(),
+        )
+        view.request = request
+        self.renderers = view.get_renderers()
+        self.renderer, self.accepted_media_type = self.renderers[0], self.renderers[0].media_type
+        self.authenticate_header = view.get_authenticate_header(request)
+        try:
+            self.renderer, self.accepted_media_type = request.negotiator.select_renderer(
+                request, self.renderers, view.format_kwarg
+            )
+            if isinstance(self.renderer, SYNC_RENDERERS):
+                return await sync_to_async(self.sync_callable)(request._request, *args, **kwargs)
+
+            result = await aauthenticate(request, request.authenticators)
+            if result is None:
+                request._not_authenticated()
+            else:
+                request.user, request.auth = result
+            self.check_permissions(request, view)
+            if view.throttle_classes:
+                await sync_to_async(view.check_throttles)(request)
+            use_replica = (
+                self.replica_reads
+                and replica_alias() is not None
+                and not await ais_pinned(request.user.id)
+            )
+            with read_from_replica(use_replica):
+                data = await self.get(request, *args, **kwargs)
+        except Exception as exc:
+            return self.handle_exception(exc)
+        return self.render(data)
+
+    def check_permissions(self, request, view):
+        for permission in view.get_permissions():
+            if not permission.has_permission(request, view):
+                if not request.user.is_authenticated:
+                    raise exceptions.NotAuthenticated()
+                raise exceptions.PermissionDenied(getattr(permission, 'message', None))
+
+    def get_sync_view(self, request, **kwargs):
+        return self.sync_view(request=request, args=(), kwargs=kwargs, format_kwarg=None)
+
+    # ListAPIView.list 와 같은 결과
+    async def alist(self, request, **kwargs):
+        view = self.get_sync_view(request, **kwargs)
+        paginator = view.paginator
+        queryset = view.filter_queryset(view.get_queryset())
+        page = await paginator.apaginate_queryset(queryset, request, view=view)
+        return paginator.get_paginated_response(view.get_serializer(page, many=True).data).data
+
+    # RetrieveAPIView.retrieve 와 같은 결과
+    async def aretrieve(self, request, **kwargs):
+        view = self.get_sync_view(request, **kwargs)
+        lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+        queryset = view.get_queryset()
+        try:
+            obj = await queryset.aget(**{view.lookup_field: kwargs[lookup_url_kwarg]})
+        except ObjectDoesNotExist:
+            # get_object_or_404 와 같은 메시지
+            raise Http404(f'No {queryset.model._meta.object_name} matches the given query.')
+        view.check_object_permissions(request, obj)
+        return view.get_serializer(obj).data
+
+    def render(self, data, status=200):
+        renderer = self.renderer
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f'{content_type}; charset={renderer.charset}'
+        response = HttpResponse(
+            renderer.render(data, self.accepted_media_type, {'request': self.request, 'view': self}),
+            status=status,
+            content_type=content_type,
+        )
+        if len(self.renderers) > 1:
+            patch_vary_headers(response, ['Accept'])
+        return response
+
+    # rest_framework.views.exception_handler 와 같은 응답 형식
+    def handle_exception(self, exc):
+        if isinstance(exc, Http404):
+            exc = exceptions.NotFound(*exc.args)
+        elif isinstance(exc, PermissionDenied):
+            exc = exceptions.PermissionDenied(*exc.args)
+        if not isinstance(exc, exceptions.APIException):
+            raise exc
+
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        response = self.render(data, exc.status_code)
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            if self.authenticate_header:
+                response['WWW-Authenticate'] = self.authenticate_header
+            else:
+                response.status_code = 403
+        elif isinstance(exc, exceptions.Throttled) and exc.wait is not None:
+            response['Retry-After'] = '%d' % exc.wait
+        return response
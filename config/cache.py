@@ -0,0 +1,142 @@
+import hashlib
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .routers import using_replica
+
+DEFAULT_TIMEOUT = 60 * 60
+
+
+def get_cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def _version_key(namespace):
+    return f'ver:{namespace}'
+
+
+# 네임스페이스 버전
+# 버전 키가 없거나 만료되면 현재 시각(ns)으로 새로 시작하므로 예전 버전 키가 다시 쓰이지 않음
+def get_versions(namespaces):
+    cache = get_cache()
+    keys = [_version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    for key, version in missing.items():
+        if not cache.add(key, version, None):
+            missing[key] = cache.get(key, version)
+    versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(namespaces):
+    cache = get_cache()
+    keys = [_version_key(namespace) for namespace in namespaces]
+    versions = await cache.aget_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    for key, version in missing.items():
+        if not await cache.aadd(key, version, None):
+            missing[key] = await cache.aget(key, version)
+    versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+# 네임스페이스 무효화: 버전을 올리면 이전 버전의 응답 키는 더 이상 조회되지 않음
+def bump_versions(namespaces):
+    cache = get_cache()
+    for namespace in namespaces:
+        key = _version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), None)
+
+
+def _stamp_key(namespace):
+    return f'stamp:{namespace}'
+
+
+# 마지막 변경 시각(ns) 스탬프 (조건부 GET 의 ETag/Last-Modified 용)
+# 버전과 같이 키가 없으면 현재 시각으로 시작하므로, 캐시가 비워지면 한 번 다시 받게 됨
+def get_stamps(namespaces):
+    cache = get_cache()
+    keys = [_stamp_key(namespace) for namespace in namespaces]
+    stamps = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in stamps}
+    for key, stamp in missing.items():
+        if not cache.add(key, stamp, None):
+            missing[key] = cache.get(key, stamp)
+    stamps.update(missing)
+    return [stamps[key] for key in keys]
+
+
+def touch_stamps(namespaces):
+    now = time.time_ns()
+    get_cache().set_many({_stamp_key(namespace): now for namespace in namespaces}, None)
+
+
+class CacheMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = defaultdict(lambda: {'hits': 0, 'misses': 0})
+
+    def record(self, name, hit):
+        with self._lock:
+            self._counts[name]['hits' if hit else 'misses'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._counts.items()}
+
+
+metrics = CacheMetrics()
+
+
+def _response_key(name, key, versions):
+    digest = hashlib.sha1(str(key).encode()).hexdigest()
+    return f"resp:{name}:{digest}:{':'.join(str(version) for version in versions)}"
+
+
+def _timeout(timeout):
+    if using_replica():
+        # 무효화 직후 복제 지연 중인 복제본에서 만든 값일 수 있으므로 짧게만 보관
+        return min(timeout or DEFAULT_TIMEOUT, settings.REPLICA_PIN_SECONDS)
+    return timeout
+
+
+# 읽기 관통(read-through) 캐시
+# name: 지표 이름, namespaces: 응답이 의존하는 네임스페이스, key: 요청을 구분하는 값
+# builder 는 캐시 미스일 때만 호출되며 pickle 가능한 값을 반환해야 함
+def cached(name, namespaces, key, builder, timeout=DEFAULT_TIMEOUT):
+    cache_key = _response_key(name, key, get_versions(namespaces))
+
+    cache = get_cache()
+    value = cache.get(cache_key)
+    if value is not None:
+        metrics.record(name, hit=True)
+        return value
+
+    metrics.record(name, hit=False)
+    value = builder()
+    cache.set(cache_key, value, _timeout(timeout))
+    return value
+
+
+# cached 의 비동기 버전 (builder 는 코루틴 함수)
+async def acached(name, namespaces, key, builder, timeout=DEFAULT_TIMEOUT):
+    cache_key = _response_key(name, key, await aget_versions(namespaces))
+
+    cache = get_cache()
+    value = await cache.aget(cache_key)
+    if value is not None:
+        metrics.record(name, hit=True)
+        return value
+
+    metrics.record(name, hit=False)
+    value = await builder()
+    await cache.aset(cache_key, value, _timeout(timeout))
+    return value
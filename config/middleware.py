@@ -0,0 +1,168 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.utils.functional import SimpleLazyObject, empty
+from rest_framework.permissions import SAFE_METHODS
+
+from .routers import apin_to_primary, pin_to_primary, replica_alias
+from .stats import request_stats
+
+# IN (%s, %s, ...) 처럼 인자 개수만 다른 쿼리를 같은 지문으로 묶음
+IN_LIST_RE = re.compile(r'\(\s*%s(?:\s*,\s*%s)*\s*\)')
+NUMBER_RE = re.compile(r'\b\d+\b')
+
+
+def fingerprint(sql):
+    return NUMBER_RE.sub('N', IN_LIST_RE.sub('(...)', sql))
+
+
+class QueryRecorder:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+
+# 모든 DB 연결에 한 번만 붙여 두고 현재 요청(컨텍스트)의 QueryRecorder 로 넘김
+# 컨텍스트 변수는 sync_to_async 스레드에도 전달되므로 async 뷰의 ORM 쿼리도 요청별로 기록됨
+_recorder = ContextVar('query_recorder', default=None)
+
+
+def record_queries(execute, sql, params, many, context):
+    recorder = _recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_recorder(connection, **kwargs):
+    # execute_wrapper() 블록 안에서 연결되더라도 그 블록의 pop() 에 빠지지 않도록 맨 앞에
+    if record_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_queries)
+
+
+# URL 패턴별 쿼리 수, SQL 시간, 지연 시간, 반복 쿼리(N+1 의심)를 기록
+# 결과는 /api/metrics/requests/ (JSON), /api/metrics/prometheus/ 에서 확인
+# ASGI 에서는 비동기로 동작해 async 뷰 앞뒤로 스레드를 오가지 않음
+class QueryStatsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'QUERY_STATS_ENABLED', True)
+        self.threshold = getattr(settings, 'N_PLUS_ONE_THRESHOLD', 5)
+        self.server_timing = getattr(settings, 'SERVER_TIMING_HEADER', False)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+        if self.enabled:
+            connection_created.connect(install_recorder, dispatch_uid='query_stats_recorder')
+            for connection in connections.all(initialized_only=True):
+                install_recorder(connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        token = _recorder.set(recorder)
+        try:
+            response = self.get_response(request)
+        finally:
+            _recorder.reset(token)
+        return self._record(request, response, recorder, start)
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        token = _recorder.set(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _recorder.reset(token)
+        return self._record(request, response, recorder, start)
+
+    def _record(self, request, response, recorder, start):
+        latency_ms = (time.perf_counter() - start) * 1000
+        sql_ms = recorder.duration * 1000
+
+        match = getattr(request, 'resolver_match', None)
+        route = f'{request.method} /{match.route}' if match else f'{request.method} <unresolved>'
+        duplicates = {
+            sql: count for sql, count in recorder.fingerprints.items() if count >= self.threshold
+        }
+        request_stats.record(route, latency_ms, recorder.count, sql_ms, duplicates)
+
+        if self.server_timing or settings.DEBUG or _is_staff(request):
+            response['Server-Timing'] = (
+                f'db;dur={sql_ms:.1f};desc="{recorder.count} queries", total;dur={latency_ms:.1f}'
+            )
+        return response
+
+
+# 응답 시점에 이미 인증된 사용자만 확인 (세션 사용자를 여기서 새로 불러오지 않음)
+def _is_staff(request):
+    user = getattr(request, 'user', None)
+    if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+        return False
+    return bool(user is not None and user.is_authenticated and user.is_staff)
+
+
+# 쓰기 요청에 성공한 사용자는 REPLICA_PIN_SECONDS 동안 primary 에서 읽음 (config.routers.ReplicaReadMixin)
+# JWT 사용자는 DRF 가 인증 후 request.user 에 넣어 주므로 응답 시점에는 확인 가능
+class PrimaryPinMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        user_id = self._written_by(request, response)
+        if user_id is not None:
+            pin_to_primary(user_id)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if request.method in SAFE_METHODS:
+            return response
+        # 세션 사용자는 지연 로딩(DB 조회)일 수 있으므로 동기 스레드에서 확인
+        user_id = await sync_to_async(self._written_by)(request, response)
+        if user_id is not None:
+            await apin_to_primary(user_id)
+        return response
+
+    def _written_by(self, request, response):
+        if request.method in SAFE_METHODS or response.status_code >= 400 or not replica_alias():
+            return None
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            return None
+        return user.id
@@ -0,0 +1,24 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson 은 선택 의존성 (없으면 DRF 기본 JSON 렌더러와 같이 동작)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson 으로 직렬화하는 JSON 렌더러
+# - 날짜/시간, Decimal, 지연 번역 문자열 등은 DRF JSONEncoder 로 넘겨 기존 응답과 같은 형식을 유지
+# - 들여쓰기를 요청한 경우(Accept: application/json; indent=4)에는 기본 렌더러 사용
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(
+            data,
+            default=JSONEncoder().default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
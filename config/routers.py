@@ -0,0 +1,91 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+# 현재 요청(스레드/코루틴)이 복제본에서 읽어도 되는지
+_use_replica = ContextVar('use_replica', default=False)
+
+
+# 설정된 복제본 별칭 (DATABASES 에 없으면 None → primary 사용)
+def replica_alias():
+    alias = getattr(settings, 'REPLICA_DATABASE_ALIAS', 'replica')
+    return alias if alias in settings.DATABASES else None
+
+
+def _pin_key(user_id):
+    return f'db-pin:{user_id}'
+
+
+# 쓰기 직후에는 복제 지연 동안 자기 변경이 안 보일 수 있으므로 잠시 primary 에서 읽음
+def pin_to_primary(user_id):
+    cache.set(_pin_key(user_id), 1, getattr(settings, 'REPLICA_PIN_SECONDS', 5))
+
+
+def is_pinned(user_id):
+    return user_id is not None and cache.get(_pin_key(user_id)) is not None
+
+
+async def ais_pinned(user_id):
+    return user_id is not None and await cache.aget(_pin_key(user_id)) is not None
+
+
+async def apin_to_primary(user_id):
+    await cache.aset(_pin_key(user_id), 1, getattr(settings, 'REPLICA_PIN_SECONDS', 5))
+
+
+def using_replica():
+    return _use_replica.get() and replica_alias() is not None
+
+
+@contextmanager
+def read_from_replica(enabled=True):
+    token = _use_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+# 읽기: read_from_replica 안에서만 복제본 (primary 트랜잭션 안에서는 primary)
+# 쓰기/마이그레이션: 항상 primary
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if not _use_replica.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return replica_alias()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary 와 같은 데이터
+        databases = {DEFAULT_DB_ALIAS, replica_alias()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == replica_alias():
+            return False
+        return None
+
+
+# 읽기 전용 목록 뷰에 섞어 사용
+# 인증 후 GET 요청이고 사용자가 최근에 쓰지 않았으면(config.middleware.PrimaryPinMiddleware) 복제본에서 읽음
+class ReplicaReadMixin:
+    _replica_token = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS and replica_alias() and not is_pinned(request.user.id):
+            self._replica_token = _use_replica.set(True)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if self._replica_token is not None:
+            _use_replica.reset(self._replica_token)
+            self._replica_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -0,0 +1,144 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils import timezone
+from rest_framework import serializers
+
+
+# 선택지 값 → 라벨 (get_FOO_display() 와 같은 결과, 목록마다 한 번만 계산)
+def choice_labels(field):
+    return {value: str(label) for value, label in field.flatchoices}
+
+
+# values() 경로가 가리키는 모델 필드 (annotate 값이면 None)
+def _resolve_field(model, path):
+    field = None
+    for name in path.split('__'):
+        if model is None:
+            return None
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        model = field.related_model
+    return field
+
+
+# DRF DateTimeField/DateField.to_representation 과 같은 형식 (ISO 8601, 현재 시간대)
+def _datetime_converter(tz):
+    def convert(value):
+        if value is None:
+            return None
+        value = value.astimezone(tz).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return convert
+
+
+def _date(value):
+    return None if value is None else value.isoformat()
+
+
+class ValuesListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        return self.child.to_rows(data)
+
+
+# 목록 응답용 읽기 전용 시리얼라이저
+# 모델 인스턴스 대신 .values() 로 읽은 dict 에서 바로 응답을 만듦 (필드 객체/get_FOO_display() 호출 없음)
+# Meta
+# - model, fields: 출력 순서
+# - sources: 출력 키 → values() 경로 (없으면 같은 이름, annotate 값도 그대로)
+# - labels: 출력 키 → 선택지 필드의 출력 키 (미리 만든 라벨 dict 로 변환)
+# - nested: 출력 키 → 관계 필드의 출력 필드 목록 (관계가 없으면 None)
+class ValuesSerializer(serializers.BaseSerializer):
+    _plan = None
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        kwargs['child'] = cls(context=kwargs.get('context', {}))
+        return ValuesListSerializer(*args, **kwargs)
+
+    # 출력 키별 (키, values() 경로, 변환 종류/라벨 dict/중첩 계획)
+    @classmethod
+    def get_plan(cls):
+        if cls.__dict__.get('_plan') is None:
+            meta = cls.Meta
+            sources = getattr(meta, 'sources', {})
+            labels = getattr(meta, 'labels', {})
+            nested = getattr(meta, 'nested', {})
+
+            def field_plan(key, path):
+                if key in labels:
+                    path = sources.get(labels[key], labels[key])
+                    return key, path, choice_labels(_resolve_field(meta.model, path))
+                field = _resolve_field(meta.model, path)
+                if isinstance(field, models.DateTimeField):
+                    return key, path, 'datetime'
+                if isinstance(field, models.DateField):
+                    return key, path, 'date'
+                return key, path, None
+
+            plan = []
+            for key in meta.fields:
+                path = sources.get(key, key)
+                if key in nested:
+                    related = _resolve_field(meta.model, path).related_model
+                    children = [field_plan(name, f'{path}__{name}') for name in nested[key]]
+                    plan.append((key, f'{path}__{related._meta.pk.name}', children))
+                else:
+                    plan.append(field_plan(key, path))
+            cls._plan = plan
+        return cls._plan
+
+    @classmethod
+    def values_fields(cls):
+        paths = []
+        for _, path, kind in cls.get_plan():
+            paths.append(path)
+            if isinstance(kind, list):
+                paths.extend(child_path for _, child_path, _ in kind)
+        return list(dict.fromkeys(paths))
+
+    @classmethod
+    def project(cls, queryset):
+        return queryset.values(*cls.values_fields())
+
+    def to_rows(self, rows):
+        converters = {'datetime': _datetime_converter(timezone.get_current_timezone()), 'date': _date}
+
+        def compile_plan(plan):
+            compiled = []
+            for key, path, kind in plan:
+                if isinstance(kind, list):
+                    compiled.append((key, path, 'nested', compile_plan(kind)))
+                elif isinstance(kind, dict):
+                    compiled.append((key, path, 'label', kind))
+                else:
+                    compiled.append((key, path, 'value', converters.get(kind)))
+            return compiled
+
+        def build(row, plan):
+            item = {}
+            for key, path, kind, arg in plan:
+                value = row[path]
+                if kind == 'value':
+                    item[key] = value if arg is None else arg(value)
+                elif kind == 'label':
+                    item[key] = arg.get(value, value)
+                else:
+                    item[key] = None if value is None else build(row, arg)
+            return item
+
+        plan = compile_plan(self.get_plan())
+        return [build(row, plan) for row in rows]
+
+    def to_representation(self, instance):
+        return self.to_rows([instance])[0]
+
+
+# ValuesSerializer 로 응답하는 목록 뷰에 섞어 사용
+# 뷰의 get_queryset() 결과를 페이지네이션 직전에 시리얼라이저가 쓰는 필드만 .values() 로 읽도록 바꿈
+class ValuesListMixin:
+    def filter_queryset(self, queryset):
+        return self.get_serializer_class().project(super().filter_queryset(queryset))
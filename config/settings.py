@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 from datetime import timedelta
 
@@ -46,20 +47,33 @@ INSTALLED_APPS = [
     'announcements.apps.AnnouncementsConfig',
     'lectures.apps.LecturesConfig',
     'communications.apps.CommunicationsConfig',
+    'search.apps.SearchConfig',
+    'dashboard.apps.DashboardConfig',
+    'sync.apps.SyncConfig',
 ]
 
 MIDDLEWARE = [
+    'config.middleware.QueryStatsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'config.middleware.PrimaryPinMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
 
+# 요청별 쿼리/지연 시간 통계 (config.middleware.QueryStatsMiddleware)
+QUERY_STATS_ENABLED = True
+# 한 요청에서 같은 쿼리가 이 횟수 이상 반복되면 N+1 의심으로 기록
+N_PLUS_ONE_THRESHOLD = 5
+# 응답의 Server-Timing 헤더(SQL 시간/쿼리 수)는 내부 정보이므로 DEBUG 이거나 스태프 사용자에게만 보냄
+# True 면 모든 응답에 포함
+SERVER_TIMING_HEADER = False
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -81,6 +95,14 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# 커넥션 풀 (psycopg[pool] 필요). 요청마다 새로 연결하지 않고 풀에서 빌려 씀
+# 풀을 쓰면 CONN_MAX_AGE 는 0 이어야 함. CONN_HEALTH_CHECKS 는 빌려줄 때 연결 상태를 확인
+DATABASE_POOL = {
+    'min_size': 2,
+    'max_size': 10,
+    'timeout': 10,
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -89,9 +111,37 @@ DATABASES = {
         'PASSWORD': '12345678',
         'HOST': 'localhost',
         'PORT': '5432',
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'pool': dict(DATABASE_POOL),
+        },
     }
 }
 
+# 읽기 전용 복제본 (DB_REPLICA_HOST 가 있을 때만 사용)
+# 강의/공지사항/알림 목록 조회만 복제본으로 보냄 (config.routers)
+REPLICA_DATABASE_ALIAS = 'replica'
+if os.environ.get('DB_REPLICA_HOST'):
+    DATABASES[REPLICA_DATABASE_ALIAS] = {
+        **DATABASES['default'],
+        'HOST': os.environ['DB_REPLICA_HOST'],
+        'PORT': os.environ.get('DB_REPLICA_PORT', '5432'),
+        'OPTIONS': {
+            'pool': dict(DATABASE_POOL),
+        },
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    }
+
+DATABASE_ROUTERS = ['config.routers.ReplicaRouter']
+
+# 사용자가 쓰기 요청을 한 뒤 이 시간(초) 동안은 그 사용자의 읽기를 primary 로 (복제 지연 대비)
+REPLICA_PIN_SECONDS = 5
+
+# 모바일 동기화 변경 기록 보관 일수 (prune_change_log). 이보다 오래된 커서는 만료
+SYNC_RETENTION_DAYS = 30
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -113,15 +163,25 @@ AUTH_PASSWORD_VALIDATORS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
+        # 역할 클레임이 든 JWT 는 DB 조회 없이 인증, 세션은 관리자 화면/브라우저용으로 유지
+        'accounts.authentication.ClaimsJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        # orjson 이 설치되어 있으면 orjson 으로 직렬화 (config/renderers.py)
+        'config.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 
 }
 
 SIMPLE_JWT = {
+    # 액세스 토큰의 역할(role)/이름 클레임으로 DB 조회 없이 인증하므로 (accounts.authentication.ClaimsJWTAuthentication)
+    # 비활성화/역할 변경은 이미 발급된 액세스 토큰이 만료될 때까지, 즉 최대 ACCESS_TOKEN_LIFETIME(30분) 동안 반영되지 않음
+    # 재발급(TOKEN_REFRESH_SERIALIZER)은 DB 의 활성 여부와 역할을 다시 읽으므로 그 이후에는 반영됨
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': False,
@@ -132,8 +192,34 @@ SIMPLE_JWT = {
 
     'AUTH_HEADER_TYPES': ('Bearer',),
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
+    'TOKEN_OBTAIN_SERIALIZER': 'accounts.serializers.RoleTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'accounts.serializers.RoleTokenRefreshSerializer',
 }
 
+# 캐시
+# 운영에서는 'django.core.cache.backends.redis.RedisCache' (LOCATION: redis://...) 사용
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'dorolms',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    }
+}
+
+# 공지사항/강의 응답 캐시에 사용할 CACHES 별칭
+RESPONSE_CACHE_ALIAS = 'default'
+
+# 백그라운드 작업 큐 (알림 발송 등)
+# 테스트에서는 'config.tasks.InlineBackend' 로 즉시 실행
+TASK_QUEUE_BACKEND = 'config.tasks.ThreadBackend'
+
+# 실시간 푸시 pub/sub
+# 여러 프로세스로 운영할 때는 'communications.pubsub.RedisBackend'
+PUBSUB_BACKEND = 'communications.pubsub.InMemoryBackend'
+PUBSUB_REDIS_URL = 'redis://localhost:6379/0'
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
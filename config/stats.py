@@ -0,0 +1,136 @@
+import threading
+from collections import defaultdict
+
+# 지연 시간 히스토그램 버킷 (ms). 메모리 사용량이 요청 수와 무관하게 고정됨
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+MAX_FINGERPRINTS = 20
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.total += 1
+        self.sum += value
+
+    # 버킷 안에서 선형 보간한 백분위 추정값
+    def percentile(self, q):
+        if not self.total:
+            return 0.0
+        target = q * self.total
+        cumulative = 0
+        lower = 0.0
+        for i, count in enumerate(self.counts):
+            upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+            if count and cumulative + count >= target:
+                return lower + (upper - lower) * (target - cumulative) / count
+            cumulative += count
+            lower = upper
+        return float(self.buckets[-1])
+
+
+class RouteStats:
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.max_queries = 0
+        self.sql_ms = 0.0
+        self.n_plus_one_requests = 0
+        self.latency = Histogram()
+        self.duplicates = {}  # 반복 실행된 쿼리 지문 -> 발생 횟수 (상위 MAX_FINGERPRINTS 개만 유지)
+
+    def record(self, latency_ms, queries, sql_ms, duplicates):
+        self.requests += 1
+        self.queries += queries
+        self.max_queries = max(self.max_queries, queries)
+        self.sql_ms += sql_ms
+        self.latency.observe(latency_ms)
+        if duplicates:
+            self.n_plus_one_requests += 1
+            for fingerprint, count in duplicates.items():
+                self.duplicates[fingerprint] = self.duplicates.get(fingerprint, 0) + count
+            if len(self.duplicates) > MAX_FINGERPRINTS:
+                keep = sorted(self.duplicates.items(), key=lambda item: item[1], reverse=True)[:MAX_FINGERPRINTS]
+                self.duplicates = dict(keep)
+
+    def as_dict(self):
+        return {
+            'requests': self.requests,
+            'queries_avg': self.queries / self.requests if self.requests else 0,
+            'queries_max': self.max_queries,
+            'sql_ms_avg': self.sql_ms / self.requests if self.requests else 0,
+            'latency_ms': {
+                'p50': self.latency.percentile(0.5),
+                'p95': self.latency.percentile(0.95),
+                'p99': self.latency.percentile(0.99),
+            },
+            'n_plus_one_requests': self.n_plus_one_requests,
+            'duplicate_queries': [
+                {'sql': fingerprint, 'count': count}
+                for fingerprint, count in sorted(self.duplicates.items(), key=lambda item: item[1], reverse=True)
+            ],
+        }
+
+
+class RequestStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = defaultdict(RouteStats)
+
+    def record(self, route, latency_ms, queries, sql_ms, duplicates):
+        with self._lock:
+            self._routes[route].record(latency_ms, queries, sql_ms, duplicates)
+
+    def snapshot(self):
+        with self._lock:
+            return {route: stats.as_dict() for route, stats in sorted(self._routes.items())}
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+    # Prometheus 텍스트 형식
+    def prometheus(self):
+        lines = [
+            '# HELP dorolms_request_latency_ms Request latency in milliseconds.',
+            '# TYPE dorolms_request_latency_ms histogram',
+        ]
+        with self._lock:
+            routes = sorted(self._routes.items())
+            for route, stats in routes:
+                label = _escape(route)
+                cumulative = 0
+                for bound, count in zip(stats.latency.buckets, stats.latency.counts):
+                    cumulative += count
+                    lines.append(f'dorolms_request_latency_ms_bucket{{route="{label}",le="{bound}"}} {cumulative}')
+                lines.append(f'dorolms_request_latency_ms_bucket{{route="{label}",le="+Inf"}} {stats.latency.total}')
+                lines.append(f'dorolms_request_latency_ms_sum{{route="{label}"}} {stats.latency.sum}')
+                lines.append(f'dorolms_request_latency_ms_count{{route="{label}"}} {stats.latency.total}')
+
+            for name, help_text, attribute in (
+                ('dorolms_request_queries_total', 'SQL queries executed.', 'queries'),
+                ('dorolms_request_sql_ms_total', 'Time spent in SQL in milliseconds.', 'sql_ms'),
+                ('dorolms_request_n_plus_one_total', 'Requests with repeated identical queries.', 'n_plus_one_requests'),
+            ):
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} counter')
+                for route, stats in routes:
+                    lines.append(f'{name}{{route="{_escape(route)}"}} {getattr(stats, attribute)}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+request_stats = RequestStats()
@@ -0,0 +1,79 @@
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import close_old_connections, transaction
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+# 요청 처리 흐름 밖에서 실행할 작업 큐
+# 운영에서는 외부 워커로 교체할 수 있도록 settings.TASK_QUEUE_BACKEND 로 구현을 고른다
+
+
+# 즉시 실행 (테스트용)
+class InlineBackend:
+    def submit(self, func, args, kwargs):
+        func(*args, **kwargs)
+
+
+# 프로세스 내부 워커 스레드
+class ThreadBackend:
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def submit(self, func, args, kwargs):
+        self._ensure_worker()
+        self._queue.put((func, args, kwargs))
+
+    def join(self):
+        self._queue.join()
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='task-worker', daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            func, args, kwargs = self._queue.get()
+            close_old_connections()
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                logger.exception('작업 실패: %s', getattr(func, '__qualname__', func))
+            finally:
+                close_old_connections()
+                self._queue.task_done()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = import_string(settings.TASK_QUEUE_BACKEND)()
+        return _backend
+
+
+@receiver(setting_changed)
+def reset_backend(setting, **kwargs):
+    global _backend
+    if setting == 'TASK_QUEUE_BACKEND':
+        with _backend_lock:
+            _backend = None
+
+
+# 트랜잭션이 커밋된 뒤에 작업을 큐에 넣음 (롤백되면 실행되지 않음)
+def enqueue(func, *args, **kwargs):
+    transaction.on_commit(lambda: get_backend().submit(func, args, kwargs))
@@ -0,0 +1,158 @@
+import json
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from accounts.models import User
+from lectures.models import Lecture
+from .middleware import PrimaryPinMiddleware, QueryStatsMiddleware
+from .renderers import ORJSONRenderer
+from .routers import ReplicaReadMixin, is_pinned, pin_to_primary, read_from_replica
+from .stats import Histogram, request_stats
+
+# 로컬 SQLite 두 개로 primary/복제본 구성
+TWO_DATABASES = {
+    'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+    'replica': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+}
+
+
+# 쿼리는 실행하지 않고 라우터가 고른 별칭만 돌려줌
+class DatabaseView(ReplicaReadMixin, APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        return Response({'db': Lecture.objects.all().db})
+
+
+# 트랜잭션 안에서는 항상 primary 로 읽으므로 TestCase 대신 SimpleTestCase
+@override_settings(DATABASES=TWO_DATABASES, REPLICA_DATABASE_ALIAS='replica')
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User(id=1, username='instructor', role=User.Role.INSTRUCTOR)
+
+    def get(self, user=None):
+        request = APIRequestFactory().get('/')
+        if user is not None:
+            force_authenticate(request, user=user)
+        return DatabaseView.as_view()(request).data['db']
+
+    def test_reads_use_replica_only_when_requested(self):
+        self.assertEqual(Lecture.objects.all().db, 'default')
+        with read_from_replica():
+            self.assertEqual(Lecture.objects.all().db, 'replica')
+        self.assertEqual(Lecture.objects.all().db, 'default')
+
+    def test_writes_use_primary(self):
+        with read_from_replica():
+            self.assertEqual(Lecture.objects.all().select_for_update().db, 'default')
+
+    def test_list_view_reads_from_replica(self):
+        self.assertEqual(self.get(), 'replica')
+        self.assertEqual(self.get(self.user), 'replica')
+        # 요청이 끝나면 원래대로
+        self.assertEqual(Lecture.objects.all().db, 'default')
+
+    def test_user_reads_own_writes_from_primary(self):
+        pin_to_primary(self.user.id)
+        self.assertEqual(self.get(self.user), 'default')
+        self.assertEqual(self.get(User(id=2, username='other')), 'replica')
+
+    def test_successful_write_pins_user(self):
+        middleware = PrimaryPinMiddleware(lambda request: HttpResponse(status=201))
+        request = RequestFactory().post('/')
+        request.user = self.user
+        middleware(request)
+        self.assertTrue(is_pinned(self.user.id))
+
+    def test_failed_write_or_read_does_not_pin(self):
+        for method, status in (('post', 400), ('get', 200)):
+            middleware = PrimaryPinMiddleware(lambda request, status=status: HttpResponse(status=status))
+            request = getattr(RequestFactory(), method)('/')
+            request.user = self.user
+            middleware(request)
+        self.assertFalse(is_pinned(self.user.id))
+
+    @override_settings(DATABASES={'default': TWO_DATABASES['default']})
+    def test_without_replica_everything_uses_primary(self):
+        with read_from_replica():
+            self.assertEqual(Lecture.objects.all().db, 'default')
+        self.assertEqual(self.get(), 'default')
+
+
+# orjson 렌더러는 DRF JSONRenderer 와 같은 JSON 을 만들어야 함
+class ORJSONRendererTests(SimpleTestCase):
+    def test_matches_json_renderer(self):
+        data = {
+            'created_at': timezone.now(),
+            'date': timezone.localdate(),
+            'fee': Decimal('1.50'),
+            'label': gettext_lazy('강의'),
+            1: [None, True, '배정완료'],
+        }
+        self.assertEqual(json.loads(ORJSONRenderer().render(data)), json.loads(JSONRenderer().render(data)))
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+
+# 요청별 쿼리 수/반복 쿼리 기록과 Server-Timing 헤더 노출 조건
+@override_settings(N_PLUS_ONE_THRESHOLD=3, DEBUG=False, SERVER_TIMING_HEADER=False)
+class QueryStatsMiddlewareTests(TestCase):
+    def setUp(self):
+        request_stats.reset()
+        self.addCleanup(request_stats.reset)
+
+    def view(self, request):
+        for user_id in range(4):
+            User.objects.filter(id=user_id).exists()
+        User.objects.count()
+        return HttpResponse()
+
+    def call(self, user=None):
+        request = RequestFactory().get('/')
+        if user is not None:
+            request.user = user
+        return QueryStatsMiddleware(self.view)(request)
+
+    def test_records_query_counts_and_repeated_queries(self):
+        self.call()
+        self.call()
+
+        stats = request_stats.snapshot()['GET <unresolved>']
+        self.assertEqual((stats['requests'], stats['queries_avg'], stats['queries_max']), (2, 5, 5))
+        self.assertEqual(stats['n_plus_one_requests'], 2)
+        self.assertEqual([query['count'] for query in stats['duplicate_queries']], [8])
+        self.assertIn('dorolms_request_queries_total{route="GET <unresolved>"} 10', request_stats.prometheus())
+
+    def test_server_timing_only_for_debug_staff_or_setting(self):
+        self.assertNotIn('Server-Timing', self.call())
+        self.assertNotIn('Server-Timing', self.call(User(id=1, username='instructor')))
+        self.assertIn('5 queries', self.call(User(id=2, username='admin', is_staff=True))['Server-Timing'])
+        with self.settings(DEBUG=True):
+            self.assertIn('Server-Timing', self.call())
+        with self.settings(SERVER_TIMING_HEADER=True):
+            self.assertIn('Server-Timing', self.call())
+
+
+class HistogramTests(SimpleTestCase):
+    def test_buckets_and_percentiles(self):
+        histogram = Histogram(buckets=(10, 100))
+        for value in (1, 5, 50, 500):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual((histogram.total, histogram.sum), (4, 556))
+        self.assertEqual(histogram.percentile(0.5), 10)
+        self.assertEqual(histogram.percentile(0.75), 100)
+        # 마지막(+Inf) 버킷은 가장 큰 경계값으로 추정
+        self.assertEqual(histogram.percentile(1), 100)
+        self.assertEqual(Histogram().percentile(0.5), 0.0)
@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.urls import path, include
 
+from . import views
+
 urlpatterns = [
     path('admin/', admin.site.urls),
 
@@ -8,4 +10,11 @@ urlpatterns = [
     path('api/announcements/', include('announcements.urls')),
     path('api/communications/', include('communications.urls')),
     path('api/lectures/', include('lectures.urls')),
+    path('api/search/', include('search.urls')),
+    path('api/dashboard/', include('dashboard.urls')),
+    path('api/sync/', include('sync.urls')),
+
+    path('api/metrics/cache/', views.CacheStatsView.as_view(), name='cache-stats'),
+    path('api/metrics/requests/', views.RequestStatsView.as_view(), name='request-stats'),
+    path('api/metrics/prometheus/', views.PrometheusMetricsView.as_view(), name='prometheus-metrics'),
 ]
\ No newline at end of file
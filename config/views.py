@@ -0,0 +1,42 @@
+from django.http import HttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from . import cache
+from .stats import request_stats
+
+
+# 응답 캐시 적중/미스 지표 (스태프 전용)
+# GET /api/metrics/cache/
+class CacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        stats = cache.metrics.snapshot()
+        for counts in stats.values():
+            total = counts['hits'] + counts['misses']
+            counts['hit_rate'] = counts['hits'] / total if total else 0.0
+        return Response(stats)
+
+
+# URL 패턴별 쿼리/지연 시간 통계 (스태프 전용)
+# GET /api/metrics/requests/ , DELETE 로 초기화
+class RequestStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(request_stats.snapshot())
+
+    def delete(self, request):
+        request_stats.reset()
+        return Response(status=204)
+
+
+# Prometheus 수집용 텍스트 형식 (스태프 전용)
+# GET /api/metrics/prometheus/
+class PrometheusMetricsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(request_stats.prometheus(), content_type='text/plain; version=0.0.4')
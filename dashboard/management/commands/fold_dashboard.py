@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from dashboard.stats import FOLD_BATCH_SIZE, fold
+
+
+# 지원/배정 때 쌓인 대시보드 증감 기록을 집계 행에 합침 (cron 등으로 1분마다)
+# 합치기 전에도 대시보드 응답은 증감 기록을 더해 계산하므로 값은 항상 최신
+class Command(BaseCommand):
+    help = '대시보드 증감 기록을 집계에 합칩니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=FOLD_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        folded = fold(batch_size=options['batch_size'])
+        self.stdout.write(f'증감 기록 {folded}건 반영')
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from dashboard.stats import rebuild
+
+
+class Command(BaseCommand):
+    help = '매니저 대시보드 집계를 원본 테이블에서 처음부터 다시 계산합니다.'
+
+    def handle(self, *args, **options):
+        counters, days = rebuild()
+        self.stdout.write(self.style.SUCCESS(f'집계 키 {counters}개, 날짜 {days}개를 다시 만들었습니다.'))
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:07
+
+from collections import Counter
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+# 기존 강의/모집 정보/지원서로 집계를 채움 (dashboard.stats.compute 와 같은 키)
+def backfill_counters(apps, schema_editor):
+    Lecture = apps.get_model('lectures', 'Lecture')
+    LectureRecruitment = apps.get_model('lectures', 'LectureRecruitment')
+    Application = apps.get_model('lectures', 'Application')
+    DashboardCounter = apps.get_model('dashboard', 'DashboardCounter')
+    DailyApplicationCount = apps.get_model('dashboard', 'DailyApplicationCount')
+
+    counts = Counter()
+    for row in Lecture.objects.order_by().values('status', 'type').annotate(count=Count('id')):
+        counts['lectures'] += row['count']
+        counts[f"lectures:status:{row['status']}"] += row['count']
+        counts[f"lectures:type:{row['type'] or 'none'}"] += row['count']
+
+    rows = Application.objects.order_by().values('assignment_status', 'assigned_role').annotate(count=Count('id'))
+    for row in rows:
+        counts[f"applications:status:{row['assignment_status']}"] += row['count']
+        if row['assignment_status'] == 'assigned' and row['assigned_role']:
+            counts[f"applications:assigned:{row['assigned_role']}"] += row['count']
+
+    needed = LectureRecruitment.objects.aggregate(
+        main=Sum('recruitment_main_needed'),
+        assist=Sum('recruitment_assist_needed'),
+    )
+    counts['recruitment:needed:main'] += needed['main'] or 0
+    counts['recruitment:needed:assist'] += needed['assist'] or 0
+
+    DashboardCounter.objects.bulk_create(
+        [DashboardCounter(key=key, value=value) for key, value in counts.items() if value]
+    )
+
+    rows = (
+        Application.objects
+        .annotate(date=TruncDate('applied_at'))
+        .order_by()
+        .values('date')
+        .annotate(count=Count('id'))
+    )
+    DailyApplicationCount.objects.bulk_create(
+        [DailyApplicationCount(date=row['date'], count=row['count']) for row in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('lectures', '0005_application_lecture_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyApplicationCount',
+            fields=[
+                ('date', models.DateField(primary_key=True, serialize=False, verbose_name='날짜')),
+                ('count', models.IntegerField(default=0, verbose_name='지원 수')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DashboardCounter',
+            fields=[
+                ('key', models.CharField(max_length=100, primary_key=True, serialize=False, verbose_name='집계 키')),
+                ('value', models.BigIntegerField(default=0, verbose_name='값')),
+            ],
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_dashboard_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardDelta',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('key', models.CharField(max_length=100, verbose_name='집계 키')),
+                ('value', models.BigIntegerField(verbose_name='증감량')),
+            ],
+        ),
+    ]
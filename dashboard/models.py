@@ -0,0 +1,35 @@
+from django.db import models
+
+
+# DashboardCounter
+# 매니저 대시보드 집계 값 (키 하나당 한 행)
+# 원본(강의/모집 정보/지원서)이 바뀔 때 증감으로 유지하고, rebuild_dashboard 로 처음부터 다시 계산
+class DashboardCounter(models.Model):
+    key = models.CharField('집계 키', max_length=100, primary_key=True)
+    value = models.BigIntegerField('값', default=0)
+
+    def __str__(self):
+        return f"{self.key} = {self.value}"
+
+
+# DailyApplicationCount
+# 날짜별 지원 수 (지원 일시의 현지 날짜 기준)
+class DailyApplicationCount(models.Model):
+    date = models.DateField('날짜', primary_key=True)
+    count = models.IntegerField('지원 수', default=0)
+
+    def __str__(self):
+        return f"{self.date}: {self.count}"
+
+
+# DashboardDelta
+# 집계 증감 기록 (추가만 함)
+# 지원/배정 트랜잭션은 이 행을 INSERT 만 하므로 집계 행을 잠그지 않고, stats.fold 가 주기적으로 집계 행에 합침
+# 날짜별 지원 수는 key 를 'day:YYYY-MM-DD' 로 기록
+class DashboardDelta(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    key = models.CharField('집계 키', max_length=100)
+    value = models.BigIntegerField('증감량')
+
+    def __str__(self):
+        return f"{self.key} {self.value:+d}"
@@ -0,0 +1,5 @@
+from rest_framework import serializers
+
+
+class DashboardQuerySerializer(serializers.Serializer):
+    days = serializers.IntegerField(min_value=1, max_value=366, default=30)
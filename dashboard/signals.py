@@ -0,0 +1,75 @@
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+
+from lectures.models import Lecture, LectureRecruitment, Application
+from . import stats
+
+# 모델별 (집계에 쓰이는 필드, 증감량 함수)
+TRACKED = {
+    Lecture: (('status', 'type'), stats.lecture_deltas),
+    LectureRecruitment: (('recruitment_main_needed', 'recruitment_assist_needed'), stats.recruitment_deltas),
+    Application: (('assignment_status', 'assigned_role'), stats.application_deltas),
+}
+
+
+def _values(instance):
+    fields, _ = TRACKED[type(instance)]
+    return tuple(getattr(instance, field) for field in fields)
+
+
+# 수정 저장 전에 집계 필드의 이전 값을 읽어 둠
+# update_fields 에 집계 필드가 없거나, 읽어 온 뒤 집계 필드를 바꾸지 않았으면 조회하지 않음
+# (바뀐 경우에는 메모리 값이 오래됐을 수 있으므로 DB 값을 읽음)
+@receiver(pre_save, sender=Lecture)
+@receiver(pre_save, sender=LectureRecruitment)
+@receiver(pre_save, sender=Application)
+def remember_previous(sender, instance, update_fields=None, **kwargs):
+    instance._dashboard_previous = None
+    fields, _ = TRACKED[sender]
+    if instance._state.adding or (update_fields is not None and not set(fields) & set(update_fields)):
+        return
+    if not instance.has_changed(fields):
+        return
+    instance._dashboard_previous = sender.objects.filter(pk=instance.pk).values_list(*fields).first()
+
+
+@receiver(post_save, sender=Lecture)
+@receiver(post_save, sender=LectureRecruitment)
+@receiver(post_save, sender=Application)
+def update_on_save(sender, instance, created, **kwargs):
+    _, deltas_func = TRACKED[sender]
+    days = None
+    if created:
+        deltas = deltas_func(*_values(instance))
+        if sender is Application:
+            days = {stats.application_day(instance.applied_at): 1}
+    else:
+        previous = getattr(instance, '_dashboard_previous', None)
+        if previous is None or previous == _values(instance):
+            return
+        deltas = stats.changed(deltas_func, previous, _values(instance))
+    stats.apply(deltas, days)
+
+
+# 직접 삭제하는 인스턴스는 메모리 값이 오래됐을 수 있어 DB 값을 읽어 둠
+# (연쇄 삭제되는 행은 Django 가 DB 에서 새로 읽어 오므로 origin 이 자기 자신일 때만)
+@receiver(pre_delete, sender=Lecture)
+@receiver(pre_delete, sender=LectureRecruitment)
+@receiver(pre_delete, sender=Application)
+def remember_deleted(sender, instance, origin=None, **kwargs):
+    instance._dashboard_previous = None
+    if origin is instance:
+        fields, _ = TRACKED[sender]
+        instance._dashboard_previous = sender.objects.filter(pk=instance.pk).values_list(*fields).first()
+
+
+@receiver(post_delete, sender=Lecture)
+@receiver(post_delete, sender=LectureRecruitment)
+@receiver(post_delete, sender=Application)
+def update_on_delete(sender, instance, **kwargs):
+    _, deltas_func = TRACKED[sender]
+    days = None
+    if sender is Application:
+        days = {stats.application_day(instance.applied_at): -1}
+    values = getattr(instance, '_dashboard_previous', None) or _values(instance)
+    stats.apply(deltas_func(*values, amount=-1), days)
@@ -0,0 +1,235 @@
+from collections import Counter
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from lectures.models import Lecture, LectureRecruitment, Application
+from .models import DashboardCounter, DailyApplicationCount, DashboardDelta
+
+LECTURES_TOTAL = 'lectures'
+DAY_PREFIX = 'day:'
+FOLD_BATCH_SIZE = 10000
+NO_TYPE = 'none'
+ROLES = Application.LectureRole.values
+
+
+def lecture_status_key(status):
+    return f'lectures:status:{status}'
+
+
+def lecture_type_key(lecture_type):
+    return f'lectures:type:{lecture_type or NO_TYPE}'
+
+
+def application_status_key(status):
+    return f'applications:status:{status}'
+
+
+def assigned_role_key(role):
+    return f'applications:assigned:{role}'
+
+
+def needed_key(role):
+    return f'recruitment:needed:{role}'
+
+
+# 증감량 계산 (amount 가 음수면 차감)
+# 여러 변경을 합칠 때는 음수가 사라지지 않도록 Counter.update 를 사용 (+ 연산은 음수를 버림)
+def lecture_deltas(status, lecture_type, amount=1):
+    return Counter({
+        LECTURES_TOTAL: amount,
+        lecture_status_key(status): amount,
+        lecture_type_key(lecture_type): amount,
+    })
+
+
+def application_deltas(assignment_status, assigned_role, amount=1):
+    deltas = Counter({application_status_key(assignment_status): amount})
+    if assignment_status == Application.AssignmentStatus.ASSIGNED and assigned_role:
+        deltas[assigned_role_key(assigned_role)] += amount
+    return deltas
+
+
+def recruitment_deltas(main_needed, assist_needed, amount=1):
+    return Counter({
+        needed_key(Application.LectureRole.MAIN): (main_needed or 0) * amount,
+        needed_key(Application.LectureRole.ASSIST): (assist_needed or 0) * amount,
+    })
+
+
+# 이전 값 → 새 값 변경분
+def changed(deltas_func, before, after):
+    deltas = deltas_func(*before, amount=-1)
+    deltas.update(deltas_func(*after))
+    return deltas
+
+
+def application_day(applied_at):
+    return timezone.localdate(applied_at)
+
+
+def _day_key(day):
+    return f'{DAY_PREFIX}{day.isoformat()}'
+
+
+# {키: 증감량}, {날짜: 증감량} 을 증감 기록으로 INSERT (집계 행은 잠그지 않음)
+# 원본 변경과 같은 트랜잭션에서 호출해야 집계가 어긋나지 않음
+def apply(deltas=None, days=None):
+    rows = [DashboardDelta(key=key, value=amount) for key, amount in (deltas or {}).items() if amount]
+    rows += [DashboardDelta(key=_day_key(day), value=amount) for day, amount in (days or {}).items() if amount]
+    if rows:
+        DashboardDelta.objects.bulk_create(rows)
+
+
+# 키 순서대로 한 행씩 증감 (어떤 트랜잭션도 같은 순서로 잠그므로 교착 상태가 생기지 않음)
+def _increment(model, field, deltas):
+    keys = sorted(key for key, amount in deltas.items() if amount)
+    if not keys:
+        return
+    model.objects.bulk_create([model(pk=key) for key in keys], ignore_conflicts=True)
+    for key in keys:
+        model.objects.filter(pk=key).update(**{field: F(field) + deltas[key]})
+
+
+# 쌓인 증감 기록을 집계 행에 합치고 삭제 (fold_dashboard 명령으로 주기적으로 실행)
+# 다른 fold 가 잡고 있는 기록은 건너뛰므로 동시에 실행해도 두 번 더해지지 않음
+def fold(batch_size=FOLD_BATCH_SIZE):
+    folded = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                DashboardDelta.objects
+                .select_for_update(skip_locked=True)
+                .order_by('id')
+                .values_list('id', 'key', 'value')[:batch_size]
+            )
+            if not rows:
+                return folded
+            deltas = Counter()
+            days = Counter()
+            for _, key, value in rows:
+                if key.startswith(DAY_PREFIX):
+                    days[date.fromisoformat(key[len(DAY_PREFIX):])] += value
+                else:
+                    deltas[key] += value
+            _increment(DashboardCounter, 'value', deltas)
+            _increment(DailyApplicationCount, 'count', days)
+            DashboardDelta.objects.filter(id__in=[row[0] for row in rows]).delete()
+        folded += len(rows)
+
+
+# 현재 집계 값 ({키: 값}, {날짜: 지원 수})
+# 집계 행과 아직 합치지 않은 증감 기록을 한 쿼리(UNION ALL)로 읽어 fold 와 겹쳐도 같은 시점의 값
+def current(since=None, until=None):
+    pending = DashboardDelta.objects.order_by().values('key').annotate(total=Sum('value')).values_list('key', 'total')
+    values = Counter()
+    rows = DashboardCounter.objects.order_by().values_list('key', 'value').union(pending, all=True)
+    for key, value in rows:
+        values[key] += value
+
+    days = Counter()
+    for key, value in list(values.items()):
+        if key.startswith(DAY_PREFIX):
+            del values[key]
+            days[date.fromisoformat(key[len(DAY_PREFIX):])] += value
+    daily = DailyApplicationCount.objects.all()
+    if since is not None:
+        daily = daily.filter(date__gte=since)
+    if until is not None:
+        daily = daily.filter(date__lte=until)
+    for day, count in daily.values_list('date', 'count'):
+        days[day] += count
+    return values, days
+
+
+# 원본 테이블에서 집계를 처음부터 다시 계산
+def compute():
+    counts = Counter()
+    rows = Lecture.objects.order_by().values('status', 'type').annotate(count=Count('id'))
+    for row in rows:
+        counts.update(lecture_deltas(row['status'], row['type'], row['count']))
+
+    rows = Application.objects.order_by().values('assignment_status', 'assigned_role').annotate(count=Count('id'))
+    for row in rows:
+        counts.update(application_deltas(row['assignment_status'], row['assigned_role'], row['count']))
+
+    needed = LectureRecruitment.objects.aggregate(
+        main=Sum('recruitment_main_needed'),
+        assist=Sum('recruitment_assist_needed'),
+    )
+    counts.update(recruitment_deltas(needed['main'], needed['assist']))
+
+    rows = (
+        Application.objects
+        .annotate(date=TruncDate('applied_at'))
+        .order_by()
+        .values('date')
+        .annotate(count=Count('id'))
+    )
+    days = {row['date']: row['count'] for row in rows}
+    return counts, days
+
+
+def rebuild():
+    with transaction.atomic():
+        counts, days = compute()
+        DashboardDelta.objects.all().delete()
+        DashboardCounter.objects.all().delete()
+        DailyApplicationCount.objects.all().delete()
+        DashboardCounter.objects.bulk_create(
+            [DashboardCounter(key=key, value=value) for key, value in counts.items() if value]
+        )
+        DailyApplicationCount.objects.bulk_create(
+            [DailyApplicationCount(date=day, count=count) for day, count in days.items()],
+            batch_size=1000,
+        )
+    return len(counts), len(days)
+
+
+def _rate(assigned, needed):
+    return round(assigned / needed, 4) if needed else None
+
+
+# 대시보드 응답: 집계 테이블(+ 합치지 않은 증감 기록) 조회 두 번
+def get_dashboard(days=30):
+    today = timezone.localdate()
+    since = today - timedelta(days=days - 1)
+    values, daily = current(since, today)
+
+    fill_rate = {}
+    for role in ROLES:
+        needed = values.get(needed_key(role), 0)
+        assigned = values.get(assigned_role_key(role), 0)
+        fill_rate[role] = {'needed': needed, 'assigned': assigned, 'rate': _rate(assigned, needed)}
+    needed = sum(fill_rate[role]['needed'] for role in ROLES)
+    assigned = sum(fill_rate[role]['assigned'] for role in ROLES)
+    fill_rate['total'] = {'needed': needed, 'assigned': assigned, 'rate': _rate(assigned, needed)}
+
+    return {
+        'lectures': {
+            'total': values.get(LECTURES_TOTAL, 0),
+            'by_status': {
+                status: values.get(lecture_status_key(status), 0)
+                for status in Lecture.LectureStatus.values
+            },
+            'by_type': {
+                lecture_type: values.get(lecture_type_key(lecture_type), 0)
+                for lecture_type in Lecture.LectureType.values + [NO_TYPE]
+            },
+        },
+        'applications': {
+            'by_status': {
+                status: values.get(application_status_key(status), 0)
+                for status in Application.AssignmentStatus.values
+            },
+            'pending': values.get(application_status_key(Application.AssignmentStatus.PENDING), 0),
+        },
+        'fill_rate': fill_rate,
+        'applications_per_day': [
+            {'date': date, 'count': daily.get(date, 0)}
+            for date in (since + timedelta(days=offset) for offset in range(days))
+        ],
+    }
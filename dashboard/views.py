@@ -0,0 +1,18 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accounts.permissions import IsManager
+from .serializers import DashboardQuerySerializer
+from .stats import get_dashboard
+
+
+# 매니저 대시보드 (집계 테이블에서 조회)
+# GET /api/dashboard/?days=30
+class DashboardView(APIView):
+    permission_classes = [IsAuthenticated, IsManager]
+
+    def get(self, request):
+        params = DashboardQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        return Response(get_dashboard(days=params.validated_data['days']))
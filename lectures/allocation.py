@@ -0,0 +1,187 @@
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.notifications import enqueue_allocation_results
+from communications.pubsub import publish_to_users
+from config.tasks import enqueue
+from dashboard import stats as dashboard_stats
+from sync.changes import Kind, record_user_changes
+from .intervals import InstructorSchedule
+from .models import Lecture, LectureRecruitment, Application
+from .recommendations import refresh_features
+from .schedules import load_schedule, sync_slots
+from .signals import lectures_bulk_changed
+
+
+@dataclass
+class AllocationResult:
+    allocated_lecture_ids: list = field(default_factory=list)
+    skipped_lecture_ids: list = field(default_factory=list)
+    assigned_count: int = 0
+    rejected_count: int = 0
+
+    def as_dict(self):
+        return {
+            'allocated_lecture_ids': self.allocated_lecture_ids,
+            'skipped_lecture_ids': self.skipped_lecture_ids,
+            'assigned_count': self.assigned_count,
+            'rejected_count': self.rejected_count,
+        }
+
+
+# 배정 중(ALLOCATING) 강의들의 대기 지원서를 한 번에 배정
+# - 강의 시작 시각 순으로, 지원 시각이 빠른 지원서부터 필요 인원만큼 배정
+# - 이미 배정된 강의와 시간이 겹치는 강사는 배정하지 않음
+# - 지원서는 bulk_update 한 번, 강의 상태는 UPDATE 한 번으로 반영
+# - 결과는 커밋 후 실시간 푸시, 알림은 작업 큐에서 발송
+def allocate_lectures(lecture_ids):
+    result = AllocationResult()
+
+    with transaction.atomic():
+        lectures = list(
+            Lecture.objects
+            .select_for_update()
+            .filter(id__in=lecture_ids, status=Lecture.LectureStatus.ALLOCATING)
+            .order_by('lecture_start_datetime', 'id')
+        )
+        recruitments = LectureRecruitment.objects.in_bulk([lecture.id for lecture in lectures])
+
+        targets = []
+        for lecture in lectures:
+            if lecture.id in recruitments:
+                targets.append(lecture)
+            else:
+                # 모집 정보가 없으면 필요 인원을 알 수 없음
+                result.skipped_lecture_ids.append(lecture.id)
+        target_ids = [lecture.id for lecture in targets]
+
+        pending_by_lecture = defaultdict(list)
+        pending = (
+            Application.objects
+            .select_for_update()
+            .filter(lecture_id__in=target_ids, assignment_status=Application.AssignmentStatus.PENDING)
+            .order_by('applied_at', 'id')
+        )
+        for application in pending:
+            pending_by_lecture[application.lecture_id].append(application)
+
+        applicant_ids = {
+            application.user_id
+            for applications in pending_by_lecture.values()
+            for application in applications
+        }
+
+        # 대상 강의들에 이미 배정된 인원
+        filled = defaultdict(int)
+        assigned_users = defaultdict(set)
+        filled_rows = (
+            Application.objects
+            .filter(lecture_id__in=target_ids, assignment_status=Application.AssignmentStatus.ASSIGNED)
+            .values_list('lecture_id', 'user_id', 'assigned_role')
+        )
+        for lecture_id, user_id, role in filled_rows:
+            filled[(lecture_id, role)] += 1
+            assigned_users[lecture_id].add(user_id)
+
+        # 지원자들의 배정 시간대 중 대상 강의 기간에 걸치는 구간만 한 번에 조회 (schedules.load_schedule)
+        starts = [lecture.lecture_start_datetime for lecture in targets if lecture.lecture_start_datetime]
+        ends = [lecture.lecture_end_datetime for lecture in targets if lecture.lecture_end_datetime]
+        if starts and ends:
+            schedule = load_schedule(applicant_ids, min(starts), max(ends))
+        else:
+            schedule = InstructorSchedule()
+
+        changed = []
+        for lecture in targets:
+            recruitment = recruitments[lecture.id]
+            remaining = {
+                Application.LectureRole.MAIN:
+                    recruitment.recruitment_main_needed - filled[(lecture.id, Application.LectureRole.MAIN)],
+                Application.LectureRole.ASSIST:
+                    recruitment.recruitment_assist_needed - filled[(lecture.id, Application.LectureRole.ASSIST)],
+            }
+
+            # 주강사 지원서를 먼저 처리
+            applications = sorted(
+                pending_by_lecture[lecture.id],
+                key=lambda application: application.applied_role != Application.LectureRole.MAIN,
+            )
+            for application in applications:
+                role = application.applied_role
+                available = (
+                    remaining[role] > 0
+                    and application.user_id not in assigned_users[lecture.id]
+                    and not schedule.conflicts(
+                        application.user_id,
+                        lecture.lecture_start_datetime,
+                        lecture.lecture_end_datetime,
+                    )
+                )
+                if available:
+                    application.assignment_status = Application.AssignmentStatus.ASSIGNED
+                    application.assigned_role = role
+                    remaining[role] -= 1
+                    assigned_users[lecture.id].add(application.user_id)
+                    schedule.add(application.user_id, lecture.lecture_start_datetime, lecture.lecture_end_datetime)
+                    result.assigned_count += 1
+                else:
+                    application.assignment_status = Application.AssignmentStatus.REJECTED
+                    application.assigned_role = None
+                    result.rejected_count += 1
+                changed.append(application)
+
+            result.allocated_lecture_ids.append(lecture.id)
+
+        now = timezone.now()
+        for application in changed:
+            application.updated_at = now
+        Application.objects.bulk_update(changed, ['assignment_status', 'assigned_role', 'updated_at'], batch_size=1000)
+        record_user_changes(Kind.APPLICATION, [(application.id, application.user_id) for application in changed])
+        # 새 배정의 시간대 기록 (PostgreSQL 에서는 동시에 겹치는 배정이 들어오면 배제 제약으로 전체 롤백)
+        sync_slots(application_ids=[
+            application.id for application in changed
+            if application.assignment_status == Application.AssignmentStatus.ASSIGNED
+        ])
+        Lecture.objects.filter(id__in=result.allocated_lecture_ids).update(
+            status=Lecture.LectureStatus.COMPLETED, updated_at=now,
+        )
+        lectures_bulk_changed.send(sender=Lecture, lecture_ids=result.allocated_lecture_ids)
+
+        # bulk_update/update 는 시그널이 없으므로 대시보드 집계를 직접 반영
+        deltas = Counter()
+        for application in changed:
+            deltas.update(dashboard_stats.changed(
+                dashboard_stats.application_deltas,
+                (Application.AssignmentStatus.PENDING, None),
+                (application.assignment_status, application.assigned_role),
+            ))
+        for lecture in targets:
+            deltas.update(dashboard_stats.changed(
+                dashboard_stats.lecture_deltas,
+                (Lecture.LectureStatus.ALLOCATING, lecture.type),
+                (Lecture.LectureStatus.COMPLETED, lecture.type),
+            ))
+        dashboard_stats.apply(deltas)
+
+        # 커밋 후 지원자들에게 배정 결과 푸시 및 알림 (이벤트 생성/큐 등록도 잠금을 푼 뒤에)
+        transaction.on_commit(lambda: _publish_results(changed, result.allocated_lecture_ids, applicant_ids))
+
+    return result
+
+
+# 배정 결과 실시간 푸시 + 알림/추천 특징 갱신 작업 등록 (커밋 후 실행)
+def _publish_results(applications, lecture_ids, applicant_ids):
+    publish_to_users(
+        (application.user_id, 'assignment', {
+            'application': application.id,
+            'lecture': application.lecture_id,
+            'assignment_status': application.assignment_status,
+            'assigned_role': application.assigned_role,
+        })
+        for application in applications
+    )
+    enqueue_allocation_results(lecture_ids)
+    enqueue(refresh_features, list(applicant_ids))
@@ -0,0 +1,171 @@
+from django.db import connection, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from accounts.models import User
+from config.tasks import enqueue
+from dashboard import stats as dashboard_stats
+from sync.changes import Kind, record_changes, record_user_changes
+from .caching import invalidate_lecture_list
+from .models import Lecture, LectureRecruitment, Application, PortfolioSnapshot
+from .recommendations import refresh_features
+from .schedules import busy_lecture_ids
+
+
+class ApplicationClosed(Exception):
+    pass
+
+
+class ApplicationFull(Exception):
+    pass
+
+
+class IdempotencyKeyReused(Exception):
+    pass
+
+
+class ScheduleConflict(Exception):
+    pass
+
+
+# 모집 기간 안이고 모집중인 강의의 정원에 한 자리를 잡음 (UPDATE 한 번, 강의 행은 잠그지 않음)
+# 모집 인원이 비어 있으면 정원 제한 없음
+# 정원 조건은 반드시 UPDATE 대상 행에 직접 걸어야 함: lecture__status 처럼 조인하면 Django 가
+# "id IN (SELECT ... 조인)" 으로 바꾸는데, READ COMMITTED 에서 행 잠금을 기다린 UPDATE 는 대상 행만
+# 새 버전으로 다시 검사하고 서브쿼리 안의 applicant_count 는 처음 스냅샷 값을 써서 정원을 넘길 수 있음
+# 그래서 강의 상태는 강의 PK 만 돌려주는 서브쿼리로 확인
+def _reserve_seat(lecture_id, today):
+    recruiting = Lecture.objects.filter(id=lecture_id, status=Lecture.LectureStatus.RECRUITING).values('id')
+    return (
+        LectureRecruitment.objects
+        .filter(lecture_id__in=recruiting)
+        .filter(Q(application_start_date__isnull=True) | Q(application_start_date__lte=today))
+        .filter(Q(application_end_date__isnull=True) | Q(application_end_date__gte=today))
+        .filter(Q(max_participants__isnull=True) | Q(applicant_count__lt=F('max_participants')))
+        .update(applicant_count=F('applicant_count') + 1)
+    ) == 1
+
+
+def release_seats(lecture_id, amount=1):
+    LectureRecruitment.objects.filter(lecture_id=lecture_id).update(
+        applicant_count=Greatest(F('applicant_count') - amount, Value(0))
+    )
+
+
+# 자리를 잡지 못한 이유
+def _rejection(lecture_id, today):
+    recruitment = (
+        LectureRecruitment.objects
+        .select_related('lecture')
+        .filter(lecture_id=lecture_id)
+        .first()
+    )
+    if recruitment is None or recruitment.lecture.status != Lecture.LectureStatus.RECRUITING:
+        return ApplicationClosed('모집중인 강의가 아닙니다.')
+    if recruitment.application_start_date and today < recruitment.application_start_date:
+        return ApplicationClosed('아직 모집 기간이 아닙니다.')
+    if recruitment.application_end_date and today > recruitment.application_end_date:
+        return ApplicationClosed('모집 기간이 끝났습니다.')
+    return ApplicationFull('모집 인원이 마감되었습니다.')
+
+
+# INSERT ... ON CONFLICT DO NOTHING RETURNING id
+# (lecture, user, applied_role) 또는 (user, idempotency_key) 가 이미 있으면 None
+# PostgreSQL, SQLite 3.35+ 모두 지원하는 구문
+def _insert_or_nothing(values):
+    fields = [Application._meta.get_field(name) for name in values]
+    quote = connection.ops.quote_name
+    sql = 'INSERT INTO {table} ({columns}) VALUES ({params}) ON CONFLICT DO NOTHING RETURNING {pk}'.format(
+        table=quote(Application._meta.db_table),
+        columns=', '.join(quote(field.column) for field in fields),
+        params=', '.join(['%s'] * len(fields)),
+        pk=quote(Application._meta.pk.column),
+    )
+    params = [field.get_db_prep_save(value, connection) for field, value in zip(fields, values.values())]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def _existing(user_id, lecture_id, applied_role, idempotency_key):
+    if idempotency_key:
+        application = Application.objects.filter(user_id=user_id, idempotency_key=idempotency_key).first()
+        if application is not None:
+            if (application.lecture_id, application.applied_role) != (lecture_id, applied_role):
+                raise IdempotencyKeyReused('같은 멱등 키로 다른 지원이 이미 접수되었습니다.')
+            return application
+    return Application.objects.filter(user_id=user_id, lecture_id=lecture_id, applied_role=applied_role).first()
+
+
+# 강사 지원 접수
+# - 같은 멱등 키/같은 (강의, 역할) 재요청은 기존 지원서를 그대로 돌려줌 (created=False)
+# - 중복 INSERT 는 예외 없이 무시하고, 새로 들어간 지원서만 applicant_count 조건부 UPDATE 로 정원을 확보
+#   (자리가 없으면 INSERT 까지 롤백)
+# - 이미 배정된 강의와 시간이 겹치는 강사는 ScheduleConflict
+# - raw INSERT 는 post_save 를 보내지 않으므로 대시보드 집계/추천 특징/동기화 변경 기록/목록 캐시 무효화는 직접 반영
+# 반환: (application, created)
+def submit_application(user_id, lecture_id, applied_role, idempotency_key=None):
+    application = _existing(user_id, lecture_id, applied_role, idempotency_key)
+    if application is not None:
+        return application, False
+
+    # 이미 배정된 강의와 시간이 겹치면 배정될 수 없으므로 접수하지 않음
+    if busy_lecture_ids(user_id, [lecture_id]):
+        raise ScheduleConflict('이미 배정된 강의와 시간이 겹칩니다.')
+
+    # 스냅샷 저장은 정원 행을 잡기 전에 끝내 둠
+    portfolio_content = User.objects.filter(id=user_id).values_list('portfolio_content', flat=True).first()
+    portfolio = PortfolioSnapshot.objects.intern(portfolio_content)
+
+    now = timezone.now()
+    today = timezone.localdate(now)
+    with transaction.atomic():
+        application_id = _insert_or_nothing({
+            'lecture': lecture_id,
+            'user': user_id,
+            'applied_role': applied_role,
+            'portfolio': portfolio.id if portfolio else None,
+            'assignment_status': Application.AssignmentStatus.PENDING,
+            'applied_at': now,
+            'updated_at': now,
+            'idempotency_key': idempotency_key,
+        })
+        if application_id is None:
+            # 동시에 같은 지원이 먼저 들어옴 (자리는 잡지 않음)
+            return _existing(user_id, lecture_id, applied_role, idempotency_key), False
+
+        # 대시보드 증감/동기화 변경 기록은 INSERT 만 하므로 정원 행을 잡기 전에 끝내 둠
+        dashboard_stats.apply(
+            dashboard_stats.application_deltas(Application.AssignmentStatus.PENDING, None),
+            {dashboard_stats.application_day(now): 1},
+        )
+        record_user_changes(Kind.APPLICATION, [(application_id, user_id)])
+        record_changes(Kind.LECTURE, [lecture_id])
+        enqueue(refresh_features, [user_id])
+        # 목록의 지원자 수가 바뀌므로 커밋 후 목록 캐시 무효화 (캐시 유효 시간 동안 이전 수가 보이지 않도록)
+        transaction.on_commit(invalidate_lecture_list)
+
+        # 새로 들어간 지원서만 자리를 잡음. 정원 행 잠금이 커밋까지 가장 짧게 유지되도록 마지막에
+        # (자리가 없으면 위의 INSERT 까지 모두 롤백)
+        if not _reserve_seat(lecture_id, today):
+            raise _rejection(lecture_id, today)
+
+    return Application.objects.get(id=application_id), True
+
+
+# 정원 카운터를 실제 지원서 수로 맞춤 (bulk_create 로 지원서를 넣은 뒤 등)
+def sync_applicant_counts(lecture_ids=None):
+    counts = (
+        Application.objects
+        .filter(lecture_id=OuterRef('lecture_id'))
+        .order_by()
+        .values('lecture_id')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    queryset = LectureRecruitment.objects.all()
+    if lecture_ids is not None:
+        queryset = queryset.filter(lecture_id__in=lecture_ids)
+    return queryset.update(applicant_count=Coalesce(Subquery(counts), Value(0)))
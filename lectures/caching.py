@@ -0,0 +1,30 @@
+from config.cache import bump_versions, touch_stamps
+
+LECTURE_LIST = 'lectures'
+
+# 강의 일정(calendars.py) 변경 스탬프: 강의 전체 / 강사별 배정
+CALENDAR_LECTURES = 'calendar:lectures'
+
+
+def lecture_namespace(lecture_id):
+    return f'lecture:{lecture_id}'
+
+
+def calendar_namespace(user_id):
+    return f'calendar:{user_id}'
+
+
+# 강의 상세/목록 응답 캐시 무효화 (모집중 강의와 배정된 강의 정보가 바뀌므로 일정 스탬프도 갱신)
+def invalidate_lectures(lecture_ids):
+    bump_versions([LECTURE_LIST, *(lecture_namespace(lecture_id) for lecture_id in lecture_ids)])
+    touch_stamps([CALENDAR_LECTURES])
+
+
+# 목록 응답의 역할별 지원자 수가 바뀜 (지원 접수/삭제, 상세와 일정에는 지원자 수가 없음)
+def invalidate_lecture_list():
+    bump_versions([LECTURE_LIST])
+
+
+# 강사별 배정 일정이 바뀜
+def invalidate_calendars(user_ids):
+    touch_stamps([calendar_namespace(user_id) for user_id in user_ids])
@@ -0,0 +1,162 @@
+import hashlib
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core import signing
+from django.db import transaction
+from django.db.models import F
+
+from accounts.models import User
+from config.cache import get_stamps
+from .caching import CALENDAR_LECTURES, calendar_namespace
+from .models import Lecture, Application, InstructorSlot
+
+TOKEN_SALT = 'lectures.calendar'
+
+# 한 번에 조회할 수 있는 기간
+MAX_RANGE = timedelta(days=366)
+
+# iCalendar 구독 피드의 기간 (현재 기준)
+ICAL_PAST = timedelta(days=30)
+ICAL_FUTURE = timedelta(days=365)
+
+
+# iCalendar 구독 URL 용 토큰 (캘린더 앱은 Authorization 헤더를 보낼 수 없음)
+# 사용자의 토큰 버전을 함께 서명하므로 버전을 올리면 이전에 발급한 URL 은 모두 무효
+def calendar_token(user_id, version):
+    return signing.dumps([user_id, version], salt=TOKEN_SALT)
+
+
+# 토큰이 가리키는 활성 강사의 id (서명이 틀리거나, 재발급으로 버전이 바뀌었거나, 비활성 사용자면 None)
+def user_id_from_token(token):
+    try:
+        user_id, version = signing.loads(token, salt=TOKEN_SALT)
+    except (signing.BadSignature, TypeError, ValueError):
+        return None
+    valid = User.objects.filter(
+        id=user_id, calendar_token_version=version, is_active=True, role=User.Role.INSTRUCTOR,
+    ).exists()
+    return user_id if valid else None
+
+
+# 구독 토큰 재발급 (이전 구독 URL 무효화)
+def rotate_calendar_token(user_id):
+    with transaction.atomic():
+        users = User.objects.filter(id=user_id)
+        users.update(calendar_token_version=F('calendar_token_version') + 1)
+        version = users.values_list('calendar_token_version', flat=True).get()
+    return calendar_token(user_id, version)
+
+
+# 조건부 GET 용 (ETag, Last-Modified)
+# 캐시의 스탬프 두 개(강의 전체, 강사별 배정)만 읽고 DB 는 조회하지 않음
+# 본문을 만들기 전에 읽어야 그 사이의 변경이 다음 요청에서 빠지지 않음
+def calendar_version(user_id, *key):
+    stamps = get_stamps([CALENDAR_LECTURES, calendar_namespace(user_id)])
+    digest = hashlib.sha1(repr((stamps, key)).encode()).hexdigest()[:24]
+    return f'"{digest}"', max(stamps) // 10 ** 9
+
+
+# 배정된 강의 (시간이 있는 강의만, 강사 시간대 테이블의 (user, start_at) 인덱스)
+def assigned_slots(user_id, start, end):
+    return (
+        InstructorSlot.objects
+        .filter(user_id=user_id, start_at__gte=start, start_at__lt=end)
+        .order_by('start_at', 'lecture_id')
+    )
+
+
+# 모집중 강의 ((status, lecture_start_datetime) 인덱스)
+def recruiting_lectures(start, end):
+    return (
+        Lecture.objects
+        .filter(
+            status=Lecture.LectureStatus.RECRUITING,
+            lecture_start_datetime__gte=start,
+            lecture_start_datetime__lt=end,
+        )
+        .order_by('lecture_start_datetime', 'id')
+    )
+
+
+def _escape(text):
+    return (
+        str(text or '')
+        .replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+# 한 줄 75 옥텟 제한 (UTF-8 문자가 잘리지 않게 접음)
+def _fold(line):
+    parts = []
+    current = b''
+    for char in line:
+        encoded = char.encode()
+        if len(current) + len(encoded) > (75 if not parts else 74):
+            parts.append(current.decode())
+            current = b''
+        current += encoded
+    parts.append(current.decode())
+    return '\r\n '.join(parts)
+
+
+def _utc(value):
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _event(uid, stamp, start, end, summary, location, status, description=None):
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{uid}',
+        f'DTSTAMP:{stamp}',
+        f'DTSTART:{_utc(start)}',
+    ]
+    if end is not None and end > start:
+        lines.append(f'DTEND:{_utc(end)}')
+    lines += [f'SUMMARY:{_escape(summary)}', f'STATUS:{status}']
+    if location:
+        lines.append(f'LOCATION:{_escape(location)}')
+    if description:
+        lines.append(f'DESCRIPTION:{_escape(description)}')
+    lines.append('END:VEVENT')
+    return lines
+
+
+# iCalendar(RFC 5545) 본문
+# last_modified: calendar_version 의 값 (DTSTAMP 로 사용해 같은 버전이면 같은 본문)
+def render_ical(user_id, start, end, last_modified):
+    stamp = _utc(datetime.fromtimestamp(last_modified, dt_timezone.utc))
+    role_labels = dict(Application.LectureRole.choices)
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//dorolms//lecture calendar//KO',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        'X-WR-CALNAME:도로 강의 일정',
+        'X-WR-TIMEZONE:Asia/Seoul',
+        'REFRESH-INTERVAL;VALUE=DURATION:PT15M',
+        'X-PUBLISHED-TTL:PT15M',
+    ]
+    slots = assigned_slots(user_id, start, end).values_list(
+        'lecture_id', 'start_at', 'end_at', 'lecture__title', 'lecture__location', 'application__assigned_role',
+    )
+    for lecture_id, slot_start, slot_end, title, location, role in slots:
+        summary = f'{title} ({role_labels[role]})' if role in role_labels else title
+        lines += _event(
+            f'lecture-{lecture_id}-assigned@dorolms', stamp, slot_start, slot_end, summary, location, 'CONFIRMED',
+        )
+    lectures = recruiting_lectures(start, end).values_list(
+        'id', 'lecture_start_datetime', 'lecture_end_datetime', 'title', 'location',
+        'recruitment_info__application_end_date',
+    )
+    for lecture_id, lecture_start, lecture_end, title, location, closes_on in lectures:
+        lines += _event(
+            f'lecture-{lecture_id}-recruiting@dorolms', stamp, lecture_start, lecture_end, f'[모집중] {title}',
+            location, 'TENTATIVE', f'강사 모집 마감: {closes_on}' if closes_on else None,
+        )
+    lines.append('END:VCALENDAR')
+    return ''.join(_fold(line) + '\r\n' for line in lines)
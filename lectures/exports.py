@@ -0,0 +1,102 @@
+import csv
+import zlib
+from itertools import islice
+
+from django.utils import timezone
+
+from .models import Lecture, Application
+
+CHUNK_SIZE = 2000
+# 이 행 수만큼 모아서 한 번에 내보냄
+ROWS_PER_BLOCK = 500
+
+# (헤더, values_list 경로)
+COLUMNS = [
+    ('지원 ID', 'id'),
+    ('강의 ID', 'lecture_id'),
+    ('강의명', 'lecture__title'),
+    ('강의 유형', 'lecture__type'),
+    ('강의 시작 일시', 'lecture__lecture_start_datetime'),
+    ('강의 종료 일시', 'lecture__lecture_end_datetime'),
+    ('강의 장소', 'lecture__location'),
+    ('강사 이름', 'user__name'),
+    ('연락처', 'user__phone_number'),
+    ('이메일', 'user__email'),
+    ('지원 역할', 'applied_role'),
+    ('배정 상태', 'assignment_status'),
+    ('최종 배정된 역할', 'assigned_role'),
+    ('주강사 강의료', 'lecture__recruitment_info__fee_main'),
+    ('보조강사 강의료', 'lecture__recruitment_info__fee_assist'),
+    ('지원 일시', 'applied_at'),
+]
+HEADER = [label for label, _ in COLUMNS] + ['지급 강의료']
+FIELDS = [path for _, path in COLUMNS]
+
+# 코드 값 → 표시 이름
+LABELS = {
+    'lecture__type': dict(Lecture.LectureType.choices),
+    'applied_role': dict(Application.LectureRole.choices),
+    'assignment_status': dict(Application.AssignmentStatus.choices),
+    'assigned_role': dict(Application.LectureRole.choices),
+}
+DATETIME_FIELDS = {'lecture__lecture_start_datetime', 'lecture__lecture_end_datetime', 'applied_at'}
+ASSIGNED_ROLE = FIELDS.index('assigned_role')
+FEE_MAIN = FIELDS.index('lecture__recruitment_info__fee_main')
+FEE_ASSIST = FIELDS.index('lecture__recruitment_info__fee_assist')
+
+# 스프레드시트가 수식으로 해석하는 첫 글자 (CSV 수식 주입)
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+# csv.writer 가 쓴 문자열을 그대로 돌려주는 버퍼
+class Echo:
+    def write(self, value):
+        return value
+
+
+# 강사 이름처럼 사용자가 입력한 값이 매니저의 엑셀에서 수식으로 실행되지 않도록 ' 를 붙여 문자열로 고정
+def _cell(value):
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def format_row(row):
+    values = []
+    for path, value in zip(FIELDS, row):
+        if value is None:
+            value = ''
+        elif path in LABELS:
+            value = LABELS[path].get(value, value)
+        elif path in DATETIME_FIELDS:
+            value = timezone.localtime(value).strftime('%Y-%m-%d %H:%M')
+        values.append(_cell(value))
+
+    # 배정된 역할 기준 강의료 (정산용)
+    fee = ''
+    if row[ASSIGNED_ROLE] == Application.LectureRole.MAIN:
+        fee = row[FEE_MAIN]
+    elif row[ASSIGNED_ROLE] == Application.LectureRole.ASSIST:
+        fee = row[FEE_ASSIST]
+    values.append('' if fee is None else fee)
+    return values
+
+
+# 지원 내역을 서버 측 커서로 읽으면서 CSV 를 블록 단위로 생성
+# 헤더를 먼저 내보내므로 첫 바이트가 바로 나가고, 메모리에는 블록 하나만 둠
+def iter_csv(queryset, chunk_size=CHUNK_SIZE):
+    writer = csv.writer(Echo())
+    rows = queryset.order_by('lecture_id', 'id').values_list(*FIELDS).iterator(chunk_size=chunk_size)
+
+    # 엑셀에서 한글이 깨지지 않도록 BOM
+    yield ('\ufeff' + writer.writerow(HEADER)).encode('utf-8')
+    while block := list(islice(rows, ROWS_PER_BLOCK)):
+        yield ''.join(writer.writerow(format_row(row)) for row in block).encode('utf-8')
+
+
+# 블록마다 SYNC_FLUSH 해서 압축 중에도 데이터가 계속 흘러가게 함
+def gzip_stream(chunks, level=6):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip 헤더
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
@@ -0,0 +1,319 @@
+import codecs
+import csv
+import io
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+
+from django.db import transaction
+from django.db.models.functions import Lower
+from rest_framework.exceptions import ValidationError
+
+from accounts.models import User
+from accounts.notifications import chunked, enqueue_recruitment_open
+from dashboard import stats as dashboard_stats
+from sync.changes import Kind, record_changes
+from .models import Lecture, LectureRecruitment
+from .serializers import LectureImportRowSerializer
+from .signals import lectures_bulk_changed
+
+CHUNK_SIZE = 500
+# 오류 보고서가 끝없이 커지지 않도록 앞쪽 오류만 담음
+MAX_ERRORS = 1000
+
+LECTURE_FIELDS = [
+    'title',
+    'type',
+    'category',
+    'status',
+    'lecture_start_datetime',
+    'lecture_end_datetime',
+    'location',
+    'target_audience',
+    'content_description',
+    'special_notes',
+    'attachment_url',
+]
+RECRUITMENT_FIELDS = [
+    'application_start_date',
+    'application_end_date',
+    'max_participants',
+    'recruitment_main_needed',
+    'recruitment_assist_needed',
+    'fee_main',
+    'fee_assist',
+]
+DATE_FIELDS = {'application_start_date', 'application_end_date'}
+
+
+# 헤더는 필드 이름 또는 관리자 화면의 한글 이름 (예: 강의명, 강사 모집 마감일)
+def _header_aliases():
+    aliases = {'manager_email': 'manager_email', '담당 매니저 이메일': 'manager_email'}
+    for model, names in ((Lecture, LECTURE_FIELDS), (LectureRecruitment, RECRUITMENT_FIELDS)):
+        for name in names:
+            aliases[name] = name
+            aliases[str(model._meta.get_field(name).verbose_name)] = name
+    return aliases
+
+
+# 유형/상태는 값(camp) 또는 표시 이름(캠프, 캠프 (연두))
+def _choice_aliases(choices):
+    aliases = {}
+    for value, label in choices.choices:
+        aliases[value] = value
+        aliases[label] = value
+        aliases[label.split(' (')[0]] = value
+    return aliases
+
+
+HEADER_ALIASES = _header_aliases()
+CHOICE_ALIASES = {
+    'type': _choice_aliases(Lecture.LectureType),
+    'status': _choice_aliases(Lecture.LectureStatus),
+}
+
+
+# 파일 자체를 읽을 수 없을 때 (행 검증 오류와 달리 가져오기 전체가 중단됨)
+# 읽는 도중에 중단되면 row 는 읽지 못한 행 번호, result 는 그때까지의 결과 (앞 청크는 이미 저장됨)
+class ImportFileError(Exception):
+    def __init__(self, message, row=None, result=None):
+        super().__init__(message)
+        self.row = row
+        self.result = result
+
+    def as_dict(self):
+        data = {'file': [str(self)]}
+        if self.row is not None:
+            data['row'] = self.row
+        if self.result is not None:
+            data.update(self.result.as_dict())
+        return data
+
+
+@dataclass
+class ImportResult:
+    total: int = 0
+    created: int = 0
+    errors: list = field(default_factory=list)
+    failed: int = 0
+    dry_run: bool = False
+
+    def add_error(self, row, errors):
+        self.failed += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({'row': row, 'errors': errors})
+
+    def as_dict(self):
+        return {
+            'total': self.total,
+            'created': self.created,
+            'failed': self.failed,
+            'errors': self.errors,
+            'errors_truncated': self.failed > len(self.errors),
+            'dry_run': self.dry_run,
+        }
+
+
+def detect_format(filename):
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension not in ('.csv', '.xlsx'):
+        raise ImportFileError('CSV 또는 XLSX 파일만 가져올 수 있습니다.')
+    return extension[1:]
+
+
+def _encoding_error(encoding):
+    return ImportFileError(f'{encoding} 인코딩으로 읽을 수 없습니다. 인코딩을 지정해 주세요. (예: cp949)')
+
+
+# 첫 청크를 저장하기 전에 파일 끝까지 디코딩해 봄 (뒤쪽에서 디코딩 오류가 나 앞 청크만 저장되는 일이 없도록)
+# 메모리에는 블록 하나만 두고, 다 읽으면 처음으로 되돌림
+def check_encoding(file, encoding, block_size=64 * 1024):
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        for block in iter(lambda: file.read(block_size), b''):
+            decoder.decode(block)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        raise _encoding_error(encoding)
+    finally:
+        file.seek(0)
+
+
+# 업로드 파일(바이너리)을 한 줄씩 디코딩해서 읽음
+def read_csv(file, encoding='utf-8-sig'):
+    if file.seekable():
+        check_encoding(file, encoding)
+    text = io.TextIOWrapper(file, encoding=encoding, newline='')
+    try:
+        yield from csv.reader(text)
+    except UnicodeDecodeError:
+        raise _encoding_error(encoding)
+    except csv.Error as e:
+        raise ImportFileError(f'CSV 형식이 올바르지 않습니다. ({e})')
+    finally:
+        # 래퍼가 닫히면서 원본 파일까지 닫지 않도록 분리
+        text.detach()
+
+
+# openpyxl 은 XLSX 가져오기에만 필요 (read_only 모드로 행 단위 읽기)
+def read_xlsx(file):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFileError('XLSX 가져오기에는 openpyxl 패키지가 필요합니다. (pip install openpyxl)')
+
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except Exception:
+        raise ImportFileError('XLSX 파일을 열 수 없습니다.')
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    except Exception:
+        raise ImportFileError('XLSX 파일을 끝까지 읽을 수 없습니다.')
+    finally:
+        workbook.close()
+
+
+def read_rows(file, file_format, encoding='utf-8-sig'):
+    if file_format == 'xlsx':
+        return read_xlsx(file)
+    return read_csv(file, encoding)
+
+
+# CSV/XLSX 행을 청크 단위로 검증하고 강의 + 모집 정보를 bulk_create
+# - 파일은 한 행씩 읽고, 메모리에는 청크 하나만 둠
+# - 청크마다 트랜잭션 하나 (실패한 행은 건너뛰고 오류 보고서에 행 번호와 함께 기록)
+# - 도중에 파일을 읽을 수 없게 되면 ImportFileError 에 읽지 못한 행 번호와 그때까지의 결과를 담아 중단
+# - 담당 매니저는 이메일 → id 맵을 한 번만 조회
+# - bulk_create 는 시그널을 보내지 않으므로 lectures_bulk_changed 로 검색 색인/캐시 갱신, 대시보드 집계는 직접 반영
+class LectureImporter:
+    def __init__(self, chunk_size=CHUNK_SIZE, dry_run=False, notify=False):
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        # 모집중 강의마다 강사 전체에게 알림을 보내므로 기본은 끔
+        self.notify = notify
+        # 행마다 serializer 를 만들면 필드 deepcopy 가 대부분의 시간을 차지하므로 하나를 재사용
+        self.serializer = LectureImportRowSerializer()
+
+    @cached_property
+    def managers(self):
+        rows = (
+            User.objects
+            .filter(role=User.Role.MANAGER)
+            .exclude(email='')
+            .order_by('-id')
+            .values_list(Lower('email'), 'id')
+        )
+        # 같은 이메일이 여럿이면 가장 먼저 가입한 매니저
+        return dict(rows)
+
+    def run(self, rows):
+        result = ImportResult(dry_run=self.dry_run)
+        rows = iter(rows)
+        header = self._parse_header(next(rows, None))
+
+        # 행 번호는 헤더를 1행으로 센 파일 기준
+        self.last_row = 1
+        try:
+            for chunk in chunked(self._numbered(rows), self.chunk_size):
+                valid = []
+                for number, values in chunk:
+                    result.total += 1
+                    data = self._validate(header, values)
+                    if 'errors' in data:
+                        result.add_error(number, data['errors'])
+                    else:
+                        valid.append(data)
+                if valid and not self.dry_run:
+                    self._create(valid)
+                result.created += len(valid)
+        except ImportFileError as e:
+            e.row = self.last_row + 1
+            e.result = result
+            raise
+        return result
+
+    def _numbered(self, rows):
+        for number, values in enumerate(rows, start=2):
+            self.last_row = number
+            if self._has_values(values):
+                yield number, values
+
+    def _parse_header(self, values):
+        if not values:
+            raise ImportFileError('헤더 행이 없습니다.')
+        header = [HEADER_ALIASES.get(str(value).strip()) if value is not None else None for value in values]
+        if 'title' not in header:
+            raise ImportFileError('title(강의명) 열이 없습니다.')
+        return header
+
+    def _has_values(self, values):
+        return any(value not in (None, '') and str(value).strip() for value in values)
+
+    def _normalize(self, name, value):
+        if isinstance(value, str):
+            value = value.strip()
+            if value == '':
+                return None
+            if name in CHOICE_ALIASES:
+                return CHOICE_ALIASES[name].get(value, value)
+        # XLSX 날짜 셀은 datetime 으로 읽힘
+        if name in DATE_FIELDS and isinstance(value, datetime):
+            return value.date()
+        return value
+
+    def _validate(self, header, values):
+        row = {
+            name: self._normalize(name, value)
+            for name, value in zip(header, values)
+            if name is not None
+        }
+        try:
+            data = self.serializer.run_validation(row)
+        except ValidationError as e:
+            return {'errors': self._flatten(e.detail)}
+
+        email = data.pop('manager_email', None)
+        data['manager_id'] = None
+        if email:
+            data['manager_id'] = self.managers.get(email.lower())
+            if data['manager_id'] is None:
+                return {'errors': {'manager_email': ['해당 이메일의 매니저가 없습니다.']}}
+        return data
+
+    def _flatten(self, errors):
+        if not isinstance(errors, dict):
+            errors = {'non_field_errors': errors}
+        return {
+            name: [str(message) for message in (messages if isinstance(messages, list) else [messages])]
+            for name, messages in errors.items()
+        }
+
+    def _create(self, rows):
+        with transaction.atomic():
+            lectures = Lecture.objects.bulk_create([
+                Lecture(manager_id=row['manager_id'], **{name: row.get(name) for name in LECTURE_FIELDS})
+                for row in rows
+            ])
+            LectureRecruitment.objects.bulk_create([
+                LectureRecruitment(lecture_id=lecture.id, **{name: row.get(name) for name in RECRUITMENT_FIELDS})
+                for lecture, row in zip(lectures, rows)
+            ])
+            lecture_ids = [lecture.id for lecture in lectures]
+            lectures_bulk_changed.send(sender=Lecture, lecture_ids=lecture_ids)
+            record_changes(Kind.RECRUITMENT, lecture_ids)
+
+            deltas = Counter()
+            for row in rows:
+                deltas.update(dashboard_stats.lecture_deltas(row['status'], row.get('type')))
+                deltas.update(dashboard_stats.recruitment_deltas(
+                    row.get('recruitment_main_needed'), row.get('recruitment_assist_needed'),
+                ))
+            dashboard_stats.apply(deltas)
+
+            if self.notify:
+                for lecture in lectures:
+                    if lecture.status == Lecture.LectureStatus.RECRUITING:
+                        enqueue_recruitment_open(lecture.id)
@@ -0,0 +1,26 @@
+from bisect import bisect_left, bisect_right, insort
+
+
+# 강사별 배정 시간대 인덱스
+# 강사마다 시작 시각과 종료 시각을 각각 정렬해 두고 이진 탐색 두 번으로 겹침 여부를 확인
+class InstructorSchedule:
+    def __init__(self):
+        self._starts = {}
+        self._ends = {}
+
+    def add(self, user_id, start, end):
+        if start is None or end is None:
+            return
+        insort(self._starts.setdefault(user_id, []), start)
+        insort(self._ends.setdefault(user_id, []), end)
+
+    def conflicts(self, user_id, start, end):
+        # 시간이 정해지지 않은 강의는 겹침을 판단할 수 없으므로 충돌 없음으로 본다
+        if start is None or end is None:
+            return False
+        starts = self._starts.get(user_id)
+        if not starts:
+            return False
+        # 새 구간의 종료 전에 시작한 구간 중 새 구간의 시작 전에 끝난 구간을 빼고 하나라도 남으면 겹침
+        # (시작 전에 끝난 구간은 모두 종료 전에 시작했으므로 개수 차이가 곧 겹치는 구간 수)
+        return bisect_left(starts, end) > bisect_right(self._ends[user_id], start)
@@ -0,0 +1,291 @@
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from accounts import counters
+from accounts.models import User, Notification, UnreadCounter
+from announcements.caching import invalidate_announcements
+from announcements.models import Announcement
+from communications.models import Broadcast, Message, Conversation
+from communications.services import rebuild_conversations
+from dashboard import stats as dashboard_stats
+from lectures.models import (
+    Lecture,
+    LectureRecruitment,
+    Application,
+    PortfolioSnapshot,
+    InstructorFeature,
+    InstructorSlot,
+    LectureTransition,
+)
+from lectures.applications import sync_applicant_counts
+from lectures.caching import invalidate_lectures
+from lectures.recommendations import rebuild_features
+from lectures.schedules import rebuild_slots
+from search.index import index_lectures, index_announcements
+from search.models import SearchDocument
+from sync.models import ChangeLog
+
+LOCATIONS = ['서울 강남', '서울 마포', '부산 해운대', '대구 수성', '인천 송도', '광주 북구', '대전 유성', '수원 영통']
+CATEGORIES = ['SW', '로봇', 'AI', '메이커', '드론', '과학']
+PASSWORD = 'dorolms1234!'
+
+# 참조하는 쪽부터 지울 테이블 (사용자 제외)
+FLUSH_MODELS = [
+    Conversation, Message, Broadcast, Notification, UnreadCounter, InstructorFeature, InstructorSlot,
+    LectureTransition, Application, PortfolioSnapshot, LectureRecruitment, Lecture, Announcement, SearchDocument,
+]
+
+
+class Command(BaseCommand):
+    help = '벤치마크/부하 테스트용 합성 데이터를 생성합니다. (같은 --seed 면 같은 데이터)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--manager-ratio', type=float, default=0.05)
+        parser.add_argument('--lectures', type=int, default=2000)
+        parser.add_argument('--applications', type=int, default=50000)
+        parser.add_argument('--notifications', type=int, default=100000)
+        parser.add_argument('--messages', type=int, default=50000)
+        parser.add_argument('--announcements', type=int, default=200)
+        parser.add_argument('--days', type=int, default=180, help='강의/지원 시각을 흩뿌릴 기간 (일)')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--flush', action='store_true', help='기존 사용자/강의/메시지 데이터를 모두 지우고 생성')
+        parser.add_argument(
+            '--noinput', '--no-input', action='store_false', dest='interactive',
+            help='--flush 확인 질문을 하지 않음 (DEBUG 환경에서만)',
+        )
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        self.days = options['days']
+
+        if not options['flush'] and User.objects.filter(username__startswith='bench_').exists():
+            raise CommandError('이미 생성된 데이터가 있습니다. --flush 로 지운 뒤 다시 생성하세요.')
+        if options['flush']:
+            self._confirm_flush(options['interactive'])
+            self._flush()
+
+        managers, instructors = self._create_users(options['users'], options['manager_ratio'])
+        lectures = self._create_lectures(options['lectures'], managers)
+        self._create_applications(options['applications'], lectures, instructors)
+        self._create_announcements(options['announcements'], managers)
+        self._create_notifications(options['notifications'], lectures, instructors)
+        self._create_messages(options['messages'], managers, instructors)
+
+        # bulk_create 는 시그널을 보내지 않으므로 파생 테이블을 다시 만듦
+        rebuild_conversations(batch_size=self.batch_size)
+        counters.reconcile(batch_size=self.batch_size)
+        sync_applicant_counts()
+        rebuild_slots()
+        index_lectures()
+        index_announcements()
+        dashboard_stats.rebuild()
+        rebuild_features(batch_size=self.batch_size)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"생성 완료: 사용자 {len(managers) + len(instructors)}, 강의 {len(lectures)}, "
+            f"지원 {Application.objects.count()}, 알림 {Notification.objects.count()}, "
+            f"메시지 {Message.objects.count()}"
+        ))
+
+    # 테스트 DB(run_benchmarks 등)는 바로 지우고,
+    # 그 밖의 DB 는 DEBUG 환경에서 DB 이름을 확인한 뒤에만 지움 (운영 DB 를 실수로 비우지 않도록)
+    def _confirm_flush(self, interactive):
+        name = str(connection.settings_dict['NAME'])
+        test_name = connection.settings_dict.get('TEST', {}).get('NAME')
+        if name.startswith('test_') or name == test_name or 'mode=memory' in name:
+            return
+        if not settings.DEBUG:
+            raise CommandError('DEBUG=False 인 환경에서는 --flush 를 사용할 수 없습니다.')
+        if interactive:
+            answer = input(
+                f"'{name}' DB 의 사용자(관리자 제외)/강의/메시지/알림 데이터를 모두 삭제합니다.\n"
+                "계속하려면 DB 이름을 입력하세요: "
+            )
+            if answer != name:
+                raise CommandError('삭제를 취소했습니다.')
+
+    # 시그널/연쇄 삭제 수집 없이 테이블마다 DELETE 한 번 (delete() 는 행마다 시그널을 보내고 그 안에서 다시 조회함)
+    # 사용자에게는 다른 앱(관리자 기록, 권한 등)의 행이 딸려 있을 수 있어 delete() 로 지우지만,
+    # 시그널이 걸린 모델은 먼저 비웠으므로 남은 연쇄 삭제는 일괄 DELETE 로 끝남
+    def _flush(self):
+        lecture_ids = list(Lecture.objects.values_list('id', flat=True))
+        announcement_ids = list(Announcement.objects.values_list('id', flat=True))
+        with transaction.atomic():
+            for model in FLUSH_MODELS:
+                queryset = model.objects.all()
+                queryset._raw_delete(queryset.db)
+            User.objects.filter(is_superuser=False).delete()
+            # 위 삭제로 남은 tombstone 까지
+            ChangeLog.objects.all()._raw_delete(ChangeLog.objects.db)
+        # 시그널을 건너뛰었으므로 응답 캐시는 직접 무효화
+        invalidate_lectures(lecture_ids)
+        invalidate_announcements(announcement_ids)
+
+    def _random_past(self):
+        return self.now - timedelta(seconds=self.random.randint(0, self.days * 24 * 3600))
+
+    def _bulk_create(self, model, objects, timestamp=None):
+        created = self._insert(model, objects, timestamp)
+        self.stdout.write(f'  {model.__name__}: {len(created)}')
+        return created
+
+    # bulk_create 는 auto_now_add 필드(timestamp)를 현재 시각으로 채우므로, 생성한 뒤 지정한 시각으로 다시 씀
+    # (필드의 auto_now_add 를 잠시 끄면 같은 프로세스의 다른 스레드가 저장하는 행에도 영향을 줌)
+    def _insert(self, model, objects, timestamp=None):
+        values = [getattr(obj, timestamp) for obj in objects] if timestamp else None
+        created = model.objects.bulk_create(objects, batch_size=self.batch_size)
+        if timestamp:
+            for obj, value in zip(created, values):
+                setattr(obj, timestamp, value)
+            model.objects.bulk_update(created, [timestamp], batch_size=self.batch_size)
+        return created
+
+    def _create_users(self, count, manager_ratio):
+        password = make_password(PASSWORD)
+        manager_count = max(1, int(count * manager_ratio))
+        users = [
+            User(
+                username=f'bench_{i}',
+                email=f'bench_{i}@example.com',
+                password=password,
+                name=f'사용자{i}',
+                role=User.Role.MANAGER if i < manager_count else User.Role.INSTRUCTOR,
+                portfolio_content=None if i < manager_count else f'강사{i} 포트폴리오',
+            )
+            for i in range(count)
+        ]
+        users = self._bulk_create(User, users)
+        managers = [user.id for user in users if user.role == User.Role.MANAGER]
+        instructors = [user.id for user in users if user.role == User.Role.INSTRUCTOR]
+        return managers, instructors
+
+    def _create_lectures(self, count, managers):
+        statuses = Lecture.LectureStatus.values
+        lectures = []
+        for i in range(count):
+            start = self.now + timedelta(
+                days=self.random.randint(-self.days, self.days),
+                hours=self.random.choice([9, 10, 13, 14, 15]),
+            )
+            lectures.append(Lecture(
+                title=f'{self.random.choice(CATEGORIES)} 강의 {i}',
+                type=self.random.choice(Lecture.LectureType.values),
+                category=self.random.choice(CATEGORIES),
+                status=self.random.choices(statuses, weights=[6, 2, 2])[0],
+                lecture_start_datetime=start,
+                lecture_end_datetime=start + timedelta(hours=self.random.randint(2, 8)),
+                location=self.random.choice(LOCATIONS),
+                manager_id=self.random.choice(managers),
+                content_description=f'{self.random.choice(CATEGORIES)} 체험 교육 과정입니다.',
+                created_at=self._random_past(),
+            ))
+        lectures = self._bulk_create(Lecture, lectures, timestamp='created_at')
+
+        recruitments = []
+        for lecture in lectures:
+            opens = (lecture.lecture_start_datetime - timedelta(days=self.random.randint(14, 30))).date()
+            recruitments.append(LectureRecruitment(
+                lecture_id=lecture.id,
+                application_start_date=opens,
+                application_end_date=opens + timedelta(days=7),
+                max_participants=self.random.randint(20, 200),
+                recruitment_main_needed=self.random.randint(1, 3),
+                recruitment_assist_needed=self.random.randint(0, 4),
+                fee_main=self.random.choice([150000, 200000, 250000]),
+                fee_assist=self.random.choice([80000, 100000, 120000]),
+            ))
+        self._bulk_create(LectureRecruitment, recruitments)
+        return lectures
+
+    def _create_applications(self, count, lectures, instructors):
+        if not lectures or not instructors:
+            return
+        # 강의마다 서로 다른 강사를 뽑아 (lecture, user, applied_role) 중복이 생기지 않게 함
+        per_lecture = max(1, count // len(lectures))
+        roles = Application.LectureRole.values
+        batch = []
+        total = 0
+        for lecture in lectures:
+            sample = self.random.sample(instructors, min(per_lecture, len(instructors)))
+            for user_id in sample:
+                if total >= count:
+                    break
+                status = Application.AssignmentStatus.PENDING
+                if lecture.status == Lecture.LectureStatus.COMPLETED:
+                    status = self.random.choice([
+                        Application.AssignmentStatus.ASSIGNED,
+                        Application.AssignmentStatus.REJECTED,
+                    ])
+                role = self.random.choice(roles)
+                batch.append(Application(
+                    lecture_id=lecture.id,
+                    user_id=user_id,
+                    applied_role=role,
+                    assignment_status=status,
+                    assigned_role=role if status == Application.AssignmentStatus.ASSIGNED else None,
+                    applied_at=lecture.created_at + timedelta(hours=self.random.randint(0, 24 * 14)),
+                ))
+                total += 1
+            if len(batch) >= self.batch_size:
+                self._insert(Application, batch, timestamp='applied_at')
+                batch = []
+        if batch:
+            self._insert(Application, batch, timestamp='applied_at')
+        self.stdout.write(f'  Application: {total}')
+
+    def _create_announcements(self, count, managers):
+        announcements = [
+            Announcement(
+                author_id=self.random.choice(managers),
+                title=f'공지사항 {i}: {self.random.choice(CATEGORIES)} 강사 모집 안내',
+                content='이번 시즌 강의 일정과 배정 기준을 안내드립니다. ' * 5,
+                created_at=self._random_past(),
+            )
+            for i in range(count)
+        ]
+        self._bulk_create(Announcement, announcements, timestamp='created_at')
+
+    def _create_notifications(self, count, lectures, instructors):
+        if not instructors:
+            return
+        for start in range(0, count, self.batch_size):
+            self._insert(Notification, [
+                Notification(
+                    user_id=self.random.choice(instructors),
+                    lecture_id=self.random.choice(lectures).id if lectures else None,
+                    message='강의 모집이 시작되었습니다.',
+                    is_read=self.random.random() < 0.7,
+                    created_at=self._random_past(),
+                )
+                for _ in range(min(self.batch_size, count - start))
+            ], timestamp='created_at')
+        self.stdout.write(f'  Notification: {count}')
+
+    def _create_messages(self, count, managers, instructors):
+        users = managers + instructors
+        if len(users) < 2:
+            return
+        for start in range(0, count, self.batch_size):
+            batch = []
+            for _ in range(min(self.batch_size, count - start)):
+                sender, recipient = self.random.sample(users, 2)
+                sent = self._random_past()
+                batch.append(Message(
+                    sender_id=sender,
+                    recipient_id=recipient,
+                    content='안녕하세요, 강의 관련 문의드립니다.',
+                    sent_at=sent,
+                    read_at=sent + timedelta(hours=1) if self.random.random() < 0.6 else None,
+                ))
+            self._insert(Message, batch, timestamp='sent_at')
+        self.stdout.write(f'  Message: {count}')
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from lectures.importers import CHUNK_SIZE, ImportFileError, LectureImporter, detect_format, read_rows
+
+
+class Command(BaseCommand):
+    help = 'CSV/XLSX 파일에서 강의와 모집 정보를 일괄로 가져옵니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--encoding', default='utf-8-sig', help='CSV 인코딩 (엑셀 CSV 는 cp949)')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='검증만 하고 저장하지 않음')
+        parser.add_argument('--notify', action='store_true', help='모집중 강의마다 모집 시작 알림 발송')
+
+    def handle(self, *args, **options):
+        importer = LectureImporter(
+            chunk_size=options['chunk_size'],
+            dry_run=options['dry_run'],
+            notify=options['notify'],
+        )
+        try:
+            file_format = detect_format(options['path'])
+            with open(options['path'], 'rb') as file:
+                result = importer.run(read_rows(file, file_format, options['encoding']))
+        except ImportFileError as e:
+            if e.result is None:
+                raise CommandError(str(e))
+            verb = '검증' if e.result.dry_run else '생성'
+            raise CommandError(f'{e.row}행에서 중단: {e} (앞서 {verb}된 강의 {e.result.created}건)')
+        except OSError as e:
+            raise CommandError(str(e))
+
+        for error in result.errors:
+            messages = '; '.join(f"{name}: {' '.join(texts)}" for name, texts in error['errors'].items())
+            self.stderr.write(f"{error['row']}행: {messages}")
+        if result.failed > len(result.errors):
+            self.stderr.write(f'... 외 {result.failed - len(result.errors)}건')
+
+        verb = '검증' if result.dry_run else '생성'
+        self.stdout.write(self.style.SUCCESS(
+            f'전체 {result.total}행, {verb} {result.created}건, 실패 {result.failed}건'
+        ))
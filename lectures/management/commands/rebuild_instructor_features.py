@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from lectures.recommendations import rebuild_features
+
+
+# 특징 벡터 구성(FEATURE_VERSION)을 바꿨거나 강의 유형/구분/장소가 일괄 수정된 뒤 실행
+class Command(BaseCommand):
+    help = '강사 추천용 특징 벡터를 전부 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        total = rebuild_features(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'강사 {total}명의 특징 벡터를 다시 계산했습니다.'))
@@ -0,0 +1,176 @@
+import json
+import statistics
+import time
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.test.utils import (
+    CaptureQueriesContext,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+from accounts.models import User
+from accounts.notifications import notify_recruitment_open
+from accounts.serializers import RoleTokenObtainPairSerializer
+from lectures.allocation import allocate_lectures
+from lectures.models import Lecture
+
+# 데이터 규모 프리셋 (generate_dataset 인자)
+SIZES = {
+    'small': dict(users=200, lectures=500, applications=5000, notifications=10000, messages=5000, announcements=50),
+    'medium': dict(users=2000, lectures=5000, applications=100000, notifications=200000, messages=100000, announcements=200),
+    'large': dict(users=20000, lectures=50000, applications=2000000, notifications=2000000, messages=1000000, announcements=1000),
+}
+
+
+def percentile(values, q):
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[q - 1]
+
+
+# 테스트 데이터베이스를 새로 만들어 규모별 합성 데이터를 넣고 주요 API/배정/알림 경로를 측정
+# 운영 데이터베이스는 건드리지 않음 (SQLite 는 메모리 DB, PostgreSQL 은 test_ 데이터베이스)
+class Command(BaseCommand):
+    help = '규모별 합성 데이터로 주요 엔드포인트와 배정/알림 경로의 쿼리 수, p50/p95 지연 시간을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='small', help=f"쉼표로 구분 ({', '.join(SIZES)})")
+        parser.add_argument('--repeat', type=int, default=20, help='엔드포인트별 반복 횟수')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--json', dest='json_path', help='결과를 JSON 파일로 저장')
+
+    def handle(self, *args, **options):
+        sizes = [size.strip() for size in options['sizes'].split(',') if size.strip()]
+        unknown = set(sizes) - SIZES.keys()
+        if unknown:
+            raise CommandError(f"알 수 없는 규모: {', '.join(sorted(unknown))}")
+
+        self.repeat = options['repeat']
+        results = []
+
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            # 알림 발송이 별도 스레드와 섞이지 않도록 즉시 실행
+            with override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend'):
+                for size in sizes:
+                    results.extend(self._run_size(size, options['seed']))
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        self._print(results)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as file:
+                json.dump(results, file, ensure_ascii=False, indent=2)
+
+    def _run_size(self, size, seed):
+        self.stdout.write(f'[{size}] 데이터 생성 중...')
+        started = time.perf_counter()
+        call_command('generate_dataset', flush=True, seed=seed, stdout=self.stdout, **SIZES[size])
+        self.stdout.write(f'[{size}] 생성 {time.perf_counter() - started:.1f}s')
+
+        manager = User.objects.filter(role=User.Role.MANAGER).order_by('id').first()
+        instructor = User.objects.filter(role=User.Role.INSTRUCTOR).order_by('id').first()
+        lecture = Lecture.objects.order_by('id').first()
+        busy_lecture = (
+            Lecture.objects.annotate(count=Count('applications')).order_by('-count', 'id').values_list('id', flat=True)[0]
+        )
+
+        manager_client = self._client(manager)
+        instructor_client = self._client(instructor)
+        cursor_path = self._deep_cursor(manager_client, '/api/lectures/', pages=5)
+
+        endpoints = [
+            ('lecture list', manager_client, '/api/lectures/'),
+            ('lecture list (page 6)', manager_client, cursor_path),
+            ('lecture list (filtered)', manager_client, '/api/lectures/?status=recruiting&type=camp'),
+            ('lecture list (100 rows)', manager_client, '/api/lectures/?page_size=100'),
+            ('lecture detail', manager_client, f'/api/lectures/{lecture.id}/'),
+            ('lecture applications', manager_client, f'/api/lectures/{lecture.id}/applications/'),
+            ('application list (200 rows)', manager_client, f'/api/lectures/{busy_lecture}/applications/?page_size=200'),
+            ('notification list (100 rows)', instructor_client, '/api/accounts/notifications/?page_size=100'),
+            ('announcement list', manager_client, '/api/announcements/'),
+            ('notification list', instructor_client, '/api/accounts/notifications/'),
+            ('unread counts', instructor_client, '/api/accounts/unread-counts/'),
+            ('inbox', instructor_client, '/api/communications/inbox/'),
+            ('search', instructor_client, '/api/search/?q=로봇'),
+            ('dashboard', manager_client, '/api/dashboard/'),
+            ('recommendations', manager_client, f'/api/lectures/{lecture.id}/recommendations/'),
+        ]
+
+        results = []
+        for name, client, path in endpoints:
+            for cached in (False, True):
+                results.append(self._measure_endpoint(size, name, client, path, cached))
+
+        results.append(self._measure_once(size, 'allocation (20 lectures)', self._allocate))
+        results.append(self._measure_once(
+            size, 'recruitment fan-out', lambda: notify_recruitment_open(lecture.id)
+        ))
+        return results
+
+    def _client(self, user):
+        token = RoleTokenObtainPairSerializer.get_token(user).access_token
+        return Client(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def _deep_cursor(self, client, path, pages):
+        for _ in range(pages):
+            next_url = client.get(path).json().get('next')
+            if not next_url:
+                break
+            path = next_url.replace('http://testserver', '')
+        return path
+
+    def _measure_endpoint(self, size, name, client, path, cached):
+        latencies = []
+        queries = 0
+        for _ in range(self.repeat):
+            if not cached:
+                caches['default'].clear()
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                response = client.get(path)
+                latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise CommandError(f'{name}: {path} -> {response.status_code}')
+            queries = len(context)
+        return self._row(size, f"{name}{' [cached]' if cached else ''}", queries, latencies)
+
+    def _measure_once(self, size, name, func):
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            func()
+            latency = (time.perf_counter() - started) * 1000
+        return self._row(size, name, len(context), [latency])
+
+    def _allocate(self):
+        lecture_ids = list(
+            Lecture.objects.filter(recruitment_info__isnull=False).order_by('id').values_list('id', flat=True)[:20]
+        )
+        Lecture.objects.filter(id__in=lecture_ids).update(status=Lecture.LectureStatus.ALLOCATING)
+        allocate_lectures(lecture_ids)
+
+    def _row(self, size, name, queries, latencies):
+        return {
+            'size': size,
+            'scenario': name,
+            'queries': queries,
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+        }
+
+    def _print(self, results):
+        self.stdout.write(f"{'size':<8} {'scenario':<36} {'queries':>7} {'p50 ms':>9} {'p95 ms':>9}")
+        for row in results:
+            self.stdout.write(
+                f"{row['size']:<8} {row['scenario']:<36} {row['queries']:>7} {row['p50_ms']:>9} {row['p95_ms']:>9}"
+            )
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from lectures.transitions import BATCH_SIZE, run_transitions
+
+
+# cron 등에서 주기적으로 실행하거나 --loop 로 상주 실행
+# 여러 프로세스가 동시에 돌아도 잠긴 행은 건너뛰므로 같은 강의를 두 번 처리하지 않음
+class Command(BaseCommand):
+    help = '모집 마감일이 지난 강의를 배정 중으로 바꾸고, 배정 완료 강의의 미배정 지원서를 정리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--loop', action='store_true', help='interval 초마다 반복 실행')
+        parser.add_argument('--interval', type=int, default=60)
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            result = run_transitions(batch_size=options['batch_size'])
+            self.stdout.write(
+                f'모집 마감 {len(result.closed_lecture_ids)}건, '
+                f'미배정 지원 정리 {result.settled_application_count}건 '
+                f'(강의 {len(result.settled_lecture_ids)}건)'
+            )
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
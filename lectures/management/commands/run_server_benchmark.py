@@ -0,0 +1,224 @@
+import asyncio
+import io
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from django.test.utils import (
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+from accounts.models import User
+from accounts.serializers import RoleTokenObtainPairSerializer
+from announcements.models import Announcement
+from lectures.models import Lecture
+from .run_benchmarks import SIZES, percentile
+
+HOST = 'testserver'
+
+
+def wsgi_environ(path, token):
+    path, _, query = path.partition('?')
+    return {
+        'REQUEST_METHOD': 'GET',
+        'SCRIPT_NAME': '',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'SERVER_NAME': HOST,
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'REMOTE_ADDR': '127.0.0.1',
+        'HTTP_HOST': HOST,
+        'HTTP_AUTHORIZATION': token,
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': io.BytesIO(b''),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+
+
+def asgi_scope(path, token):
+    path, _, query = path.partition('?')
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query.encode(),
+        'root_path': '',
+        'headers': [(b'host', HOST.encode()), (b'authorization', token.encode())],
+        'client': ('127.0.0.1', 50000),
+        'server': (HOST, 80),
+    }
+
+
+# 같은 URL 설정을 WSGI(config/wsgi.py), ASGI(config/asgi.py) 애플리케이션으로 직접 호출해 동시 접속 처리량 비교
+# - WSGI: 워커 스레드 --workers 개. 워커가 모두 사용 중이면 다음 요청은 대기
+# - ASGI: 이벤트 루프 하나에서 동시 접속 수만큼 요청을 처리
+# - --client-delay: 느린 클라이언트가 응답을 받아 가는 시간. WSGI 는 그동안 워커를 점유함
+# 네트워크/서버 프로세스 비용은 포함되지 않으며, 운영 DB 는 건드리지 않음 (테스트 데이터베이스 사용)
+class Command(BaseCommand):
+    help = '읽기 엔드포인트의 WSGI/ASGI 동시 접속 처리량(req/s)과 p50/p95 지연 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', default='small', choices=list(SIZES))
+        parser.add_argument('--concurrency', default='10,50', help='동시 접속 수 (쉼표로 구분)')
+        parser.add_argument('--requests', type=int, default=200, help='엔드포인트/동시 접속 수별 요청 수')
+        parser.add_argument('--workers', type=int, default=8, help='WSGI 워커 스레드 수')
+        parser.add_argument('--client-delay', type=float, default=20, help='느린 클라이언트 응답 수신 시간 (ms)')
+        parser.add_argument('--no-cache', action='store_true', help='응답 캐시 없이 측정')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        try:
+            levels = [int(level) for level in options['concurrency'].split(',') if level.strip()]
+        except ValueError:
+            raise CommandError('--concurrency 는 쉼표로 구분한 정수여야 합니다.')
+        self.requests = options['requests']
+        self.workers = options['workers']
+        self.delay = options['client_delay'] / 1000
+
+        test_settings = {'TASK_QUEUE_BACKEND': 'config.tasks.InlineBackend'}
+        if options['no_cache']:
+            test_settings['CACHES'] = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            with override_settings(**test_settings):
+                call_command(
+                    'generate_dataset', flush=True, seed=options['seed'], stdout=self.stdout, **SIZES[options['size']]
+                )
+                results = self._run(levels)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        self._print(results)
+
+    def _run(self, levels):
+        from config.asgi import application as asgi_application
+        from config.wsgi import application as wsgi_application
+
+        manager = User.objects.filter(role=User.Role.MANAGER).order_by('id').first()
+        instructor = User.objects.filter(role=User.Role.INSTRUCTOR).order_by('id').first()
+        lecture = Lecture.objects.order_by('id').first()
+        announcement = Announcement.objects.order_by('id').first()
+        manager_token = self._token(manager)
+        instructor_token = self._token(instructor)
+
+        endpoints = [
+            ('lecture list', manager_token, '/api/lectures/'),
+            ('lecture detail', manager_token, f'/api/lectures/{lecture.id}/'),
+            ('announcement list', manager_token, '/api/announcements/'),
+            ('announcement detail', manager_token, f'/api/announcements/{announcement.id}/'),
+            ('notification list', instructor_token, '/api/accounts/notifications/'),
+            ('inbox', instructor_token, '/api/communications/inbox/'),
+        ]
+
+        results = []
+        for name, token, path in endpoints:
+            for concurrency in levels:
+                caches['default'].clear()
+                wsgi = self._run_wsgi(wsgi_application, path, token, concurrency)
+                caches['default'].clear()
+                asgi = asyncio.run(self._run_asgi(asgi_application, path, token, concurrency))
+                results.append((name, concurrency, wsgi, asgi))
+        return results
+
+    def _token(self, user):
+        return f'Bearer {RoleTokenObtainPairSerializer.get_token(user).access_token}'
+
+    def _run_wsgi(self, application, path, token, concurrency):
+        workers = threading.BoundedSemaphore(self.workers)
+        delay = self.delay
+
+        def request():
+            started = time.perf_counter()
+            with workers:
+                status = []
+                body = application(wsgi_environ(path, token), lambda code, headers, exc_info=None: status.append(code))
+                try:
+                    for _ in body:
+                        # 워커가 느린 클라이언트에게 응답을 쓰는 동안
+                        time.sleep(delay)
+                finally:
+                    if hasattr(body, 'close'):
+                        body.close()
+            if not status[0].startswith('200'):
+                raise CommandError(f'WSGI {path} -> {status[0]}')
+            return (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies = list(executor.map(lambda _: request(), range(self.requests)))
+        return self._stats(latencies, time.perf_counter() - started)
+
+    async def _run_asgi(self, application, path, token, concurrency):
+        delay = self.delay
+        remaining = iter(range(self.requests))
+        latencies = []
+
+        async def request():
+            started = time.perf_counter()
+            status = []
+            received = False
+
+            async def receive():
+                nonlocal received
+                if not received:
+                    received = True
+                    return {'type': 'http.request', 'body': b'', 'more_body': False}
+                # 연결 종료 감시용. 응답이 끝나면 취소됨
+                await asyncio.Future()
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    status.append(message['status'])
+                elif message['type'] == 'http.response.body':
+                    await asyncio.sleep(delay)
+
+            await application(asgi_scope(path, token), receive, send)
+            if status[0] != 200:
+                raise CommandError(f'ASGI {path} -> {status[0]}')
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        async def client():
+            for _ in remaining:
+                await request()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return self._stats(latencies, time.perf_counter() - started)
+
+    def _stats(self, latencies, elapsed):
+        return {
+            'rps': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+        }
+
+    def _print(self, results):
+        self.stdout.write(
+            f"{'endpoint':<22} {'conc':>5} {'wsgi rps':>9} {'asgi rps':>9} "
+            f"{'wsgi p50':>9} {'asgi p50':>9} {'wsgi p95':>9} {'asgi p95':>9}"
+        )
+        for name, concurrency, wsgi, asgi in results:
+            self.stdout.write(
+                f"{name:<22} {concurrency:>5} {wsgi['rps']:>9} {asgi['rps']:>9} "
+                f"{wsgi['p50_ms']:>9} {asgi['p50_ms']:>9} {wsgi['p95_ms']:>9} {asgi['p95_ms']:>9}"
+            )
@@ -0,0 +1,100 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:57
+
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# 기존 Application.portfolio_snapshot 을 내용 해시 기준으로 중복 제거하여 PortfolioSnapshot 으로 이동
+def deduplicate_snapshots(apps, schema_editor):
+    Application = apps.get_model('lectures', 'Application')
+    PortfolioSnapshot = apps.get_model('lectures', 'PortfolioSnapshot')
+
+    rows = (
+        Application.objects
+        .exclude(portfolio_snapshot__isnull=True)
+        .exclude(portfolio_snapshot='')
+        .order_by('id')
+        .values_list('id', 'portfolio_snapshot')
+        .iterator(chunk_size=500)
+    )
+
+    chunk = []
+
+    def flush():
+        contents = {}
+        for _, content in chunk:
+            contents.setdefault(hashlib.sha256(content.encode('utf-8')).hexdigest(), content)
+        PortfolioSnapshot.objects.bulk_create(
+            [PortfolioSnapshot(digest=digest, content=content) for digest, content in contents.items()],
+            ignore_conflicts=True,
+        )
+        snapshot_ids = dict(
+            PortfolioSnapshot.objects.filter(digest__in=contents).values_list('digest', 'id')
+        )
+        Application.objects.bulk_update(
+            [
+                Application(
+                    id=application_id,
+                    portfolio_id=snapshot_ids[hashlib.sha256(content.encode('utf-8')).hexdigest()],
+                )
+                for application_id, content in chunk
+            ],
+            ['portfolio'],
+        )
+        chunk.clear()
+
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= 500:
+            flush()
+    if chunk:
+        flush()
+
+
+# 되돌릴 때는 스냅샷 내용을 다시 각 지원서에 복사
+def restore_snapshots(apps, schema_editor):
+    Application = apps.get_model('lectures', 'Application')
+
+    applications = (
+        Application.objects
+        .filter(portfolio__isnull=False)
+        .select_related('portfolio')
+        .order_by('id')
+        .iterator(chunk_size=500)
+    )
+    chunk = []
+    for application in applications:
+        application.portfolio_snapshot = application.portfolio.content
+        chunk.append(application)
+        if len(chunk) >= 500:
+            Application.objects.bulk_update(chunk, ['portfolio_snapshot'])
+            chunk = []
+    if chunk:
+        Application.objects.bulk_update(chunk, ['portfolio_snapshot'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0002_lecture_cursor_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PortfolioSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True, verbose_name='내용 해시 (SHA-256)')),
+                ('content', models.TextField(verbose_name='포트폴리오 내용')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='portfolio',
+            field=models.ForeignKey(blank=True, help_text='지원 시점의 user.portfolio_content 스냅샷 (같은 내용은 공유)', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='applications', to='lectures.portfoliosnapshot', verbose_name='지원 시점 포트폴리오'),
+        ),
+        migrations.RunPython(deduplicate_snapshots, restore_snapshots),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:57
+
+from django.db import migrations
+
+
+# 0003 의 데이터 이동과 분리: PostgreSQL 에서는 같은 트랜잭션에서 지연 FK 를 갱신한 테이블을
+# ALTER 할 수 없음 ("pending trigger events")
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0003_portfolio_snapshot'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='application',
+            name='portfolio_snapshot',
+        ),
+    ]
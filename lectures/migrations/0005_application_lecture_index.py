@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0004_remove_application_portfolio_snapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['lecture', '-applied_at', '-id'], name='lectures_ap_lecture_74f8aa_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_unread_counter'),
+        ('lectures', '0005_application_lecture_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstructorFeature',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='instructor_feature', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='강사')),
+                ('version', models.PositiveSmallIntegerField(verbose_name='특징 구성 버전')),
+                ('vector', models.BinaryField(verbose_name='특징 벡터')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='갱신일')),
+            ],
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:12
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+# 기존 지원서 수로 정원 카운터를 채움
+def backfill_applicant_count(apps, schema_editor):
+    LectureRecruitment = apps.get_model('lectures', 'LectureRecruitment')
+    Application = apps.get_model('lectures', 'Application')
+
+    counts = (
+        Application.objects
+        .filter(lecture_id=OuterRef('lecture_id'))
+        .order_by()
+        .values('lecture_id')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    LectureRecruitment.objects.update(applicant_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0006_instructor_feature'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='idempotency_key',
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name='멱등 키'),
+        ),
+        migrations.AddField(
+            model_name='lecturerecruitment',
+            name='applicant_count',
+            field=models.IntegerField(default=0, verbose_name='지원자 수'),
+        ),
+        migrations.AddConstraint(
+            model_name='application',
+            constraint=models.UniqueConstraint(condition=models.Q(('idempotency_key__isnull', False)), fields=('user', 'idempotency_key'), name='unique_application_idempotency_key'),
+        ),
+        migrations.RunPython(backfill_applicant_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0007_application_capacity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LectureTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('recruitment_closed', '모집 마감'), ('pending_settled', '미배정 지원 정리')], max_length=30, verbose_name='변경 종류')),
+                ('from_status', models.CharField(max_length=20, verbose_name='이전 상태')),
+                ('to_status', models.CharField(max_length=20, verbose_name='변경 상태')),
+                ('application_count', models.IntegerField(default=0, verbose_name='변경된 지원서 수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='변경 일시')),
+                ('lecture', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transitions', to='lectures.lecture', verbose_name='강의')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['lecture', '-created_at'], name='lectures_le_lecture_74fb3d_idx')],
+            },
+        ),
+    ]
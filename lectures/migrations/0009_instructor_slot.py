@@ -0,0 +1,101 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:17
+
+from bisect import bisect_left, insort
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+# 이 마이그레이션 시점의 lectures.intervals.InstructorSchedule 사본
+# (앱 코드가 바뀌어도 마이그레이션 이력이 같은 결과를 내도록 import 하지 않음)
+class InstructorSchedule:
+    def __init__(self):
+        self._slots = {}
+
+    def add(self, user_id, start, end):
+        insort(self._slots.setdefault(user_id, []), (start, end))
+
+    def conflicts(self, user_id, start, end):
+        slots = self._slots.get(user_id)
+        if not slots:
+            return False
+        index = bisect_left(slots, (end,))
+        return any(slot_end > start for _, slot_end in slots[:index])
+
+
+# 기존 배정으로 시간대 채움. 이미 겹쳐 있는 배정은 먼저 배정된 지원서(id 순)만 남김
+def backfill_slots(apps, schema_editor):
+    Application = apps.get_model('lectures', 'Application')
+    InstructorSlot = apps.get_model('lectures', 'InstructorSlot')
+
+    rows = (
+        Application.objects
+        .filter(
+            assignment_status='assigned',
+            lecture__lecture_start_datetime__isnull=False,
+            lecture__lecture_end_datetime__gt=F('lecture__lecture_start_datetime'),
+        )
+        .order_by('id')
+        .values_list('id', 'user_id', 'lecture_id', 'lecture__lecture_start_datetime', 'lecture__lecture_end_datetime')
+    )
+    schedule = InstructorSchedule()
+    slots = []
+    for application_id, user_id, lecture_id, start, end in rows.iterator(chunk_size=2000):
+        if schedule.conflicts(user_id, start, end):
+            continue
+        schedule.add(user_id, start, end)
+        slots.append(InstructorSlot(
+            application_id=application_id, user_id=user_id, lecture_id=lecture_id, start_at=start, end_at=end,
+        ))
+    InstructorSlot.objects.bulk_create(slots, batch_size=1000)
+
+
+# PostgreSQL 전용: tstzrange 생성 컬럼 + 강사별 겹침 배제 제약 (GiST)
+def create_postgres_constraint(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    schema_editor.execute(
+        'ALTER TABLE lectures_instructorslot ADD COLUMN slot_range tstzrange '
+        "GENERATED ALWAYS AS (tstzrange(start_at, end_at, '[)')) STORED"
+    )
+    schema_editor.execute(
+        'ALTER TABLE lectures_instructorslot ADD CONSTRAINT instructor_slot_no_overlap '
+        'EXCLUDE USING GIST (user_id WITH =, slot_range WITH &&)'
+    )
+
+
+def drop_postgres_constraint(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('ALTER TABLE lectures_instructorslot DROP CONSTRAINT IF EXISTS instructor_slot_no_overlap')
+    schema_editor.execute('ALTER TABLE lectures_instructorslot DROP COLUMN IF EXISTS slot_range')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0008_lecture_transition'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstructorSlot',
+            fields=[
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='slot', serialize=False, to='lectures.application', verbose_name='지원서')),
+                ('start_at', models.DateTimeField(verbose_name='시작 일시')),
+                ('end_at', models.DateTimeField(verbose_name='종료 일시')),
+                ('lecture', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='instructor_slots', to='lectures.lecture', verbose_name='강의')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='instructor_slots', to=settings.AUTH_USER_MODEL, verbose_name='강사')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'start_at'], name='lectures_in_user_id_8f8814_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('end_at__gt', models.F('start_at'))), name='instructor_slot_valid_range')],
+            },
+        ),
+        migrations.RunPython(backfill_slots, migrations.RunPython.noop),
+        migrations.RunPython(create_postgres_constraint, drop_postgres_constraint),
+    ]
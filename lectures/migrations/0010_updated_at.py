@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:52
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+# 기존 행의 수정일은 생성/지원 일시로 채움
+def backfill_updated_at(apps, schema_editor):
+    apps.get_model('lectures', 'Lecture').objects.update(updated_at=models.F('created_at'))
+    apps.get_model('lectures', 'Application').objects.update(updated_at=models.F('applied_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0009_instructor_slot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lecture',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='수정일'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='lecturerecruitment',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='수정일'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='수정일'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
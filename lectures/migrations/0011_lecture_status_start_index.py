@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 20:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0010_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lecture',
+            index=models.Index(fields=['status', 'lecture_start_datetime'], name='lectures_le_status_f98296_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='lecture',
+            name='lectures_le_status_5137b6_idx',
+        ),
+    ]
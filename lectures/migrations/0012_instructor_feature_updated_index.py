@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 20:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0011_lecture_status_start_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='instructorfeature',
+            index=models.Index(fields=['updated_at'], name='lectures_in_updated_6dbe6a_idx'),
+        ),
+    ]
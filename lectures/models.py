@@ -1,9 +1,49 @@
-from django.db import models
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db import models, IntegrityError, transaction
 from django.conf import settings
 
 
+class LectureQuerySet(models.QuerySet):
+    # 목록 응답의 역할별 지원자 수 (main_applicant_count, assist_applicant_count)
+    def with_applicant_counts(self):
+        return self.annotate(
+            main_applicant_count=models.Count(
+                'applications',
+                filter=models.Q(applications__applied_role=Application.LectureRole.MAIN),
+            ),
+            assist_applicant_count=models.Count(
+                'applications',
+                filter=models.Q(applications__applied_role=Application.LectureRole.ASSIST),
+            ),
+        )
+
+
+# DB 에서 읽은 시점의 추적 필드 값을 기억해, 저장 시그널이 실제로 바뀐 필드가 있을 때만 조회/재계산하게 함
+# (새 인스턴스나 지연 로드된 필드처럼 읽은 값을 모르면 바뀐 것으로 봄)
+class TrackedFieldsMixin:
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: value for name, value in zip(field_names, values) if name in cls.tracked_fields
+        }
+        return instance
+
+    def has_changed(self, names):
+        loaded = getattr(self, '_loaded_values', {})
+        return any(name not in loaded or loaded[name] != getattr(self, name) for name in names)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._loaded_values = {name: getattr(self, name) for name in self.tracked_fields}
+
+
 # Lecture
-class Lecture(models.Model):
+class Lecture(TrackedFieldsMixin, models.Model):
     class LectureType(models.TextChoices):
         GENERAL = 'general', '일반 (노랑)'
         COMPETITION = 'competition', '대회 (하늘)'
@@ -59,22 +99,45 @@ class Lecture(models.Model):
     attachment_url = models.URLField('첨부파일 URL', max_length=255, blank=True, null=True)
 
     created_at = models.DateTimeField('생성일', auto_now_add=True)
+    # 모바일 동기화(sync 앱)용. update()/bulk_update() 경로에서는 직접 채움
+    updated_at = models.DateTimeField('수정일', auto_now=True)
+
+    objects = LectureQuerySet.as_manager()
+
+    # 대시보드 집계 필드와 강사 시간대에 쓰이는 강의 시간
+    tracked_fields = ('status', 'type', 'lecture_start_datetime', 'lecture_end_datetime')
+    SCHEDULE_FIELDS = ('lecture_start_datetime', 'lecture_end_datetime')
 
     class Meta:
         ordering = ['-created_at']  # 최신 순
         indexes = [
             models.Index(fields=['manager']),
-            models.Index(fields=['status']),
+            # 상태별 기간 조회 (강의 일정의 모집중 강의 등). status 단독 조회도 이 인덱스를 사용
+            models.Index(fields=['status', 'lecture_start_datetime']),
             models.Index(fields=['type']),
             models.Index(fields=['lecture_start_datetime']),
+            # 커서 페이지네이션 (created_at, id) 순서
+            models.Index(fields=['-created_at', '-id']),
         ]
 
     def __str__(self):
         return f"[{self.get_type_display()}] {self.title}"
 
+    # 폼(관리자 화면 등) 검증: 시간을 옮겨 배정된 강사의 다른 배정과 겹치면 오류
+    # (저장 시에는 signals.check_lecture_slots 가 SlotConflict 로 막음)
+    def clean(self):
+        super().clean()
+        if self._state.adding or not self.has_changed(self.SCHEDULE_FIELDS):
+            return
+        from .schedules import SlotConflict, lecture_slot_conflicts  # schedules 가 이 모듈을 import 함
+
+        conflicts = lecture_slot_conflicts(self.id, self.lecture_start_datetime, self.lecture_end_datetime)
+        if conflicts:
+            raise ValidationError({'lecture_start_datetime': str(SlotConflict(conflicts))})
+
 
 # LectureRecruitment
-class LectureRecruitment(models.Model):
+class LectureRecruitment(TrackedFieldsMixin, models.Model):
     lecture = models.OneToOneField(
         Lecture,
         on_delete=models.CASCADE,  # 강의가 삭제되면 모집 정보도 삭제
@@ -93,12 +156,55 @@ class LectureRecruitment(models.Model):
     fee_main = models.IntegerField('주강사 강의료', blank=True, null=True)
     fee_assist = models.IntegerField('보조강사 강의료', blank=True, null=True)
 
+    # 지원서 수 (max_participants 와 비교하는 정원 카운터, 조건부 UPDATE 로만 증가)
+    applicant_count = models.IntegerField('지원자 수', default=0)
+
+    # 모집 정보 수정 시각 (정원 카운터 변경은 포함하지 않음)
+    updated_at = models.DateTimeField('수정일', auto_now=True)
+
+    # 대시보드 집계 필드
+    tracked_fields = ('recruitment_main_needed', 'recruitment_assist_needed')
+
     def __str__(self):
         return f"{self.lecture.title} - 모집 정보"
 
 
+# PortfolioSnapshot
+# 지원 시점 포트폴리오를 내용 해시(SHA-256) 기준으로 한 번만 저장
+class PortfolioSnapshotManager(models.Manager):
+    def intern(self, content):
+        # 같은 내용이면 기존 스냅샷을 재사용
+        if not content:
+            return None
+        digest = PortfolioSnapshot.digest_of(content)
+        snapshot = self.filter(digest=digest).first()
+        if snapshot is not None:
+            return snapshot
+        try:
+            with transaction.atomic():
+                return self.create(digest=digest, content=content)
+        except IntegrityError:
+            # 동시에 같은 내용이 먼저 저장된 경우
+            return self.get(digest=digest)
+
+
+class PortfolioSnapshot(models.Model):
+    digest = models.CharField('내용 해시 (SHA-256)', max_length=64, unique=True)
+    content = models.TextField('포트폴리오 내용')
+    created_at = models.DateTimeField('생성일', auto_now_add=True)
+
+    objects = PortfolioSnapshotManager()
+
+    @staticmethod
+    def digest_of(content):
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def __str__(self):
+        return f"포트폴리오 스냅샷 {self.digest[:12]}"
+
+
 # Application
-class Application(models.Model):
+class Application(TrackedFieldsMixin, models.Model):
     class LectureRole(models.TextChoices):
         MAIN = 'main', '주도로맨 (주강사)'
         ASSIST = 'assist', '보조도로맨 (보조강사)'
@@ -130,11 +236,14 @@ class Application(models.Model):
         choices=LectureRole.choices
     )
 
-    portfolio_snapshot = models.TextField(
-        '지원 시점 포트폴리오',
+    portfolio = models.ForeignKey(
+        PortfolioSnapshot,
+        on_delete=models.PROTECT,
+        related_name='applications',
+        verbose_name='지원 시점 포트폴리오',
         blank=True,
         null=True,
-        help_text="지원 시점의 user.portfolio_content를 복사하여 저장"
+        help_text="지원 시점의 user.portfolio_content 스냅샷 (같은 내용은 공유)"
     )
 
     assignment_status = models.CharField(
@@ -153,14 +262,136 @@ class Application(models.Model):
     )
 
     applied_at = models.DateTimeField('지원 일시', auto_now_add=True)
+    updated_at = models.DateTimeField('수정일', auto_now=True)
+
+    # 같은 요청의 재시도를 구분하는 클라이언트 키 (Idempotency-Key 헤더)
+    idempotency_key = models.CharField('멱등 키', max_length=64, blank=True, null=True)
+
+    # 대시보드 집계 필드와 강사 시간대를 결정하는 필드
+    tracked_fields = ('assignment_status', 'assigned_role', 'lecture_id', 'user_id')
+    SLOT_FIELDS = ('assignment_status', 'lecture_id', 'user_id')
 
     class Meta:
         ordering = ['-applied_at']
         # 강의 ID, 유저 ID, 지원 역할 unique
         unique_together = ('lecture', 'user', 'applied_role')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'idempotency_key'],
+                condition=models.Q(idempotency_key__isnull=False),
+                name='unique_application_idempotency_key',
+            ),
+        ]
         indexes = [
             models.Index(fields=['user']),
+            # 강의별 지원 내역 커서 페이지네이션
+            models.Index(fields=['lecture', '-applied_at', '-id']),
+        ]
+
+    def __str__(self):
+        return f"{self.user.name} 님의 {self.lecture.title} 지원 ({self.get_applied_role_display()})"
+
+    @property
+    def portfolio_snapshot(self):
+        # 목록 조회에서는 portfolio 를 불러오지 않음. 상세 조회는 select_related('portfolio') 사용
+        return self.portfolio.content if self.portfolio_id else None
+
+
+# InstructorFeature
+# 강사 추천용 특징 벡터 (배정/지원 이력 집계, float32 바이트열)
+# 지원/배정 결과가 바뀐 강사만 다시 계산함 (lectures/recommendations.py)
+class InstructorFeature(models.Model):
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='instructor_feature',
+        verbose_name='강사'
+    )
+
+    version = models.PositiveSmallIntegerField('특징 구성 버전')
+    vector = models.BinaryField('특징 벡터')
+
+    updated_at = models.DateTimeField('갱신일', auto_now=True)
+
+    class Meta:
+        indexes = [
+            # 추천 행렬의 변경분 다시 읽기 (recommendations.get_matrix)
+            models.Index(fields=['updated_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} 강사 특징 벡터 (v{self.version})"
+
+
+# LectureTransition
+# 스케줄러(lectures/transitions.py)가 일괄로 바꾼 상태 기록
+class LectureTransition(models.Model):
+    class Kind(models.TextChoices):
+        RECRUITMENT_CLOSED = 'recruitment_closed', '모집 마감'
+        PENDING_SETTLED = 'pending_settled', '미배정 지원 정리'
+
+    lecture = models.ForeignKey(
+        Lecture,
+        on_delete=models.CASCADE,
+        related_name='transitions',
+        verbose_name='강의'
+    )
+
+    kind = models.CharField('변경 종류', max_length=30, choices=Kind.choices)
+    from_status = models.CharField('이전 상태', max_length=20)
+    to_status = models.CharField('변경 상태', max_length=20)
+    # 지원서 상태를 바꾼 경우 바뀐 지원서 수
+    application_count = models.IntegerField('변경된 지원서 수', default=0)
+
+    created_at = models.DateTimeField('변경 일시', auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['lecture', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.lecture_id} {self.get_kind_display()}: {self.from_status} → {self.to_status}"
+
+
+# InstructorSlot
+# 배정된 지원서의 강의 시간대 (강사별 시간 겹침 검사용, lectures/schedules.py 에서만 갱신)
+# PostgreSQL 에서는 slot_range(tstzrange) 생성 컬럼과 GiST 배제 제약으로 겹치는 배정을 DB 가 거부 (migration 0008)
+class InstructorSlot(models.Model):
+    application = models.OneToOneField(
+        Application,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='slot',
+        verbose_name='지원서'
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='instructor_slots',
+        verbose_name='강사'
+    )
+
+    lecture = models.ForeignKey(
+        Lecture,
+        on_delete=models.CASCADE,
+        related_name='instructor_slots',
+        verbose_name='강의'
+    )
+
+    start_at = models.DateTimeField('시작 일시')
+    end_at = models.DateTimeField('종료 일시')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'start_at']),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(end_at__gt=models.F('start_at')), name='instructor_slot_valid_range'),
         ]
 
     def __str__(self):
-        return f"{self.user.name} 님의 {self.lecture.title} 지원 ({self.get_applied_role_display()})"
\ No newline at end of file
+        return f"{self.user_id} 강사 {self.start_at} ~ {self.end_at}"
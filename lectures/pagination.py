@@ -0,0 +1,18 @@
+from config.pagination import AsyncCursorPagination
+
+
+# 강의 목록 커서(keyset) 페이지네이션
+# Lecture.Meta.ordering 과 같은 (created_at, id) 순서를 사용하므로 깊은 페이지도 OFFSET 없이 조회
+class LectureCursorPagination(AsyncCursorPagination):
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+# 강의별 지원 내역 커서 페이지네이션
+class ApplicationCursorPagination(AsyncCursorPagination):
+    ordering = ('-applied_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
@@ -0,0 +1,359 @@
+import threading
+import time
+import zlib
+from array import array
+from datetime import timedelta
+
+from django.db.models import Count
+from django.utils import timezone
+
+from accounts.models import User
+from accounts.notifications import chunked, iterate_by_key
+from config.cache import bump_versions, get_versions
+from .models import Lecture, Application, InstructorFeature
+
+FEATURES_NAMESPACE = 'instructor-features'
+
+# 특징 벡터 구성 (바꾸면 FEATURE_VERSION 을 올리고 rebuild_instructor_features 실행)
+FEATURE_VERSION = 1
+TYPES = Lecture.LectureType.values + [None]
+ROLES = Application.LectureRole.values
+BUCKETS = 32  # 강의 구분/장소는 자유 입력이라 해시 버킷으로 셈
+
+TYPE_OFFSET = 0
+CATEGORY_OFFSET = TYPE_OFFSET + len(TYPES)
+LOCATION_OFFSET = CATEGORY_OFFSET + BUCKETS
+ASSIGNED_ROLE_OFFSET = LOCATION_OFFSET + BUCKETS
+APPLIED_ROLE_OFFSET = ASSIGNED_ROLE_OFFSET + len(ROLES)
+ASSIGNED_TOTAL = APPLIED_ROLE_OFFSET + len(ROLES)
+APPLIED_TOTAL = ASSIGNED_TOTAL + 1
+DIMENSIONS = APPLIED_TOTAL + 1
+
+# 점수 가중치 (이력 값은 log1p 로 눌러서 사용)
+WEIGHTS = {
+    'type': 1.0,
+    'category': 1.5,
+    'location': 1.0,
+    'role': 1.2,
+    'assign_rate': 0.8,
+    'load': 0.7,
+}
+# 강의 전후 이 기간 안에 이미 배정된 강의 수를 부하로 봄
+LOAD_WINDOW = timedelta(days=7)
+# 다시 읽기 사이 최소 간격 (초). 지원이 몰릴 때 매 요청마다 행렬을 다시 읽지 않도록 함
+MIN_RELOAD_SECONDS = 5
+# 평소에는 변경분만 다시 읽고, 가입/비활성화/역할 변경까지 반영하도록 이 간격(초)마다 전체를 다시 읽음
+FULL_RELOAD_SECONDS = 10 * 60
+# 갱신 시각은 앱 서버 시계로 기록되고 커밋 순서와 다를 수 있으므로 변경분은 이만큼 겹쳐 읽음
+RELOAD_OVERLAP = timedelta(minutes=1)
+BATCH_SIZE = 1000
+
+
+class RecommendationUnavailable(Exception):
+    pass
+
+
+# numpy 는 추천 점수 계산에만 필요
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise RecommendationUnavailable('강사 추천에는 numpy 패키지가 필요합니다. (pip install numpy)')
+    return numpy
+
+
+def bucket(text):
+    return zlib.crc32(text.strip().lower().encode('utf-8')) % BUCKETS
+
+
+# 특징 벡터 계산/저장 (numpy 없이 동작)
+# 지원서를 (강사, 상태, 역할, 강의 유형/구분/장소) 로 묶은 집계만 읽음
+def compute_features(user_ids):
+    vectors = {user_id: [0.0] * DIMENSIONS for user_id in user_ids}
+    rows = (
+        Application.objects
+        .filter(user_id__in=user_ids)
+        .order_by()
+        .values(
+            'user_id', 'assignment_status', 'applied_role', 'assigned_role',
+            'lecture__type', 'lecture__category', 'lecture__location',
+        )
+        .annotate(count=Count('id'))
+    )
+    for row in rows:
+        vector = vectors[row['user_id']]
+        count = row['count']
+        vector[APPLIED_TOTAL] += count
+        if row['applied_role'] in ROLES:
+            vector[APPLIED_ROLE_OFFSET + ROLES.index(row['applied_role'])] += count
+        if row['assignment_status'] != Application.AssignmentStatus.ASSIGNED:
+            continue
+
+        vector[ASSIGNED_TOTAL] += count
+        if row['assigned_role'] in ROLES:
+            vector[ASSIGNED_ROLE_OFFSET + ROLES.index(row['assigned_role'])] += count
+        if row['lecture__type'] in TYPES:
+            vector[TYPE_OFFSET + TYPES.index(row['lecture__type'])] += count
+        if row['lecture__category']:
+            vector[CATEGORY_OFFSET + bucket(row['lecture__category'])] += count
+        if row['lecture__location']:
+            vector[LOCATION_OFFSET + bucket(row['lecture__location'])] += count
+    return vectors
+
+
+def refresh_features(user_ids):
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return 0
+    for chunk in chunked(user_ids, BATCH_SIZE):
+        InstructorFeature.objects.bulk_create(
+            [
+                InstructorFeature(user_id=user_id, version=FEATURE_VERSION, vector=array('f', vector).tobytes())
+                for user_id, vector in compute_features(chunk).items()
+            ],
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=['version', 'vector', 'updated_at'],
+        )
+    bump_versions([FEATURES_NAMESPACE])
+    return len(user_ids)
+
+
+def rebuild_features(batch_size=BATCH_SIZE):
+    instructors = iterate_by_key(User.objects.filter(role=User.Role.INSTRUCTOR), 'id', batch_size=batch_size)
+    total = 0
+    for chunk in chunked(instructors, batch_size):
+        total += refresh_features([user_id for user_id, in chunk])
+    return total
+
+
+# 프로세스마다 활성 강사 전체의 특징 행렬을 메모리에 둠
+# 특징이 갱신되면 네임스페이스 버전이 바뀌고, 다음 요청에서 그 뒤로 갱신된 특징 행만 읽어 반영
+# (행렬은 읽기 전용으로 공유하므로 반영할 때는 복사본을 만들어 바꿔 끼움)
+class FeatureMatrix:
+    def __init__(self, version, user_ids, matrix, updated_until, full_loaded_at=None):
+        self.version = version
+        self.user_ids = user_ids  # 오름차순
+        self.matrix = matrix
+        # 이 시각까지 갱신된 특징이 반영됨 (다음 변경분 조회 기준)
+        self.updated_until = updated_until
+        self.loaded_at = time.monotonic()
+        self.full_loaded_at = self.loaded_at if full_loaded_at is None else full_loaded_at
+
+    def rows_of(self, user_ids):
+        # 행렬에 없는 강사는 -1
+        np = _numpy()
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        rows = np.searchsorted(self.user_ids, user_ids)
+        rows[rows >= len(self.user_ids)] = 0
+        found = self.user_ids[rows] == user_ids if len(self.user_ids) else np.zeros(len(user_ids), dtype=bool)
+        return np.where(found, rows, -1)
+
+
+_matrix = None
+_matrix_lock = threading.Lock()
+EMPTY_VECTOR = bytes(DIMENSIONS * 4)
+
+
+def _vectors(np, rows):
+    # 이력이 없거나 구성 버전이 다른 벡터는 0 으로 둠
+    vectors = [bytes(vector) if version == FEATURE_VERSION else EMPTY_VECTOR for version, vector in rows]
+    return np.frombuffer(b''.join(vectors), dtype=np.float32).reshape(len(vectors), DIMENSIONS)
+
+
+def _load_matrix(version):
+    np = _numpy()
+    started_at = timezone.now()
+    rows = list(
+        User.objects
+        .filter(role=User.Role.INSTRUCTOR, is_active=True)
+        .order_by('id')
+        .values_list(
+            'id', 'instructor_feature__version', 'instructor_feature__vector', 'instructor_feature__updated_at',
+        )
+    )
+    updated_until = max((row[3] for row in rows if row[3] is not None), default=started_at)
+    return FeatureMatrix(
+        version,
+        np.asarray([row[0] for row in rows], dtype=np.int64),
+        _vectors(np, [(row[1], row[2]) for row in rows]),
+        updated_until,
+    )
+
+
+# current 이후 갱신된 특징 행만 읽어 반영한 새 행렬 (새로 특징이 생긴 강사는 행 추가)
+def _update_matrix(current, version):
+    np = _numpy()
+    rows = list(
+        InstructorFeature.objects
+        .filter(
+            updated_at__gte=current.updated_until - RELOAD_OVERLAP,
+            user__role=User.Role.INSTRUCTOR,
+            user__is_active=True,
+        )
+        .values_list('user_id', 'version', 'vector', 'updated_at')
+    )
+    if not rows:
+        return FeatureMatrix(version, current.user_ids, current.matrix, current.updated_until, current.full_loaded_at)
+
+    user_ids = np.asarray([row[0] for row in rows], dtype=np.int64)
+    vectors = _vectors(np, [(row[1], row[2]) for row in rows])
+    positions = current.rows_of(user_ids)
+    known = positions >= 0
+    matrix = current.matrix.copy()
+    matrix[positions[known]] = vectors[known]
+    all_ids = current.user_ids
+    if not known.all():
+        all_ids = np.concatenate([all_ids, user_ids[~known]])
+        matrix = np.concatenate([matrix, vectors[~known]])
+        order = np.argsort(all_ids, kind='stable')
+        all_ids, matrix = all_ids[order], matrix[order]
+    updated_until = max(current.updated_until, max(row[3] for row in rows))
+    return FeatureMatrix(version, all_ids, matrix, updated_until, current.full_loaded_at)
+
+
+def get_matrix():
+    global _matrix
+    version = get_versions([FEATURES_NAMESPACE])[0]
+    current = _matrix
+    if current is not None and (
+        current.version == version or time.monotonic() - current.loaded_at < MIN_RELOAD_SECONDS
+    ):
+        return current
+    with _matrix_lock:
+        if _matrix is None or _matrix is current:
+            if current is None or time.monotonic() - current.full_loaded_at >= FULL_RELOAD_SECONDS:
+                _matrix = _load_matrix(version)
+            else:
+                _matrix = _update_matrix(current, version)
+        return _matrix
+
+
+# 강의 시간 전후 LOAD_WINDOW 안의 배정 수와 강의 시간과 겹치는 배정 여부 (행렬 행 기준)
+def _load_and_conflicts(features, lecture):
+    np = _numpy()
+    size = len(features.user_ids)
+    load = np.zeros(size, dtype=np.float32)
+    conflict = np.zeros(size, dtype=bool)
+    start, end = lecture.lecture_start_datetime, lecture.lecture_end_datetime
+    if start is None or end is None:
+        return load, conflict
+
+    rows = list(
+        Application.objects
+        .filter(
+            assignment_status=Application.AssignmentStatus.ASSIGNED,
+            lecture__lecture_start_datetime__lt=end + LOAD_WINDOW,
+            lecture__lecture_end_datetime__gt=start - LOAD_WINDOW,
+        )
+        .exclude(lecture_id=lecture.id)
+        .values_list('user_id', 'lecture__lecture_start_datetime', 'lecture__lecture_end_datetime')
+    )
+    if not rows:
+        return load, conflict
+
+    user_ids, starts, ends = zip(*rows)
+    indexes = features.rows_of(user_ids)
+    known = indexes >= 0
+    np.add.at(load, indexes[known], 1)
+    starts = np.array([value.timestamp() for value in starts])
+    ends = np.array([value.timestamp() for value in ends])
+    overlaps = (starts < end.timestamp()) & (ends > start.timestamp()) & known
+    conflict[indexes[overlaps]] = True
+    return load, conflict
+
+
+# 후보 행렬(candidates × DIMENSIONS)의 점수를 한 번에 계산 (필요한 열만 꺼내서 사용)
+def _score(np, vectors, roles, lecture, load):
+    lecture_type = lecture.type if lecture.type in TYPES else None
+    score = WEIGHTS['type'] * np.log1p(vectors[:, TYPE_OFFSET + TYPES.index(lecture_type)])
+    if lecture.category:
+        score += WEIGHTS['category'] * np.log1p(vectors[:, CATEGORY_OFFSET + bucket(lecture.category)])
+    if lecture.location:
+        score += WEIGHTS['location'] * np.log1p(vectors[:, LOCATION_OFFSET + bucket(lecture.location)])
+    score += WEIGHTS['role'] * np.log1p(vectors[np.arange(len(vectors)), ASSIGNED_ROLE_OFFSET + roles])
+    score += WEIGHTS['assign_rate'] * vectors[:, ASSIGNED_TOTAL] / (vectors[:, APPLIED_TOTAL] + 1)
+    score -= WEIGHTS['load'] * np.log1p(load)
+    return score
+
+
+def _top(np, scores, k):
+    if len(scores) > k:
+        candidates = np.argpartition(-scores, k)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+# 강의 하나에 대한 강사 추천
+# - applicants: 이 강의 지원자 (지원 역할 기준 점수, 시간이 겹치면 맨 뒤)
+# - others: 지원하지 않은 활성 강사 중 role 기준 상위 k 명 (시간이 겹치는 강사 제외)
+def recommend(lecture, role=Application.LectureRole.MAIN, k=20):
+    np = _numpy()
+    features = get_matrix()
+    load, conflict = _load_and_conflicts(features, lecture)
+
+    applications = list(
+        Application.objects
+        .filter(lecture_id=lecture.id)
+        .order_by('applied_at', 'id')
+        .values_list('id', 'user_id', 'applied_role', 'assignment_status')
+    )
+
+    # 지원자: 행렬에 아직 없는 강사(방금 가입 등)는 0 벡터
+    applicant_rows = features.rows_of([user_id for _, user_id, _, _ in applications])
+    known = applicant_rows >= 0
+    vectors = np.zeros((len(applications), DIMENSIONS), dtype=np.float32)
+    vectors[known] = features.matrix[applicant_rows[known]]
+    applicant_load = np.zeros(len(applications), dtype=np.float32)
+    applicant_load[known] = load[applicant_rows[known]]
+    applicant_conflict = np.zeros(len(applications), dtype=bool)
+    applicant_conflict[known] = conflict[applicant_rows[known]]
+    roles = np.array([ROLES.index(applied_role) for _, _, applied_role, _ in applications], dtype=np.int64)
+    scores = _score(np, vectors, roles, lecture, applicant_load)
+    # 시간이 겹치는 지원자는 맨 뒤로
+    order = np.lexsort((-scores, applicant_conflict))
+
+    # 비지원자: 전체 행렬 점수에서 지원자와 시간이 겹치는 강사를 제외
+    eligible = ~conflict
+    eligible[applicant_rows[known]] = False
+    other_scores = _score(
+        np,
+        features.matrix,
+        np.full(len(features.user_ids), ROLES.index(role), dtype=np.int64),
+        lecture,
+        load,
+    )
+    other_scores[~eligible] = -np.inf
+    top = _top(np, other_scores, min(k, int(eligible.sum())))
+
+    applicant_items = [
+        {
+            'application': applications[index][0],
+            'user': applications[index][1],
+            'applied_role': applications[index][2],
+            'assignment_status': applications[index][3],
+            'score': round(float(scores[index]), 4),
+            'load': int(applicant_load[index]),
+            'conflict': bool(applicant_conflict[index]),
+        }
+        for index in order.tolist()
+    ]
+    other_items = [
+        {
+            'user': int(features.user_ids[row]),
+            'score': round(float(other_scores[row]), 4),
+            'load': int(load[row]),
+        }
+        for row in top.tolist()
+    ]
+
+    names = dict(
+        User.objects
+        .filter(id__in={item['user'] for item in applicant_items + other_items})
+        .values_list('id', 'name')
+    )
+    for item in applicant_items + other_items:
+        item['name'] = names.get(item['user'])
+
+    return {'lecture': lecture.id, 'role': role, 'applicants': applicant_items, 'others': other_items}
@@ -0,0 +1,183 @@
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+
+from config.cache import touch_stamps
+from .caching import CALENDAR_LECTURES, invalidate_calendars
+from accounts.models import User
+from .intervals import InstructorSchedule
+from .models import Lecture, Application, InstructorSlot
+
+
+# 배정된 강사의 다른 배정과 시간이 겹쳐 시간대를 만들 수 없음
+class SlotConflict(Exception):
+    def __init__(self, user_ids):
+        self.user_ids = sorted(set(user_ids))
+        names = User.objects.filter(id__in=self.user_ids).order_by('id').values_list('name', flat=True)
+        super().__init__(f"{', '.join(names)} 강사의 다른 배정 강의와 시간이 겹칩니다.")
+
+
+# 시작 < 종료 인 강의만 시간대가 있음 (시간이 없거나 잘못된 강의는 겹침을 판단하지 않음)
+def _timed(queryset, prefix=''):
+    return queryset.filter(**{
+        f'{prefix}lecture_start_datetime__isnull': False,
+        f'{prefix}lecture_end_datetime__gt': F(f'{prefix}lecture_start_datetime'),
+    })
+
+
+# 강사들의 배정 시간대를 정렬 구간 인덱스로 (start~end 와 겹치는 구간만)
+def load_schedule(user_ids, start=None, end=None):
+    slots = InstructorSlot.objects.filter(user_id__in=user_ids)
+    if start is not None:
+        slots = slots.filter(end_at__gt=start)
+    if end is not None:
+        slots = slots.filter(start_at__lt=end)
+
+    schedule = InstructorSchedule()
+    for user_id, slot_start, slot_end in slots.values_list('user_id', 'start_at', 'end_at').iterator(chunk_size=2000):
+        schedule.add(user_id, slot_start, slot_end)
+    return schedule
+
+
+# PostgreSQL: slot_range 의 GiST 인덱스(배제 제약)로 겹침을 한 번에 조회
+def _busy_postgres(user_id, lecture_ids):
+    quote = connection.ops.quote_name
+    sql = (
+        'SELECT DISTINCT l.{pk} FROM {lecture} l '
+        'JOIN {slot} s ON s.{user} = %s '
+        "AND s.slot_range && tstzrange(l.{start}, l.{end}, '[)') "
+        'WHERE l.{pk} = ANY(%s) AND l.{end} > l.{start}'
+    ).format(
+        pk=quote(Lecture._meta.pk.column),
+        lecture=quote(Lecture._meta.db_table),
+        slot=quote(InstructorSlot._meta.db_table),
+        user=quote(InstructorSlot._meta.get_field('user').column),
+        start=quote(Lecture._meta.get_field('lecture_start_datetime').column),
+        end=quote(Lecture._meta.get_field('lecture_end_datetime').column),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [user_id, list(lecture_ids)])
+        return {row[0] for row in cursor.fetchall()}
+
+
+# 그 밖의 DB: 강의 시간 조회 한 번 + 강사 배정 구간 조회 한 번 후 이진 탐색
+def _busy_intervals(user_id, lecture_ids):
+    lectures = list(
+        _timed(Lecture.objects.filter(id__in=lecture_ids))
+        .values_list('id', 'lecture_start_datetime', 'lecture_end_datetime')
+    )
+    if not lectures:
+        return set()
+    schedule = load_schedule(
+        [user_id],
+        min(start for _, start, _ in lectures),
+        max(end for _, _, end in lectures),
+    )
+    return {lecture_id for lecture_id, start, end in lectures if schedule.conflicts(user_id, start, end)}
+
+
+# 강사가 이미 배정된 강의와 시간이 겹치는 강의 ID (lecture_ids 중)
+# 지원 접수와 일괄 배정이 함께 사용
+def busy_lecture_ids(user_id, lecture_ids):
+    lecture_ids = list(lecture_ids)
+    if not lecture_ids:
+        return set()
+    if connection.vendor == 'postgresql':
+        return _busy_postgres(user_id, lecture_ids)
+    return _busy_intervals(user_id, lecture_ids)
+
+
+def _slots_of(applications):
+    rows = (
+        _timed(applications.filter(assignment_status=Application.AssignmentStatus.ASSIGNED), 'lecture__')
+        .order_by('id')
+        .values_list('id', 'user_id', 'lecture_id', 'lecture__lecture_start_datetime', 'lecture__lecture_end_datetime')
+    )
+    return [
+        InstructorSlot(application_id=application_id, user_id=user_id, lecture_id=lecture_id, start_at=start, end_at=end)
+        for application_id, user_id, lecture_id, start, end in rows
+    ]
+
+
+# 강의 시간을 start~end 로 옮기면 다른 배정과 겹치게 되는 배정 강사 ID
+def lecture_slot_conflicts(lecture_id, start, end):
+    if start is None or end is None or end <= start:
+        return []
+    assigned = Application.objects.filter(
+        lecture_id=lecture_id, assignment_status=Application.AssignmentStatus.ASSIGNED,
+    ).values('user_id')
+    return list(
+        InstructorSlot.objects
+        .filter(user_id__in=assigned, start_at__lt=end, end_at__gt=start)
+        .exclude(lecture_id=lecture_id)
+        .order_by('user_id')
+        .values_list('user_id', flat=True)
+        .distinct()
+    )
+
+
+# 새 시간대 중 남아 있는 배정(또는 서로)과 겹치는 강사 ID
+def _overlapping(slots):
+    if not slots:
+        return set()
+    schedule = load_schedule(
+        {slot.user_id for slot in slots},
+        min(slot.start_at for slot in slots),
+        max(slot.end_at for slot in slots),
+    )
+    conflicts = set()
+    for slot in slots:
+        if schedule.conflicts(slot.user_id, slot.start_at, slot.end_at):
+            conflicts.add(slot.user_id)
+        schedule.add(slot.user_id, slot.start_at, slot.end_at)
+    return conflicts
+
+
+# 지원서/강의가 바뀐 뒤 해당 시간대를 다시 만듦
+# 다른 배정과 겹치면 SlotConflict (지운 시간대도 함께 롤백)
+# 검사 후 동시에 들어온 배정은 PostgreSQL 배제 제약이 막고, 그 IntegrityError 도 SlotConflict 로 바꿈
+def sync_slots(application_ids=None, lecture_ids=None):
+    applications = Application.objects.all()
+    slots = InstructorSlot.objects.all()
+    if application_ids is not None:
+        applications = applications.filter(id__in=application_ids)
+        slots = slots.filter(application_id__in=application_ids)
+    if lecture_ids is not None:
+        applications = applications.filter(lecture_id__in=lecture_ids)
+        slots = slots.filter(lecture_id__in=lecture_ids)
+    with transaction.atomic():
+        user_ids = set(slots.values_list('user_id', flat=True))
+        slots.delete()
+        new_slots = _slots_of(applications)
+        conflicts = _overlapping(new_slots)
+        if conflicts:
+            raise SlotConflict(conflicts)
+        try:
+            with transaction.atomic():
+                created = InstructorSlot.objects.bulk_create(new_slots, batch_size=1000)
+        except IntegrityError:
+            conflicts = _overlapping(new_slots)
+            if not conflicts:
+                raise
+            raise SlotConflict(conflicts)
+    user_ids.update(slot.user_id for slot in created)
+    if user_ids:
+        transaction.on_commit(lambda: invalidate_calendars(user_ids))
+    return len(created)
+
+
+# 전체 재구성. 이미 겹쳐 있는 배정은 먼저 배정된 지원서(id 순)만 남김
+def rebuild_slots():
+    schedule = InstructorSchedule()
+    slots = []
+    skipped = 0
+    for slot in _slots_of(Application.objects.all()):
+        if schedule.conflicts(slot.user_id, slot.start_at, slot.end_at):
+            skipped += 1
+            continue
+        schedule.add(slot.user_id, slot.start_at, slot.end_at)
+        slots.append(slot)
+    InstructorSlot.objects.all().delete()
+    InstructorSlot.objects.bulk_create(slots, batch_size=1000)
+    # 강사 전체의 일정이 바뀔 수 있으므로 공통 스탬프를 갱신
+    transaction.on_commit(lambda: touch_stamps([CALENDAR_LECTURES]))
+    return len(slots), skipped
@@ -0,0 +1,238 @@
+import codecs
+
+from rest_framework import serializers
+
+from accounts.models import User
+from config.serializers import ValuesSerializer
+from .models import Lecture, LectureRecruitment, Application, InstructorSlot
+
+
+# 강의 목록에 노출되는 담당 매니저 요약
+class ManagerSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ['id', 'name', 'email']
+
+
+class LectureRecruitmentSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = LectureRecruitment
+        fields = [
+            'application_start_date',
+            'application_end_date',
+            'max_participants',
+            'recruitment_main_needed',
+            'recruitment_assist_needed',
+            'fee_main',
+            'fee_assist',
+        ]
+
+
+# 강의 목록
+# manager / recruitment_info 는 select_related, 지원자 수는 annotate 로 미리 채워둔 queryset 을 전제로 함
+class LectureListSerializer(serializers.ModelSerializer):
+    manager = ManagerSummarySerializer(read_only=True)
+    recruitment_info = serializers.SerializerMethodField()
+    type_display = serializers.CharField(source='get_type_display', read_only=True)
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    main_applicant_count = serializers.IntegerField(read_only=True)
+    assist_applicant_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Lecture
+        fields = [
+            'id',
+            'title',
+            'type',
+            'type_display',
+            'category',
+            'status',
+            'status_display',
+            'lecture_start_datetime',
+            'lecture_end_datetime',
+            'location',
+            'manager',
+            'recruitment_info',
+            'main_applicant_count',
+            'assist_applicant_count',
+            'created_at',
+        ]
+
+    def get_recruitment_info(self, obj):
+        # 모집 정보가 없는 강의는 역참조 시 DoesNotExist 가 발생함
+        try:
+            recruitment = obj.recruitment_info
+        except LectureRecruitment.DoesNotExist:
+            return None
+        return LectureRecruitmentSerializer(recruitment).data
+
+
+# 강의 목록 (.values() 기반, LectureListSerializer 와 같은 응답)
+# 지원자 수는 annotate 로 미리 채워둔 queryset 을 전제로 함
+class LectureListValuesSerializer(ValuesSerializer):
+    class Meta:
+        model = Lecture
+        fields = LectureListSerializer.Meta.fields
+        labels = {'type_display': 'type', 'status_display': 'status'}
+        nested = {
+            'manager': ManagerSummarySerializer.Meta.fields,
+            'recruitment_info': LectureRecruitmentSerializer.Meta.fields,
+        }
+
+
+# 강의 상세
+class LectureDetailSerializer(LectureListSerializer):
+    class Meta(LectureListSerializer.Meta):
+        fields = [
+            field for field in LectureListSerializer.Meta.fields
+            if field not in ('main_applicant_count', 'assist_applicant_count')
+        ] + [
+            'target_audience',
+            'content_description',
+            'special_notes',
+            'attachment_url',
+        ]
+
+
+# 지원 내역 목록 (포트폴리오 본문 제외)
+class ApplicationListSerializer(serializers.ModelSerializer):
+    user_name = serializers.CharField(source='user.name', read_only=True)
+
+    class Meta:
+        model = Application
+        fields = [
+            'id',
+            'lecture',
+            'user',
+            'user_name',
+            'applied_role',
+            'assignment_status',
+            'assigned_role',
+            'applied_at',
+        ]
+        read_only_fields = fields
+
+
+# 지원 내역 목록 (.values() 기반, ApplicationListSerializer 와 같은 응답)
+class ApplicationListValuesSerializer(ValuesSerializer):
+    class Meta:
+        model = Application
+        fields = ApplicationListSerializer.Meta.fields
+        sources = {'user_name': 'user__name'}
+
+
+# 강사 일정: 배정된 강의
+class CalendarAssignmentSerializer(ValuesSerializer):
+    class Meta:
+        model = InstructorSlot
+        fields = ['lecture', 'title', 'location', 'start', 'end', 'role', 'role_display']
+        sources = {
+            'title': 'lecture__title',
+            'location': 'lecture__location',
+            'start': 'start_at',
+            'end': 'end_at',
+            'role': 'application__assigned_role',
+        }
+        labels = {'role_display': 'role'}
+
+
+# 강사 일정: 모집중 강의
+class CalendarRecruitingSerializer(ValuesSerializer):
+    class Meta:
+        model = Lecture
+        fields = ['lecture', 'title', 'location', 'start', 'end', 'type', 'type_display', 'application_end_date']
+        sources = {
+            'lecture': 'id',
+            'start': 'lecture_start_datetime',
+            'end': 'lecture_end_datetime',
+            'application_end_date': 'recruitment_info__application_end_date',
+        }
+        labels = {'type_display': 'type'}
+
+
+# 지원 내역 상세 (지원 시점 포트폴리오 포함)
+class ApplicationDetailSerializer(ApplicationListSerializer):
+    portfolio_snapshot = serializers.CharField(read_only=True, allow_null=True)
+
+    class Meta(ApplicationListSerializer.Meta):
+        fields = ApplicationListSerializer.Meta.fields + ['portfolio_snapshot']
+        read_only_fields = fields
+
+
+# 강사 지원 요청
+class ApplicationCreateSerializer(serializers.Serializer):
+    applied_role = serializers.ChoiceField(choices=Application.LectureRole.choices)
+
+
+# 일괄 배정 요청
+class LectureAllocationSerializer(serializers.Serializer):
+    lecture_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+    )
+
+
+# 강의 가져오기 (CSV/XLSX 한 행)
+# 빈 칸은 None 으로 바꿔서 넘어옴
+class LectureImportRowSerializer(serializers.Serializer):
+    title = serializers.CharField(max_length=255)
+    type = serializers.ChoiceField(choices=Lecture.LectureType.choices, required=False, allow_null=True)
+    category = serializers.CharField(max_length=50, required=False, allow_null=True)
+    status = serializers.ChoiceField(
+        choices=Lecture.LectureStatus.choices,
+        required=False,
+        allow_null=True,
+    )
+    lecture_start_datetime = serializers.DateTimeField(required=False, allow_null=True)
+    lecture_end_datetime = serializers.DateTimeField(required=False, allow_null=True)
+    location = serializers.CharField(max_length=255, required=False, allow_null=True)
+    manager_email = serializers.EmailField(required=False, allow_null=True)
+    target_audience = serializers.CharField(max_length=100, required=False, allow_null=True)
+    content_description = serializers.CharField(required=False, allow_null=True)
+    special_notes = serializers.CharField(max_length=1000, required=False, allow_null=True)
+    attachment_url = serializers.URLField(max_length=255, required=False, allow_null=True)
+
+    application_start_date = serializers.DateField(required=False, allow_null=True)
+    application_end_date = serializers.DateField(required=False, allow_null=True)
+    max_participants = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    recruitment_main_needed = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    recruitment_assist_needed = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    fee_main = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    fee_assist = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+
+    def validate(self, attrs):
+        start, end = attrs.get('lecture_start_datetime'), attrs.get('lecture_end_datetime')
+        if start and end and end < start:
+            raise serializers.ValidationError({'lecture_end_datetime': '강의 종료 일시가 시작 일시보다 빠릅니다.'})
+        opens, closes = attrs.get('application_start_date'), attrs.get('application_end_date')
+        if opens and closes and closes < opens:
+            raise serializers.ValidationError({'application_end_date': '모집 마감일이 시작일보다 빠릅니다.'})
+        # 비어 있으면 모델 기본값
+        for name in ('recruitment_main_needed', 'recruitment_assist_needed'):
+            if attrs.get(name) is None:
+                attrs[name] = 0
+        if attrs.get('status') is None:
+            attrs['status'] = Lecture.LectureStatus.RECRUITING
+        return attrs
+
+
+# 강의 가져오기 요청 (multipart)
+class LectureImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    encoding = serializers.CharField(required=False, default='utf-8-sig', help_text='CSV 인코딩 (엑셀 CSV 는 cp949)')
+    dry_run = serializers.BooleanField(required=False, default=False)
+    notify = serializers.BooleanField(required=False, default=False)
+
+    def validate_encoding(self, value):
+        try:
+            codecs.lookup(value)
+        except LookupError:
+            raise serializers.ValidationError('알 수 없는 인코딩입니다.')
+        return value
+
+
+# 강사 추천 조회 조건
+class RecommendationQuerySerializer(serializers.Serializer):
+    role = serializers.ChoiceField(choices=Application.LectureRole.choices, default=Application.LectureRole.MAIN)
+    k = serializers.IntegerField(min_value=1, max_value=100, default=20)
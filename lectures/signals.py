@@ -0,0 +1,101 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import Signal, receiver
+
+from accounts.notifications import enqueue_recruitment_open
+from config.tasks import enqueue
+from .applications import release_seats
+from .caching import invalidate_lectures, invalidate_calendars, invalidate_lecture_list
+from .models import Lecture, LectureRecruitment, Application
+from .recommendations import refresh_features
+from .schedules import SlotConflict, lecture_slot_conflicts, sync_slots
+
+# update()/bulk_update() 처럼 post_save 가 발생하지 않는 일괄 변경 후 보냄
+# 인자: lecture_ids
+lectures_bulk_changed = Signal()
+
+
+# 모집중 상태로 생성된 강의는 강사 전체에게 모집 시작 알림
+@receiver(post_save, sender=Lecture)
+def lecture_saved(sender, instance, created, **kwargs):
+    if created and instance.status == Lecture.LectureStatus.RECRUITING:
+        enqueue_recruitment_open(instance.id)
+
+
+# 강의/모집 정보가 바뀌면 응답 캐시 무효화 (커밋 후)
+@receiver(post_save, sender=Lecture)
+@receiver(post_delete, sender=Lecture)
+def invalidate_lecture_cache(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_lectures([instance.id]))
+
+
+@receiver(post_save, sender=LectureRecruitment)
+@receiver(post_delete, sender=LectureRecruitment)
+def invalidate_recruitment_cache(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_lectures([instance.lecture_id]))
+
+
+@receiver(lectures_bulk_changed)
+def invalidate_bulk_changed_cache(sender, lecture_ids, **kwargs):
+    lecture_ids = list(lecture_ids)
+    transaction.on_commit(lambda: invalidate_lectures(lecture_ids))
+
+
+# 지원/배정 결과가 바뀐 강사의 추천 특징 벡터를 작업 큐에서 다시 계산
+# (일괄 배정은 allocation.py 에서 지원자 전체를 한 번에 요청)
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def refresh_instructor_features(sender, instance, **kwargs):
+    enqueue(refresh_features, [instance.user_id])
+
+
+# 지원 API(applications.submit_application) 밖에서 만들어지거나 삭제된 지원서도 정원 카운터와 목록 캐시에 반영
+@receiver(post_save, sender=Application)
+def count_application(sender, instance, created, **kwargs):
+    if created:
+        LectureRecruitment.objects.filter(lecture_id=instance.lecture_id).update(
+            applicant_count=F('applicant_count') + 1
+        )
+        transaction.on_commit(invalidate_lecture_list)
+
+
+@receiver(post_delete, sender=Application)
+def uncount_application(sender, instance, **kwargs):
+    release_seats(instance.lecture_id)
+    transaction.on_commit(invalidate_lecture_list)
+
+
+# 배정 상태나 강의 시간이 바뀌면 강사 시간대 갱신 (일괄 배정은 allocation.py 에서 직접)
+# 배정과 무관한 저장(메모 수정 등)에는 조회하지 않음
+@receiver(post_save, sender=Application)
+def sync_application_slot(sender, instance, created, **kwargs):
+    if created:
+        if instance.assignment_status != Application.AssignmentStatus.ASSIGNED:
+            return
+    elif not instance.has_changed(Application.SLOT_FIELDS):
+        return
+    sync_slots(application_ids=[instance.id])
+
+
+# 강의 시간을 옮겨 배정된 강사의 다른 배정과 겹치면 저장하지 않음 (강의 행을 쓰기 전에 확인)
+@receiver(pre_save, sender=Lecture)
+def check_lecture_slots(sender, instance, **kwargs):
+    if instance._state.adding or not instance.has_changed(Lecture.SCHEDULE_FIELDS):
+        return
+    conflicts = lecture_slot_conflicts(instance.id, instance.lecture_start_datetime, instance.lecture_end_datetime)
+    if conflicts:
+        raise SlotConflict(conflicts)
+
+
+@receiver(post_save, sender=Lecture)
+def sync_lecture_slots(sender, instance, created, **kwargs):
+    if not created and instance.has_changed(Lecture.SCHEDULE_FIELDS):
+        sync_slots(lecture_ids=[instance.id])
+
+
+# 배정된 지원서가 삭제되면 시간대는 함께 삭제되므로 강사 일정 스탬프만 갱신
+@receiver(post_delete, sender=Application)
+def invalidate_assigned_calendar(sender, instance, **kwargs):
+    if instance.assignment_status == Application.AssignmentStatus.ASSIGNED:
+        transaction.on_commit(lambda: invalidate_calendars([instance.user_id]))
@@ -1,3 +1,1145 @@
-from django.test import TestCase
+import csv
+import io
+import json
+import threading
+from array import array
+from collections import Counter
+from datetime import timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User, Notification
+from accounts.serializers import RoleTokenObtainPairSerializer
+from config.cache import get_cache, get_versions
+from dashboard import stats as dashboard_stats
+from search.models import SearchDocument
+from sync.models import ChangeLog
+from . import recommendations
+from .allocation import allocate_lectures
+from .applications import (
+    ApplicationClosed,
+    ApplicationFull,
+    IdempotencyKeyReused,
+    ScheduleConflict,
+    _reserve_seat,
+    submit_application,
+)
+from .exports import iter_csv
+from .importers import ImportFileError, ImportResult, LectureImporter, read_rows
+from .intervals import InstructorSchedule
+from .models import (
+    Lecture,
+    LectureRecruitment,
+    Application,
+    InstructorFeature,
+    InstructorSlot,
+    LectureTransition,
+    PortfolioSnapshot,
+)
+from .schedules import SlotConflict, busy_lecture_ids
+from .signals import lectures_bulk_changed
+from .transitions import run_transitions
+from .serializers import (
+    ApplicationListSerializer,
+    ApplicationListValuesSerializer,
+    LectureListSerializer,
+    LectureListValuesSerializer,
+)
+from .views import LectureApplicationListView, LectureDetailView, LectureListView
+
+
+def create_lecture(max_participants=None, opens_in=-1, closes_in=1, starts_at=None, hours=2, main_needed=0):
+    today = timezone.localdate()
+    lecture = Lecture.objects.create(
+        title='로봇 캠프',
+        lecture_start_datetime=starts_at,
+        lecture_end_datetime=starts_at + timedelta(hours=hours) if starts_at else None,
+    )
+    LectureRecruitment.objects.create(
+        lecture=lecture,
+        application_start_date=today + timedelta(days=opens_in),
+        application_end_date=today + timedelta(days=closes_in),
+        max_participants=max_participants,
+        recruitment_main_needed=main_needed,
+    )
+    return lecture
+
+
+def create_instructors(count):
+    return [
+        User.objects.create_user(
+            username=f'instructor{i}',
+            email=f'instructor{i}@example.com',
+            password='password',
+            name=f'강사{i}',
+            role=User.Role.INSTRUCTOR,
+            portfolio_content='로봇 교육 5년',
+        )
+        for i in range(count)
+    ]
+
+
+def applicant_count(lecture):
+    return LectureRecruitment.objects.get(lecture=lecture).applicant_count
+
+
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class SubmitApplicationTests(TestCase):
+    # 정원 조건이 서브쿼리(처음 스냅샷)가 아니라 UPDATE 대상 행에 걸려야 동시 지원에도 정원을 넘지 않음
+    def test_reserve_seat_checks_capacity_on_updated_row(self):
+        lecture = create_lecture(max_participants=1)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(_reserve_seat(lecture.id, timezone.localdate()))
+            self.assertFalse(_reserve_seat(lecture.id, timezone.localdate()))
+
+        sql = queries[0]['sql']
+        start = end = sql.index('(SELECT')
+        depth = 0
+        for end in range(start, len(sql)):
+            depth += {'(': 1, ')': -1}.get(sql[end], 0)
+            if depth == 0:
+                break
+        subquery, outer = sql[start:end + 1], sql[:start] + sql[end + 1:]
+        quote = connection.ops.quote_name
+        self.assertNotIn(quote(LectureRecruitment._meta.db_table), subquery)
+        self.assertIn(f"{quote(LectureRecruitment._meta.db_table)}.{quote('applicant_count')} <", outer)
+
+    def test_retry_with_same_key_returns_existing_application(self):
+        lecture = create_lecture()
+        user, = create_instructors(1)
+
+        first, created = submit_application(user.id, lecture.id, 'main', idempotency_key='retry-1')
+        again, created_again = submit_application(user.id, lecture.id, 'main', idempotency_key='retry-1')
+
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(first.id, again.id)
+        self.assertEqual(applicant_count(lecture), 1)
+        self.assertEqual(first.portfolio_snapshot, '로봇 교육 5년')
+
+    # 같은 포트폴리오 내용은 스냅샷 한 행을 공유
+    def test_identical_portfolios_share_one_snapshot(self):
+        first, second = create_lecture(), create_lecture()
+        users = create_instructors(2)
+
+        applications = [
+            submit_application(user.id, lecture.id, 'main')[0]
+            for user in users for lecture in (first, second)
+        ]
+
+        self.assertEqual(PortfolioSnapshot.objects.count(), 1)
+        self.assertEqual({application.portfolio_id for application in applications}, {PortfolioSnapshot.objects.get().id})
+
+        User.objects.filter(id=users[0].id).update(portfolio_content='로봇 교육 6년')
+        changed, _ = submit_application(users[0].id, create_lecture().id, 'main')
+        self.assertEqual(PortfolioSnapshot.objects.count(), 2)
+        self.assertEqual(changed.portfolio_snapshot, '로봇 교육 6년')
+
+    def test_duplicate_without_key_returns_existing_application(self):
+        lecture = create_lecture()
+        user, = create_instructors(1)
+
+        first, _ = submit_application(user.id, lecture.id, 'main')
+        again, created = submit_application(user.id, lecture.id, 'main')
+
+        self.assertFalse(created)
+        self.assertEqual(first.id, again.id)
+        self.assertEqual(applicant_count(lecture), 1)
+
+    def test_same_key_for_other_request_is_rejected(self):
+        lecture = create_lecture()
+        user, = create_instructors(1)
+
+        submit_application(user.id, lecture.id, 'main', idempotency_key='retry-1')
+        with self.assertRaises(IdempotencyKeyReused):
+            submit_application(user.id, lecture.id, 'assist', idempotency_key='retry-1')
+
+    def test_capacity_is_enforced(self):
+        lecture = create_lecture(max_participants=2)
+        users = create_instructors(3)
+
+        submit_application(users[0].id, lecture.id, 'main')
+        submit_application(users[1].id, lecture.id, 'assist')
+        with self.assertRaises(ApplicationFull):
+            submit_application(users[2].id, lecture.id, 'main')
+        self.assertEqual(Application.objects.filter(lecture=lecture).count(), 2)
+        self.assertEqual(applicant_count(lecture), 2)
+
+    def test_application_window_is_enforced(self):
+        user, = create_instructors(1)
+
+        with self.assertRaises(ApplicationClosed):
+            submit_application(user.id, create_lecture(opens_in=1, closes_in=3).id, 'main')
+        with self.assertRaises(ApplicationClosed):
+            submit_application(user.id, create_lecture(opens_in=-3, closes_in=-1).id, 'main')
+
+    def test_deleting_application_releases_seat(self):
+        lecture = create_lecture(max_participants=1)
+        users = create_instructors(2)
+
+        application, _ = submit_application(users[0].id, lecture.id, 'main')
+        application.delete()
+        _, created = submit_application(users[1].id, lecture.id, 'main')
+
+        self.assertTrue(created)
+        self.assertEqual(applicant_count(lecture), 1)
+
+
+# 일괄 배정: 역할별 필요 인원, 이미 배정된 인원, 결과 수
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class AllocateLecturesTests(TestCase):
+    def setUp(self):
+        self.users = create_instructors(6)
+
+    def allocating_lecture(self, main_needed, assist_needed, **kwargs):
+        lecture = create_lecture(main_needed=main_needed, **kwargs)
+        LectureRecruitment.objects.filter(lecture=lecture).update(recruitment_assist_needed=assist_needed)
+        Lecture.objects.filter(id=lecture.id).update(status=Lecture.LectureStatus.ALLOCATING)
+        return lecture
+
+    def apply(self, lecture, users, role):
+        return [Application.objects.create(lecture=lecture, user=user, applied_role=role) for user in users]
+
+    def assigned(self, lecture):
+        return sorted(
+            Application.objects
+            .filter(lecture=lecture, assignment_status=Application.AssignmentStatus.ASSIGNED)
+            .values_list('user_id', 'assigned_role')
+        )
+
+    def test_assigns_up_to_role_capacity_in_application_order(self):
+        lecture = self.allocating_lecture(main_needed=1, assist_needed=2)
+        # 보조강사 지원서가 먼저 들어와도 역할별로 따로 셈
+        assists = self.apply(lecture, self.users[3:], 'assist')
+        mains = self.apply(lecture, self.users[:3], 'main')
+
+        result = allocate_lectures([lecture.id])
+
+        self.assertEqual(result.allocated_lecture_ids, [lecture.id])
+        self.assertEqual((result.assigned_count, result.rejected_count), (3, 3))
+        self.assertEqual(self.assigned(lecture), sorted([
+            (mains[0].user_id, 'main'), (assists[0].user_id, 'assist'), (assists[1].user_id, 'assist'),
+        ]))
+
+    def test_counts_existing_assignments_against_capacity(self):
+        lecture = self.allocating_lecture(main_needed=2, assist_needed=1)
+        Application.objects.create(
+            lecture=lecture,
+            user=self.users[0],
+            applied_role='main',
+            assignment_status=Application.AssignmentStatus.ASSIGNED,
+            assigned_role='main',
+        )
+        mains = self.apply(lecture, self.users[1:4], 'main')
+
+        result = allocate_lectures([lecture.id])
+
+        self.assertEqual((result.assigned_count, result.rejected_count), (1, 2))
+        self.assertEqual(self.assigned(lecture), sorted([(self.users[0].id, 'main'), (mains[0].user_id, 'main')]))
+
+    def test_moves_pending_to_assigned_or_rejected_and_completes_lectures(self):
+        first = self.allocating_lecture(main_needed=1, assist_needed=1)
+        second = self.allocating_lecture(main_needed=2, assist_needed=0)
+        recruiting = create_lecture(main_needed=1)
+        self.apply(first, self.users[:3], 'main')
+        self.apply(first, self.users[3:5], 'assist')
+        self.apply(second, self.users[:3], 'main')
+        untouched = self.apply(recruiting, self.users[:1], 'main')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = allocate_lectures([first.id, second.id, recruiting.id])
+
+        self.assertEqual(result.allocated_lecture_ids, [first.id, second.id])
+        self.assertEqual((result.assigned_count, result.rejected_count), (4, 4))
+        statuses = Counter(
+            Application.objects.filter(lecture__in=[first, second]).values_list('assignment_status', flat=True)
+        )
+        self.assertEqual(statuses, {
+            Application.AssignmentStatus.ASSIGNED: result.assigned_count,
+            Application.AssignmentStatus.REJECTED: result.rejected_count,
+        })
+        self.assertEqual(
+            set(Lecture.objects.filter(id__in=[first.id, second.id]).values_list('status', flat=True)),
+            {Lecture.LectureStatus.COMPLETED},
+        )
+        # 배정 중이 아닌 강의는 그대로
+        untouched[0].refresh_from_db()
+        self.assertEqual(untouched[0].assignment_status, Application.AssignmentStatus.PENDING)
+        self.assertEqual(
+            Notification.objects.filter(lecture__in=[first, second]).count(),
+            result.assigned_count + result.rejected_count,
+        )
+
+    def test_publishes_results_only_after_commit(self):
+        lecture = self.allocating_lecture(main_needed=1, assist_needed=0)
+        self.apply(lecture, self.users[:2], 'main')
+
+        with mock.patch('lectures.allocation.publish_to_users') as publish:
+            with self.captureOnCommitCallbacks() as callbacks:
+                allocate_lectures([lecture.id])
+            publish.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+        events = list(publish.call_args.args[0])
+        self.assertEqual(len(events), 2)
+
+
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class InstructorScheduleTests(TestCase):
+    def setUp(self):
+        self.start = timezone.now() + timedelta(days=7)
+
+    def test_schedule_conflicts_with_overlapping_slots_only(self):
+        hour = timedelta(hours=1)
+        schedule = InstructorSchedule()
+        schedule.add(1, self.start, self.start + 2 * hour)
+        schedule.add(1, self.start + 4 * hour, self.start + 5 * hour)
+        schedule.add(1, None, None)
+
+        self.assertTrue(schedule.conflicts(1, self.start + hour, self.start + 3 * hour))
+        self.assertTrue(schedule.conflicts(1, self.start - hour, self.start + 6 * hour))
+        # 맞닿기만 하는 구간, 빈 시간대, 다른 강사, 시간이 없는 강의는 충돌 아님
+        self.assertFalse(schedule.conflicts(1, self.start + 2 * hour, self.start + 4 * hour))
+        self.assertFalse(schedule.conflicts(2, self.start, self.start + hour))
+        self.assertFalse(schedule.conflicts(1, None, None))
+
+    def test_busy_lectures_overlap_assigned_slots(self):
+        user, = create_instructors(1)
+        assigned = create_lecture(starts_at=self.start)
+        Application.objects.create(
+            lecture=assigned,
+            user=user,
+            applied_role='main',
+            assignment_status=Application.AssignmentStatus.ASSIGNED,
+            assigned_role='main',
+        )
+        overlapping = create_lecture(starts_at=self.start + timedelta(hours=1))
+        adjacent = create_lecture(starts_at=self.start + timedelta(hours=2))
+        untimed = create_lecture()
+
+        self.assertTrue(InstructorSlot.objects.filter(user=user, lecture=assigned).exists())
+        self.assertEqual(
+            busy_lecture_ids(user.id, [overlapping.id, adjacent.id, untimed.id]),
+            {overlapping.id},
+        )
+        with self.assertRaises(ScheduleConflict):
+            submit_application(user.id, overlapping.id, 'main')
+        _, created = submit_application(user.id, adjacent.id, 'main')
+        self.assertTrue(created)
+
+    def test_allocation_skips_overlapping_lectures(self):
+        user, = create_instructors(1)
+        first = create_lecture(starts_at=self.start, main_needed=1)
+        second = create_lecture(starts_at=self.start + timedelta(hours=1), main_needed=1)
+        submit_application(user.id, first.id, 'main')
+        submit_application(user.id, second.id, 'main')
+        Lecture.objects.filter(id__in=[first.id, second.id]).update(status=Lecture.LectureStatus.ALLOCATING)
+
+        result = allocate_lectures([first.id, second.id])
+
+        self.assertEqual((result.assigned_count, result.rejected_count), (1, 1))
+        self.assertEqual(list(InstructorSlot.objects.values_list('lecture_id', flat=True)), [first.id])
+
+    def test_moving_lecture_moves_slots(self):
+        user, = create_instructors(1)
+        lecture = create_lecture(starts_at=self.start)
+        Application.objects.create(
+            lecture=lecture,
+            user=user,
+            applied_role='main',
+            assignment_status=Application.AssignmentStatus.ASSIGNED,
+            assigned_role='main',
+        )
+        lecture.lecture_start_datetime += timedelta(days=1)
+        lecture.lecture_end_datetime += timedelta(days=1)
+        lecture.save()
+
+        self.assertEqual(InstructorSlot.objects.get().start_at, lecture.lecture_start_datetime)
+
+    def test_moving_lecture_onto_another_assignment_is_rejected(self):
+        user, = create_instructors(1)
+        first = create_lecture(starts_at=self.start)
+        second = create_lecture(starts_at=self.start + timedelta(days=1))
+        for lecture in (first, second):
+            Application.objects.create(
+                lecture=lecture,
+                user=user,
+                applied_role='main',
+                assignment_status=Application.AssignmentStatus.ASSIGNED,
+                assigned_role='main',
+            )
+        original_start = second.lecture_start_datetime
+        second.lecture_start_datetime = self.start + timedelta(hours=1)
+        second.lecture_end_datetime = self.start + timedelta(hours=3)
+
+        with self.assertRaisesMessage(ValidationError, user.name):
+            second.full_clean()
+        with self.assertRaisesMessage(SlotConflict, user.name):
+            second.save()
+
+        second.refresh_from_db()
+        self.assertEqual(second.lecture_start_datetime, original_start)
+        self.assertEqual(InstructorSlot.objects.filter(user=user).count(), 2)
+
+
+    def test_saves_without_schedule_changes_skip_slot_queries(self):
+        user, = create_instructors(1)
+        lecture = create_lecture(starts_at=self.start)
+        application = Application.objects.create(
+            lecture=lecture,
+            user=user,
+            applied_role='main',
+            assignment_status=Application.AssignmentStatus.ASSIGNED,
+            assigned_role='main',
+        )
+        lecture = Lecture.objects.get(id=lecture.id)
+        application = Application.objects.get(id=application.id)
+
+        with mock.patch('lectures.signals.sync_slots') as sync, \
+                mock.patch('lectures.signals.lecture_slot_conflicts', return_value=[]) as conflicts:
+            lecture.title = '드론 캠프'
+            lecture.save()
+            application.idempotency_key = 'retry'
+            with CaptureQueriesContext(connection) as queries:
+                application.save()
+            sync.assert_not_called()
+            conflicts.assert_not_called()
+            # 집계 필드도 그대로이므로 이전 값을 조회하지 않음
+            self.assertFalse([query for query in queries.captured_queries if query['sql'].startswith('SELECT')])
+
+            application.assignment_status = Application.AssignmentStatus.REJECTED
+            application.save()
+            sync.assert_called_once_with(application_ids=[application.id])
+            # 같은 인스턴스를 다시 저장하면 방금 저장한 값과 비교
+            application.save()
+            sync.assert_called_once()
+
+            lecture.lecture_start_datetime += timedelta(hours=1)
+            lecture.lecture_end_datetime += timedelta(hours=1)
+            lecture.save()
+            conflicts.assert_called_once()
+            sync.assert_called_with(lecture_ids=[lecture.id])
+
+# .values() 기반 목록 시리얼라이저는 ModelSerializer 와 같은 응답을 만들어야 함
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class ValuesSerializerTests(TestCase):
+    def test_lecture_list_matches_model_serializer(self):
+        manager = User.objects.create_user(
+            username='manager', email='manager@example.com', password='password', name='매니저', role=User.Role.MANAGER
+        )
+        user, = create_instructors(1)
+        with_recruitment = create_lecture(starts_at=timezone.now())
+        Lecture.objects.filter(id=with_recruitment.id).update(manager=manager, type=Lecture.LectureType.CAMP)
+        submit_application(user.id, with_recruitment.id, 'main')
+        Lecture.objects.create(title='부스 운영', status=Lecture.LectureStatus.COMPLETED)
+
+        view = LectureListView(request=Request(APIRequestFactory().get('/api/lectures/')))
+        queryset = view.get_queryset().order_by('id')
+        expected = LectureListSerializer(queryset, many=True).data
+        rows = LectureListValuesSerializer(LectureListValuesSerializer.project(queryset), many=True).data
+
+        self.assertEqual(rows, [dict(row) for row in expected])
+        self.assertEqual(rows[0]['type_display'], '캠프 (연두)')
+        self.assertEqual(rows[0]['main_applicant_count'], 1)
+        self.assertIsNone(rows[1]['manager'])
+        self.assertIsNone(rows[1]['recruitment_info'])
+
+    def test_application_list_matches_model_serializer(self):
+        lecture = create_lecture()
+        for user in create_instructors(2):
+            submit_application(user.id, lecture.id, 'assist')
+
+        queryset = Application.objects.order_by('id')
+        expected = ApplicationListSerializer(queryset, many=True).data
+        rows = ApplicationListValuesSerializer(ApplicationListValuesSerializer.project(queryset), many=True).data
+
+        self.assertEqual(rows, [dict(row) for row in expected])
+
+
+# 목록 조회 쿼리 수는 행 수와 관계없이 일정 (N+1 없음), 잘못된 조회 조건은 400
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class ListQueryTests(TestCase):
+    def setUp(self):
+        self.manager = User.objects.create_user(
+            username='manager', email='manager@example.com', password='password', name='매니저', role=User.Role.MANAGER
+        )
+        self.instructors = create_instructors(8)
+        self.lecture = None
+
+    def add_lectures(self, count):
+        for _ in range(count):
+            lecture = create_lecture(starts_at=timezone.now() + timedelta(days=1))
+            Lecture.objects.filter(id=lecture.id).update(manager=self.manager)
+            for user in self.instructors[:3]:
+                submit_application(user.id, lecture.id, 'main')
+            self.lecture = self.lecture or lecture
+
+    def count_queries(self, view, path, **kwargs):
+        get_cache().clear()
+        request = APIRequestFactory().get(path)
+        force_authenticate(request, self.manager)
+        with CaptureQueriesContext(connection) as queries:
+            response = view.as_view()(request, **kwargs)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_lecture_list_query_count_is_constant(self):
+        self.add_lectures(2)
+        small = self.count_queries(LectureListView, '/api/lectures/')
+        self.add_lectures(8)
+        self.assertEqual(self.count_queries(LectureListView, '/api/lectures/'), small)
+
+    def test_application_list_query_count_is_constant(self):
+        self.add_lectures(1)
+        path = f'/api/lectures/{self.lecture.id}/applications/'
+        small = self.count_queries(LectureApplicationListView, path, lecture_id=self.lecture.id)
+        for user in self.instructors[3:]:
+            submit_application(user.id, self.lecture.id, 'assist')
+        self.assertEqual(self.count_queries(LectureApplicationListView, path, lecture_id=self.lecture.id), small)
+
+    def test_invalid_filters_are_rejected(self):
+        self.add_lectures(1)
+        client = APIClient()
+        client.force_authenticate(self.manager)
+        for path in (
+            '/api/lectures/?start_from=2024-02-30T10:00',
+            '/api/lectures/applications/export/?start_to=2024-02-30T10:00',
+            f'/api/lectures/{self.lecture.id}/applications/?assignment_status=unknown',
+            '/api/lectures/applications/export/?assignment_status=unknown',
+        ):
+            self.assertEqual(client.get(path).status_code, 400, path)
+        client.force_authenticate(self.instructors[0])
+        self.assertEqual(client.get('/api/lectures/calendar/?start=2024-02-30T10:00').status_code, 400)
+
+
+# 강의 목록 응답 캐시: 네임스페이스 버전이 바뀌어야만 새로 만들고, 지원 접수/삭제는 버전을 올림
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class LectureListCacheTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        self.lecture = create_lecture()
+        self.user, = create_instructors(1)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def listed(self):
+        row, = self.client.get('/api/lectures/').json()['results']
+        return row['title'], row['main_applicant_count']
+
+    def test_submit_and_delete_invalidate_list(self):
+        self.assertEqual(self.listed(), ('로봇 캠프', 0))
+
+        # 시그널 없는 변경은 버전이 그대로라 캐시된 응답이 나옴
+        Lecture.objects.filter(id=self.lecture.id).update(title='드론 캠프')
+        self.assertEqual(self.listed(), ('로봇 캠프', 0))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application, _ = submit_application(self.user.id, self.lecture.id, 'main')
+        self.assertEqual(self.listed(), ('드론 캠프', 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application.delete()
+        self.assertEqual(self.listed(), ('드론 캠프', 0))
+
+# 강사 추천: 특징 벡터 계산/저장, 점수 순위, 변경분만 다시 읽는 행렬
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class RecommendationTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        recommendations._matrix = None
+        self.addCleanup(setattr, recommendations, '_matrix', None)
+        self.instructors = create_instructors(5)
+        start = timezone.now() + timedelta(days=10)
+        self.lecture = self.create_lecture('코딩 캠프', start)
+        past = self.create_lecture('지난 코딩 캠프', start - timedelta(days=30))
+        busy = self.create_lecture('겹치는 부스', start + timedelta(hours=1), category='체험')
+        # instructor0: 같은 유형/구분/장소에 주강사로 배정된 이력, instructor2: 같은 시간에 다른 강의 배정
+        self.assign(past, self.instructors[0])
+        self.assign(busy, self.instructors[2])
+        for user in self.instructors[:3]:
+            Application.objects.create(lecture=self.lecture, user=user, applied_role='main')
+
+    def create_lecture(self, title, start, category='코딩'):
+        return Lecture.objects.create(
+            title=title,
+            type=Lecture.LectureType.CAMP,
+            category=category,
+            location='서울',
+            lecture_start_datetime=start,
+            lecture_end_datetime=start + timedelta(hours=2),
+        )
+
+    def assign(self, lecture, user):
+        Application.objects.create(
+            lecture=lecture, user=user, applied_role='main', assignment_status='assigned', assigned_role='main',
+        )
+
+    def test_compute_features_counts_assigned_history(self):
+        vectors = recommendations.compute_features([user.id for user in self.instructors[:2]])
+
+        vector = vectors[self.instructors[0].id]
+        self.assertEqual((vector[recommendations.APPLIED_TOTAL], vector[recommendations.ASSIGNED_TOTAL]), (2, 1))
+        self.assertEqual(vector[recommendations.TYPE_OFFSET + recommendations.TYPES.index('camp')], 1)
+        self.assertEqual(vector[recommendations.CATEGORY_OFFSET + recommendations.bucket('코딩')], 1)
+        self.assertEqual(vector[recommendations.LOCATION_OFFSET + recommendations.bucket('서울')], 1)
+        self.assertEqual(vector[recommendations.ASSIGNED_ROLE_OFFSET + recommendations.ROLES.index('main')], 1)
+        # 지원만 한 강사는 지원 수만
+        vector = vectors[self.instructors[1].id]
+        self.assertEqual((vector[recommendations.APPLIED_TOTAL], sum(vector)), (1, 2))
+
+    def test_refresh_features_stores_vectors_and_bumps_version(self):
+        version = get_versions([recommendations.FEATURES_NAMESPACE])
+        user_ids = [user.id for user in self.instructors]
+
+        self.assertEqual(recommendations.refresh_features(user_ids + user_ids[:1]), len(user_ids))
+
+        self.assertNotEqual(get_versions([recommendations.FEATURES_NAMESPACE]), version)
+        feature = InstructorFeature.objects.get(user=self.instructors[0])
+        self.assertEqual(feature.version, recommendations.FEATURE_VERSION)
+        self.assertEqual(
+            list(array('f', bytes(feature.vector))),
+            recommendations.compute_features([self.instructors[0].id])[self.instructors[0].id],
+        )
+
+    def test_matching_history_ranks_first_and_conflict_sorts_last(self):
+        recommendations.refresh_features([user.id for user in self.instructors])
+
+        result = recommendations.recommend(self.lecture, k=5)
+
+        self.assertEqual(
+            [(item['user'], item['conflict']) for item in result['applicants']],
+            [(self.instructors[0].id, False), (self.instructors[1].id, False), (self.instructors[2].id, True)],
+        )
+        self.assertEqual(result['applicants'][0]['name'], '강사0')
+        # 지원하지 않은 강사만 (지원자는 제외)
+        self.assertEqual([item['user'] for item in result['others']], [user.id for user in self.instructors[3:]])
+
+    def test_matrix_reloads_only_changed_features(self):
+        recommendations.refresh_features([user.id for user in self.instructors[:4]])
+        first = recommendations.get_matrix()
+
+        newcomer = User.objects.create_user(
+            username='newcomer', email='newcomer@example.com', password='password', role=User.Role.INSTRUCTOR,
+        )
+        self.assign(self.create_lecture('새 캠프', timezone.now() - timedelta(days=3)), self.instructors[3])
+        recommendations.refresh_features([self.instructors[3].id, newcomer.id])
+
+        with mock.patch.object(recommendations, 'MIN_RELOAD_SECONDS', 0), \
+                mock.patch.object(recommendations, '_load_matrix', side_effect=AssertionError('전체 다시 읽기')):
+            matrix = recommendations.get_matrix()
+
+        self.assertIsNot(matrix, first)
+        self.assertEqual(matrix.user_ids.tolist(), sorted([user.id for user in self.instructors] + [newcomer.id]))
+        expected = recommendations.compute_features([self.instructors[3].id])[self.instructors[3].id]
+        self.assertEqual(matrix.matrix[matrix.rows_of([self.instructors[3].id])[0]].tolist(), expected)
+        # 이전 행렬은 그대로 (읽고 있는 요청이 있을 수 있음)
+        self.assertEqual(first.matrix[first.rows_of([self.instructors[3].id])[0]].sum(), 0)
+
+# 비동기 강의 목록/상세는 같은 요청에 동기 DRF 뷰와 같은 응답을 내야 함
+# 두 뷰가 응답 캐시를 공유하므로 매 요청 전에 캐시를 비워 각자 응답을 만들게 함
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class AsyncLectureViewTests(TestCase):
+    def setUp(self):
+        self.user, = create_instructors(1)
+        self.lectures = [create_lecture(starts_at=timezone.now() + timedelta(days=i)) for i in range(3)]
+        self.claims_token = str(RoleTokenObtainPairSerializer.get_token(self.user).access_token)
+        # 역할 클레임이 없는 이전 토큰 (DB 에서 사용자 조회)
+        self.legacy_token = str(AccessToken.for_user(self.user))
+
+    def compare(self, path, sync_view, token=None, **headers):
+        if token:
+            headers['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+        get_cache().clear()
+        response = APIClient().get(path, **headers)
+        get_cache().clear()
+        request = APIRequestFactory().get(path, **headers)
+        expected = sync_view.as_view()(request, **resolve(path.split('?')[0]).kwargs)
+        expected.render()
+
+        self.assertEqual(response.status_code, expected.status_code, path)
+        self.assertEqual(response['Content-Type'], expected['Content-Type'], path)
+        self.assertEqual(response.get('WWW-Authenticate'), expected.get('WWW-Authenticate'), path)
+        self.assertEqual(response.json(), json_of(expected), path)
+        return response
+
+    def test_list_matches_sync_view(self):
+        for token in (self.claims_token, self.legacy_token):
+            first = self.compare('/api/lectures/?page_size=2', LectureListView, token).json()
+            self.assertEqual(len(first['results']), 2)
+            self.assertIsNotNone(first['next'])
+            second = self.compare(first['next'].replace('http://testserver', ''), LectureListView, token).json()
+            self.assertEqual(len(second['results']), 1)
+
+    def test_detail_matches_sync_view(self):
+        lecture_id = self.lectures[0].id
+        for token in (self.claims_token, self.legacy_token):
+            data = self.compare(f'/api/lectures/{lecture_id}/', LectureDetailView, token).json()
+            self.assertEqual(data['id'], lecture_id)
+            response = self.compare('/api/lectures/999999/', LectureDetailView, token)
+            self.assertEqual(response.status_code, 404)
+
+    def test_errors_match_sync_view(self):
+        detail_path = f'/api/lectures/{self.lectures[0].id}/'
+        for path, view in (('/api/lectures/', LectureListView), (detail_path, LectureDetailView)):
+            self.assertEqual(self.compare(path, view).status_code, 401)
+            self.assertEqual(self.compare(path, view, 'invalid').status_code, 401)
+            response = self.compare(path, view, self.claims_token, HTTP_ACCEPT='application/xml')
+            self.assertEqual(response.status_code, 406)
+        response = self.compare('/api/lectures/?status=unknown', LectureListView, self.claims_token)
+        self.assertEqual(response.status_code, 400)
+
+    # HTML(Browsable API) 을 요청하면 동기 뷰가 응답
+    def test_html_is_served_by_sync_view(self):
+        response = APIClient().get(
+            '/api/lectures/', HTTP_ACCEPT='text/html', HTTP_AUTHORIZATION=f'Bearer {self.claims_token}'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/html'))
+
+
+def json_of(response):
+    return json.loads(response.content)
+
+
+# 강의 일괄 가져오기: 행 단위 검증, 청크 단위 커밋, 일괄 변경 시그널과 변경 기록
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class LectureImporterTests(TestCase):
+    header = ['강의명', '강의 유형', 'status', 'lecture_start_datetime', 'lecture_end_datetime', 'manager_email']
+
+    def setUp(self):
+        self.manager = User.objects.create_user(
+            username='manager', email='Manager@example.com', password='password', name='매니저',
+            role=User.Role.MANAGER,
+        )
+        self.sent = []
+        lectures_bulk_changed.connect(self.record_signal)
+        self.addCleanup(lectures_bulk_changed.disconnect, self.record_signal)
+
+    def record_signal(self, sender, lecture_ids, **kwargs):
+        self.sent.append(list(lecture_ids))
+
+    def run_import(self, rows, **kwargs):
+        output = io.StringIO()
+        csv.writer(output).writerows([self.header] + rows)
+        with self.captureOnCommitCallbacks(execute=True):
+            return LectureImporter(**kwargs).run(read_rows(io.BytesIO(output.getvalue().encode()), 'csv'))
+
+    def row(self, title, **values):
+        return [
+            title,
+            values.get('type', '캠프'),
+            values.get('status', ''),
+            values.get('start', '2026-11-01T10:00:00+09:00'),
+            values.get('end', '2026-11-01T12:00:00+09:00'),
+            values.get('manager_email', ''),
+        ]
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        result = self.run_import([
+            self.row('로봇 캠프', manager_email='manager@EXAMPLE.com'),
+            self.row(''),
+            ['', '', '', '', '', ''],
+            self.row('코딩 부스', type='없는 유형'),
+            self.row('드론 캠프', end='2026-11-01T09:00:00+09:00'),
+            self.row('AI 캠프', manager_email='nobody@example.com'),
+        ]).as_dict()
+
+        self.assertEqual((result['total'], result['created'], result['failed']), (5, 1, 4))
+        # 행 번호는 헤더를 1행으로 센 파일 기준, 빈 행은 세지 않음
+        self.assertEqual(
+            [(error['row'], list(error['errors'])) for error in result['errors']],
+            [(3, ['title']), (5, ['type']), (6, ['lecture_end_datetime']), (7, ['manager_email'])],
+        )
+        lecture = Lecture.objects.get(title='로봇 캠프')
+        self.assertEqual(
+            (lecture.type, lecture.status, lecture.manager_id),
+            (Lecture.LectureType.CAMP, Lecture.LectureStatus.RECRUITING, self.manager.id),
+        )
+        self.assertTrue(LectureRecruitment.objects.filter(lecture=lecture).exists())
+
+    def test_chunks_commit_separately(self):
+        rows = [self.row(f'강의{i}') for i in range(5)]
+        rows.insert(1, self.row(''))
+
+        result = self.run_import(rows, chunk_size=2)
+
+        self.assertEqual((result.total, result.created, result.failed), (6, 5, 1))
+        # 청크(2행)마다 시그널 한 번, 오류 행이 있는 청크와 마지막 청크는 유효한 행만
+        self.assertEqual([len(ids) for ids in self.sent], [1, 2, 2])
+        self.assertEqual(
+            sorted(lecture_id for ids in self.sent for lecture_id in ids),
+            sorted(Lecture.objects.values_list('id', flat=True)),
+        )
+
+    def test_failed_chunk_rolls_back_without_undoing_earlier_chunks(self):
+        original = LectureRecruitment.objects.bulk_create
+        calls = []
+
+        def fail_second_chunk(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError('DB 오류')
+            return original(*args, **kwargs)
+
+        with mock.patch.object(LectureRecruitment.objects, 'bulk_create', side_effect=fail_second_chunk):
+            with self.assertRaises(RuntimeError):
+                self.run_import([self.row(f'강의{i}') for i in range(4)], chunk_size=2)
+
+        self.assertEqual(sorted(Lecture.objects.values_list('title', flat=True)), ['강의0', '강의1'])
+        self.assertEqual(LectureRecruitment.objects.count(), 2)
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(ChangeLog.objects.filter(kind=ChangeLog.Kind.LECTURE).count(), 2)
+
+    def test_records_changes_search_documents_and_dashboard(self):
+        dashboard_stats.rebuild()
+        self.run_import([self.row('로봇 캠프'), self.row('코딩 부스', status='배정 중')])
+
+        lecture_ids = sorted(Lecture.objects.values_list('id', flat=True))
+        self.assertEqual(len(lecture_ids), 2)
+        self.assertEqual(self.sent, [lecture_ids])
+        for kind in (ChangeLog.Kind.LECTURE, ChangeLog.Kind.RECRUITMENT):
+            self.assertEqual(
+                sorted(ChangeLog.objects.filter(kind=kind, user_id=None).values_list('object_id', flat=True)),
+                lecture_ids,
+            )
+        documents = SearchDocument.objects.filter(kind=SearchDocument.Kind.LECTURE)
+        self.assertEqual(sorted(documents.values_list('object_id', flat=True)), lecture_ids)
+        values, _ = dashboard_stats.current()
+        expected, _ = dashboard_stats.compute()
+        self.assertEqual(+values, +expected)
+
+    def test_dry_run_writes_nothing(self):
+        result = self.run_import([self.row('로봇 캠프'), self.row('')], dry_run=True)
+
+        self.assertEqual((result.total, result.created, result.failed), (2, 1, 1))
+        self.assertFalse(Lecture.objects.exists())
+        self.assertFalse(ChangeLog.objects.exists())
+        self.assertEqual(self.sent, [])
+
+
+    def test_decode_error_in_a_later_chunk_saves_nothing(self):
+        output = io.StringIO()
+        csv.writer(output).writerows([self.header] + [self.row(f'강의{i}') for i in range(4)])
+        content = output.getvalue().encode() + '강의4,캠프\n'.encode('cp949')
+
+        with self.assertRaises(ImportFileError) as raised:
+            LectureImporter(chunk_size=2).run(read_rows(io.BytesIO(content), 'csv'))
+
+        self.assertIsNone(raised.exception.result)
+        self.assertFalse(Lecture.objects.exists())
+
+    def test_read_error_mid_stream_reports_created_and_row(self):
+        def rows():
+            yield self.header
+            for i in range(3):
+                yield self.row(f'강의{i}')
+            raise ImportFileError('XLSX 파일을 끝까지 읽을 수 없습니다.')
+
+        with self.assertRaises(ImportFileError) as raised:
+            with self.captureOnCommitCallbacks(execute=True):
+                LectureImporter(chunk_size=2).run(rows())
+
+        # 첫 청크(2~3행)만 저장되고 4행까지 읽은 뒤 5행에서 중단
+        error = raised.exception.as_dict()
+        self.assertEqual((error['row'], error['created'], error['total']), (5, 2, 2))
+        self.assertEqual(Lecture.objects.count(), 2)
+
+    def test_view_returns_partial_result_on_read_error(self):
+        client = APIClient()
+        client.force_authenticate(self.manager)
+        upload = io.BytesIO(b'title\n')
+        upload.name = 'lectures.csv'
+
+        error = ImportFileError('CSV 형식이 올바르지 않습니다.', row=7, result=ImportResult(total=5, created=5))
+        with mock.patch.object(LectureImporter, 'run', side_effect=error):
+            response = client.post('/api/lectures/import/', {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            (response.data['file'], response.data['row'], response.data['created']),
+            (['CSV 형식이 올바르지 않습니다.'], 7, 5),
+        )
+
+
+# 지원 내역 CSV 내보내기
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class ApplicationExportTests(TestCase):
+    def test_formula_cells_are_neutralized(self):
+        lecture = create_lecture()
+        Lecture.objects.filter(id=lecture.id).update(title='@SUM(A1:A9)')
+        user, = create_instructors(1)
+        User.objects.filter(id=user.id).update(name='=HYPERLINK("http://example.com","x")', phone_number='+82-10')
+        submit_application(user.id, lecture.id, 'main')
+
+        body = b''.join(iter_csv(Application.objects.all())).decode('utf-8-sig')
+        header, row = list(csv.reader(io.StringIO(body)))
+        row = dict(zip(header, row))
+
+        self.assertEqual(row['강의명'], "'@SUM(A1:A9)")
+        self.assertEqual(row['강사 이름'], '\'=HYPERLINK("http://example.com","x")')
+        self.assertEqual(row['연락처'], "'+82-10")
+        self.assertEqual(row['지원 역할'], Application.LectureRole.MAIN.label)
+
+
+# 강사 일정: 범위 조회와 조건부 GET
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class LectureCalendarTests(TestCase):
+    def setUp(self):
+        self.user, = create_instructors(1)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.start = timezone.now() + timedelta(days=3)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assigned = create_lecture(starts_at=self.start)
+            self.application = Application.objects.create(
+                lecture=self.assigned,
+                user=self.user,
+                applied_role='main',
+                assignment_status=Application.AssignmentStatus.ASSIGNED,
+                assigned_role='main',
+            )
+            self.recruiting = create_lecture(starts_at=self.start + timedelta(days=1))
+            create_lecture(starts_at=self.start + timedelta(days=60))
+
+    def test_calendar_lists_range_and_answers_not_modified(self):
+        response = self.client.get('/api/lectures/calendar/')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([row['lecture'] for row in data['assigned']], [self.assigned.id])
+        self.assertEqual(data['assigned'][0]['role_display'], Application.LectureRole.MAIN.label)
+        # 기본 기간(30일) 밖의 강의는 제외
+        self.assertEqual(
+            [row['lecture'] for row in data['recruiting']], [self.assigned.id, self.recruiting.id]
+        )
+
+        etag = response['ETag']
+        cached = self.client.get('/api/lectures/calendar/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b'')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.application.delete()
+        changed = self.client.get('/api/lectures/calendar/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.json()['assigned'], [])
+
+    def test_ical_feed_uses_signed_token(self):
+        ical_url = self.client.get('/api/lectures/calendar/').json()['ical_url']
+        client = APIClient()
+
+        response = client.get(ical_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        body = response.content.decode()
+        self.assertIn(f'UID:lecture-{self.assigned.id}-assigned@dorolms', body)
+        self.assertIn(f'UID:lecture-{self.recruiting.id}-recruiting@dorolms', body)
+        self.assertEqual(client.get(ical_url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertEqual(client.get('/api/lectures/calendar/invalid.ics').status_code, 404)
+
+    def test_regenerated_token_revokes_previous_ical_url(self):
+        calendar = self.client.get('/api/lectures/calendar/')
+        old_url = calendar.json()['ical_url']
+        client = APIClient()
+        etag = client.get(old_url)['ETag']
+
+        response = self.client.post('/api/lectures/calendar/token/')
+        self.assertEqual(response.status_code, 200)
+        new_url = response.json()['ical_url']
+        self.assertNotEqual(new_url, old_url)
+        self.user.refresh_from_db()
+        # 일정 응답에 구독 URL 이 들어가므로 이전 ETag 로는 304 가 아님
+        refreshed = self.client.get('/api/lectures/calendar/', HTTP_IF_NONE_MATCH=calendar['ETag'])
+        self.assertEqual(refreshed.status_code, 200)
+        self.assertEqual(refreshed.json()['ical_url'], new_url)
+
+        # 이전 URL 은 조건부 요청(304 경로)이어도 거부
+        self.assertEqual(client.get(old_url).status_code, 404)
+        self.assertEqual(client.get(old_url, HTTP_IF_NONE_MATCH=etag).status_code, 404)
+        self.assertEqual(client.get(new_url).status_code, 200)
+
+    def test_ical_feed_rejects_deactivated_user_before_not_modified(self):
+        ical_url = self.client.get('/api/lectures/calendar/').json()['ical_url']
+        client = APIClient()
+        etag = client.get(ical_url)['ETag']
+
+        User.objects.filter(id=self.user.id).update(is_active=False)
+        self.assertEqual(client.get(ical_url, HTTP_IF_NONE_MATCH=etag).status_code, 404)
+
+
+# 스케줄 상태 전이: 대상만 바꾸고 대시보드 집계와 알림을 함께 반영
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class LectureTransitionTests(TestCase):
+    def setUp(self):
+        self.users = create_instructors(4)
+        self.expired = create_lecture(opens_in=-5, closes_in=-1)
+        self.open = create_lecture(closes_in=1)
+        self.already_allocating = create_lecture(opens_in=-5, closes_in=-2)
+        self.already_allocating.status = Lecture.LectureStatus.ALLOCATING
+        self.already_allocating.save()
+        self.completed = create_lecture(opens_in=-5, closes_in=-2)
+        self.completed.status = Lecture.LectureStatus.COMPLETED
+        self.completed.save()
+
+        for lecture in (self.expired, self.open, self.already_allocating):
+            for user in self.users[:2]:
+                Application.objects.create(lecture=lecture, user=user, applied_role='main')
+        self.assigned = Application.objects.create(
+            lecture=self.completed,
+            user=self.users[0],
+            applied_role='main',
+            assignment_status=Application.AssignmentStatus.ASSIGNED,
+            assigned_role='main',
+        )
+        self.pending = [
+            Application.objects.create(lecture=self.completed, user=user, applied_role='assist')
+            for user in self.users[1:]
+        ]
+        dashboard_stats.rebuild()
+
+    def run_transitions(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return run_transitions(batch_size=2)
+
+    def status_of(self, lecture):
+        return Lecture.objects.values_list('status', flat=True).get(id=lecture.id)
+
+    def test_only_expired_recruiting_lectures_are_closed(self):
+        result = self.run_transitions()
+
+        self.assertEqual(result.closed_lecture_ids, [self.expired.id])
+        self.assertEqual(self.status_of(self.expired), Lecture.LectureStatus.ALLOCATING)
+        self.assertEqual(self.status_of(self.open), Lecture.LectureStatus.RECRUITING)
+        self.assertEqual(self.status_of(self.already_allocating), Lecture.LectureStatus.ALLOCATING)
+        self.assertEqual(self.status_of(self.completed), Lecture.LectureStatus.COMPLETED)
+        self.assertEqual(
+            list(LectureTransition.objects.filter(kind=LectureTransition.Kind.RECRUITMENT_CLOSED)
+                 .values_list('lecture_id', flat=True)),
+            [self.expired.id],
+        )
+
+    def test_only_pending_applications_on_completed_lectures_are_settled(self):
+        result = self.run_transitions()
+
+        self.assertEqual(result.settled_lecture_ids, [self.completed.id])
+        self.assertEqual(result.settled_application_count, len(self.pending))
+        statuses = dict(Application.objects.values_list('id', 'assignment_status'))
+        self.assertEqual(statuses.pop(self.assigned.id), Application.AssignmentStatus.ASSIGNED)
+        for application in self.pending:
+            self.assertEqual(statuses.pop(application.id), Application.AssignmentStatus.REJECTED)
+        # 나머지 강의의 지원서는 그대로 대기
+        self.assertEqual(set(statuses.values()), {Application.AssignmentStatus.PENDING})
+        # batch_size=2 이므로 두 번에 나누어 정리되고 전이 기록도 묶음마다 남음
+        transitions = LectureTransition.objects.filter(kind=LectureTransition.Kind.PENDING_SETTLED)
+        self.assertEqual(set(transitions.values_list('lecture_id', flat=True)), {self.completed.id})
+        self.assertEqual(sum(transitions.values_list('application_count', flat=True)), len(self.pending))
+
+    def test_dashboard_counters_match_recomputed_values(self):
+        self.run_transitions()
+
+        values, days = dashboard_stats.current()
+        expected, expected_days = dashboard_stats.compute()
+        self.assertEqual(+values, +expected)
+        self.assertEqual(+days, +Counter(expected_days))
+
+    def test_notifications_are_enqueued_once(self):
+        self.run_transitions()
+        self.run_transitions()
+
+        closed = Notification.objects.filter(message__contains='모집이 마감되어')
+        self.assertEqual(
+            sorted(closed.values_list('user_id', 'lecture_id')),
+            [(user.id, self.expired.id) for user in self.users[:2]],
+        )
+        settled = Notification.objects.filter(message__contains='배정되지 않았습니다')
+        self.assertEqual(
+            sorted(settled.values_list('user_id', flat=True)), [user.id for user in self.users[1:]]
+        )
+        self.assertFalse(settled.exclude(lecture_id=self.completed.id).exists())
+
+
+class GenerateDatasetTests(TestCase):
+    def _generate(self):
+        call_command(
+            'generate_dataset', users=20, lectures=10, applications=30, notifications=20, messages=20,
+            announcements=5, days=30, batch_size=7, flush=True, interactive=False, stdout=io.StringIO(),
+        )
+
+    def test_flush_and_regenerate_keeps_past_timestamps(self):
+        self._generate()
+        self._generate()
+
+        self.assertEqual(Lecture.objects.count(), 10)
+        self.assertEqual(User.objects.filter(is_superuser=False).count(), 20)
+        # 생성 시각은 bulk_create 시점이 아니라 지정한 과거 시각
+        cutoff = timezone.now() - timedelta(minutes=1)
+        self.assertTrue(Lecture.objects.filter(created_at__lt=cutoff).exists())
+        self.assertTrue(Notification.objects.filter(created_at__lt=cutoff).exists())
+        self.assertTrue(Lecture._meta.get_field('created_at').auto_now_add)
+        for application in Application.objects.select_related('lecture'):
+            self.assertGreaterEqual(application.applied_at, application.lecture.created_at)
+
+
+# 스레드마다 별도 연결로 동시에 지원 (SQLite 는 쓰기 잠금이 DB 전체라 PostgreSQL 에서만 실행)
+@skipUnless(connection.vendor == 'postgresql', 'PostgreSQL 전용 동시성 테스트')
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class SubmitApplicationConcurrencyTests(TransactionTestCase):
+    def _run_concurrently(self, calls):
+        barrier = threading.Barrier(len(calls))
+        results = []
+        errors = []
+
+        def worker(call):
+            try:
+                barrier.wait()
+                results.append(call())
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker, args=(call,)) for call in calls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_burst_of_applications_respects_capacity(self):
+        lecture = create_lecture(max_participants=10)
+        users = create_instructors(50)
+
+        # 강사마다 같은 키로 두 번씩 (클라이언트 재시도)
+        calls = [
+            lambda user=user: submit_application(user.id, lecture.id, 'main', idempotency_key=f'key-{user.id}')
+            for user in users
+            for _ in range(2)
+        ]
+        results, errors = self._run_concurrently(calls)
+
+        self.assertTrue(all(isinstance(error, ApplicationFull) for error in errors), errors)
+        self.assertEqual(sum(created for _, created in results), 10)
+        self.assertEqual(Application.objects.filter(lecture=lecture).count(), 10)
+        self.assertEqual(applicant_count(lecture), 10)
+
+    def test_concurrent_duplicates_create_one_application(self):
+        lecture = create_lecture(max_participants=5)
+        user, = create_instructors(1)
+
+        calls = [lambda: submit_application(user.id, lecture.id, 'main') for _ in range(20)]
+        results, errors = self._run_concurrently(calls)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(sum(created for _, created in results), 1)
+        self.assertEqual(len({application.id for application, _ in results}), 1)
+        self.assertEqual(applicant_count(lecture), 1)
@@ -0,0 +1,137 @@
+from collections import Counter
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.notifications import enqueue_pending_settled, enqueue_recruitment_closed
+from config.tasks import enqueue
+from dashboard import stats as dashboard_stats
+from sync.changes import Kind, record_user_changes
+from .models import Lecture, Application, LectureTransition
+from .recommendations import refresh_features
+from .signals import lectures_bulk_changed
+
+BATCH_SIZE = 1000
+
+
+@dataclass
+class TransitionResult:
+    closed_lecture_ids: list = field(default_factory=list)
+    settled_lecture_ids: list = field(default_factory=list)
+    settled_application_count: int = 0
+
+    def as_dict(self):
+        return {
+            'closed_lecture_ids': self.closed_lecture_ids,
+            'settled_lecture_ids': self.settled_lecture_ids,
+            'settled_application_count': self.settled_application_count,
+        }
+
+
+# 모집 마감일이 지난 모집중 강의를 배정 중으로 (UPDATE 한 번)
+# 다른 스케줄러가 같은 강의를 잡고 있으면 건너뜀 (PostgreSQL skip_locked)
+def close_recruitment(today=None, batch_size=BATCH_SIZE):
+    today = today or timezone.localdate()
+    closed = []
+    with transaction.atomic():
+        rows = list(
+            Lecture.objects
+            .select_for_update(skip_locked=True, of=('self',))
+            .filter(
+                status=Lecture.LectureStatus.RECRUITING,
+                recruitment_info__application_end_date__lt=today,
+            )
+            .order_by('id')
+            .values_list('id', 'type')[:batch_size]
+        )
+        if not rows:
+            return closed
+        closed = [lecture_id for lecture_id, _ in rows]
+
+        Lecture.objects.filter(id__in=closed, status=Lecture.LectureStatus.RECRUITING).update(
+            status=Lecture.LectureStatus.ALLOCATING, updated_at=timezone.now()
+        )
+        LectureTransition.objects.bulk_create([
+            LectureTransition(
+                lecture_id=lecture_id,
+                kind=LectureTransition.Kind.RECRUITMENT_CLOSED,
+                from_status=Lecture.LectureStatus.RECRUITING,
+                to_status=Lecture.LectureStatus.ALLOCATING,
+            )
+            for lecture_id in closed
+        ])
+
+        deltas = Counter()
+        for _, lecture_type in rows:
+            deltas.update(dashboard_stats.changed(
+                dashboard_stats.lecture_deltas,
+                (Lecture.LectureStatus.RECRUITING, lecture_type),
+                (Lecture.LectureStatus.ALLOCATING, lecture_type),
+            ))
+        dashboard_stats.apply(deltas)
+        lectures_bulk_changed.send(sender=Lecture, lecture_ids=closed)
+        enqueue_recruitment_closed(closed)
+    return closed
+
+
+# 배정 완료(COMPLETED) 강의에 남은 미배정 지원서를 배정 실패로 정리 (강의 묶음마다 UPDATE 한 번)
+def settle_pending(batch_size=BATCH_SIZE):
+    settled_lectures = []
+    settled_count = 0
+    with transaction.atomic():
+        rows = list(
+            Application.objects
+            .select_for_update(skip_locked=True, of=('self',))
+            .filter(
+                lecture__status=Lecture.LectureStatus.COMPLETED,
+                assignment_status=Application.AssignmentStatus.PENDING,
+            )
+            .order_by('id')
+            .values_list('id', 'lecture_id', 'user_id')[:batch_size]
+        )
+        if not rows:
+            return settled_lectures, settled_count
+        application_ids = [application_id for application_id, _, _ in rows]
+
+        settled_count = Application.objects.filter(
+            id__in=application_ids,
+            assignment_status=Application.AssignmentStatus.PENDING,
+        ).update(assignment_status=Application.AssignmentStatus.REJECTED, assigned_role=None, updated_at=timezone.now())
+        record_user_changes(Kind.APPLICATION, [(application_id, user_id) for application_id, _, user_id in rows])
+
+        per_lecture = Counter(lecture_id for _, lecture_id, _ in rows)
+        settled_lectures = sorted(per_lecture)
+        LectureTransition.objects.bulk_create([
+            LectureTransition(
+                lecture_id=lecture_id,
+                kind=LectureTransition.Kind.PENDING_SETTLED,
+                from_status=Application.AssignmentStatus.PENDING,
+                to_status=Application.AssignmentStatus.REJECTED,
+                application_count=count,
+            )
+            for lecture_id, count in per_lecture.items()
+        ])
+
+        deltas = dashboard_stats.application_deltas(Application.AssignmentStatus.PENDING, None, -settled_count)
+        deltas.update(dashboard_stats.application_deltas(Application.AssignmentStatus.REJECTED, None, settled_count))
+        dashboard_stats.apply(deltas)
+        enqueue_pending_settled(application_ids)
+        enqueue(refresh_features, list({user_id for _, _, user_id in rows}))
+    return settled_lectures, settled_count
+
+
+# 처리할 것이 없을 때까지 batch_size 단위로 반복
+def run_transitions(today=None, batch_size=BATCH_SIZE):
+    result = TransitionResult()
+    while closed := close_recruitment(today, batch_size):
+        result.closed_lecture_ids.extend(closed)
+    settled = set()
+    while True:
+        lecture_ids, count = settle_pending(batch_size)
+        if not lecture_ids:
+            break
+        settled.update(lecture_ids)
+        result.settled_application_count += count
+    result.settled_lecture_ids = sorted(settled)
+    return result
@@ -0,0 +1,19 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('', views.AsyncLectureListView.as_view(), name='lecture-list'),
+    path('calendar/', views.LectureCalendarView.as_view(), name='lecture-calendar'),
+    path('calendar/token/', views.LectureCalendarTokenView.as_view(), name='lecture-calendar-token'),
+    path('calendar/<str:token>.ics', views.LectureCalendarICalView.as_view(), name='lecture-calendar-ical'),
+    path('<int:pk>/', views.AsyncLectureDetailView.as_view(), name='lecture-detail'),
+    path('<int:lecture_id>/apply/', views.ApplicationCreateView.as_view(), name='application-create'),
+    path('<int:lecture_id>/applications/', views.LectureApplicationListView.as_view(), name='lecture-application-list'),
+    path('<int:lecture_id>/recommendations/', views.LectureRecommendationView.as_view(), name='lecture-recommendations'),
+    path('<int:lecture_id>/roster/', views.LectureRosterExportView.as_view(), name='lecture-roster-export'),
+    path('applications/export/', views.ApplicationExportView.as_view(), name='application-export'),
+    path('applications/<int:pk>/', views.ApplicationDetailView.as_view(), name='application-detail'),
+    path('import/', views.LectureImportView.as_view(), name='lecture-import'),
+    path('allocations/', views.LectureAllocationView.as_view(), name='lecture-allocation'),
+]
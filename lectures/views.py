@@ -1,3 +1,454 @@
-from django.shortcuts import render
+from datetime import timedelta
 
-# Create your views here.
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.views import View
+from django.utils.dateparse import parse_datetime
+from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_409_CONFLICT,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+from rest_framework.views import APIView
+
+from accounts.models import User
+from accounts.permissions import IsManager, IsInstructor
+from config.async_views import AsyncAPIView
+from config.cache import acached, cached
+from config.routers import ReplicaReadMixin
+from config.serializers import ValuesListMixin
+from .allocation import allocate_lectures
+from .applications import (
+    ApplicationClosed,
+    ApplicationFull,
+    IdempotencyKeyReused,
+    ScheduleConflict,
+    submit_application,
+)
+from .caching import LECTURE_LIST, lecture_namespace
+from .calendars import (
+    ICAL_FUTURE,
+    ICAL_PAST,
+    MAX_RANGE,
+    assigned_slots,
+    calendar_token,
+    calendar_version,
+    recruiting_lectures,
+    render_ical,
+    rotate_calendar_token,
+    user_id_from_token,
+)
+from .exports import iter_csv, gzip_stream
+from .importers import ImportFileError, LectureImporter, detect_format, read_rows
+from .models import Lecture, Application
+from .pagination import LectureCursorPagination, ApplicationCursorPagination
+from .recommendations import RecommendationUnavailable, recommend
+from .schedules import SlotConflict
+from .serializers import (
+    LectureListValuesSerializer,
+    LectureDetailSerializer,
+    LectureAllocationSerializer,
+    LectureImportSerializer,
+    RecommendationQuerySerializer,
+    ApplicationCreateSerializer,
+    ApplicationListSerializer,
+    ApplicationListValuesSerializer,
+    ApplicationDetailSerializer,
+    CalendarAssignmentSerializer,
+    CalendarRecruitingSerializer,
+)
+
+# 목록에는 지원자 수가 포함되어 있어 지원할 때마다 무효화하지 않고 짧게 캐시
+LIST_CACHE_TIMEOUT = 60
+
+
+def parse_datetime_param(request, name):
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    try:
+        # 형식은 맞지만 없는 날짜(2월 30일 등)는 ValueError
+        parsed = parse_datetime(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: '날짜 형식이 올바르지 않습니다. (ISO 8601)'})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def filter_assignment_status(request, queryset):
+    assignment_status = request.query_params.get('assignment_status')
+    if not assignment_status:
+        return queryset
+    if assignment_status not in Application.AssignmentStatus.values:
+        raise ValidationError({'assignment_status': '올바르지 않은 배정 상태입니다.'})
+    return queryset.filter(assignment_status=assignment_status)
+
+
+# 오늘 0시 (현재 시간대). 기본 조회 기간을 하루 동안 고정해 ETag 가 요청마다 바뀌지 않게 함
+def start_of_today():
+    return timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+# 조건부 GET 응답 헤더 (캘린더 앱/클라이언트가 매번 다시 확인하도록 no-cache)
+def set_version_headers(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+# 강의 목록
+# GET /api/lectures/?status=&type=&start_from=&start_to=&cursor=
+class LectureListView(ValuesListMixin, ReplicaReadMixin, generics.ListAPIView):
+    serializer_class = LectureListValuesSerializer
+    pagination_class = LectureCursorPagination
+
+    def list(self, request, *args, **kwargs):
+        data = cached(
+            'lecture-list',
+            [LECTURE_LIST],
+            request.get_full_path(),
+            lambda: super(LectureListView, self).list(request, *args, **kwargs).data,
+            timeout=LIST_CACHE_TIMEOUT,
+        )
+        return Response(data)
+
+    def get_queryset(self):
+        queryset = Lecture.objects.select_related('manager', 'recruitment_info').with_applicant_counts()
+
+        params = self.request.query_params
+
+        status = params.get('status')
+        if status:
+            if status not in Lecture.LectureStatus.values:
+                raise ValidationError({'status': '올바르지 않은 강의 상태입니다.'})
+            queryset = queryset.filter(status=status)
+
+        lecture_type = params.get('type')
+        if lecture_type:
+            if lecture_type not in Lecture.LectureType.values:
+                raise ValidationError({'type': '올바르지 않은 강의 유형입니다.'})
+            queryset = queryset.filter(type=lecture_type)
+
+        start_from = parse_datetime_param(self.request, 'start_from')
+        if start_from:
+            queryset = queryset.filter(lecture_start_datetime__gte=start_from)
+
+        start_to = parse_datetime_param(self.request, 'start_to')
+        if start_to:
+            queryset = queryset.filter(lecture_start_datetime__lt=start_to)
+
+        return queryset
+
+
+# 강의 상세
+# GET /api/lectures/<id>/
+class LectureDetailView(generics.RetrieveAPIView):
+    serializer_class = LectureDetailSerializer
+    queryset = Lecture.objects.select_related('manager', 'recruitment_info')
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = self.kwargs['pk']
+        data = cached(
+            'lecture-detail',
+            [lecture_namespace(pk)],
+            pk,
+            lambda: super(LectureDetailView, self).retrieve(request, *args, **kwargs).data,
+        )
+        return Response(data)
+
+
+# 강의 목록 / 상세 (비동기, config/asgi.py 로 서비스할 때 사용)
+# 응답과 캐시 키는 LectureListView / LectureDetailView 와 같음
+class AsyncLectureListView(AsyncAPIView):
+    sync_view = LectureListView
+    replica_reads = True
+
+    async def get(self, request, *args, **kwargs):
+        return await acached(
+            'lecture-list',
+            [LECTURE_LIST],
+            request.get_full_path(),
+            lambda: self.alist(request, **kwargs),
+            timeout=LIST_CACHE_TIMEOUT,
+        )
+
+
+class AsyncLectureDetailView(AsyncAPIView):
+    sync_view = LectureDetailView
+
+    async def get(self, request, *args, **kwargs):
+        pk = kwargs['pk']
+        return await acached(
+            'lecture-detail',
+            [lecture_namespace(pk)],
+            pk,
+            lambda: self.aretrieve(request, **kwargs),
+        )
+
+
+# 강의별 지원 내역 (매니저)
+# GET /api/lectures/<lecture_id>/applications/?assignment_status=
+# 포트폴리오 본문은 별도 테이블이라 목록 조회에서는 읽지 않음
+class LectureApplicationListView(ValuesListMixin, generics.ListAPIView):
+    serializer_class = ApplicationListValuesSerializer
+    pagination_class = ApplicationCursorPagination
+    permission_classes = [IsAuthenticated, IsManager]
+
+    def get_queryset(self):
+        queryset = (
+            Application.objects
+            .filter(lecture_id=self.kwargs['lecture_id'])
+            .select_related('user')
+            .defer('user__portfolio_content', 'user__bio')
+        )
+        return filter_assignment_status(self.request, queryset)
+
+
+# 강사 지원 (모집 시작 직후 동시 요청 대비)
+# POST /api/lectures/<lecture_id>/apply/ {"applied_role": "main"}, 헤더 Idempotency-Key (선택)
+# 새로 접수되면 201, 같은 지원의 재요청이면 기존 지원서와 함께 200
+class ApplicationCreateView(APIView):
+    permission_classes = [IsAuthenticated, IsInstructor]
+
+    def post(self, request, lecture_id):
+        serializer = ApplicationCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        idempotency_key = request.headers.get('Idempotency-Key') or None
+        if idempotency_key and len(idempotency_key) > 64:
+            raise ValidationError({'idempotency_key': '멱등 키는 64자 이하여야 합니다.'})
+
+        try:
+            application, created = submit_application(
+                request.user.id,
+                lecture_id,
+                serializer.validated_data['applied_role'],
+                idempotency_key=idempotency_key,
+            )
+        except ApplicationClosed as e:
+            raise ValidationError({'lecture': str(e)})
+        except (ApplicationFull, ScheduleConflict) as e:
+            return Response({'detail': str(e)}, status=HTTP_409_CONFLICT)
+        except IdempotencyKeyReused as e:
+            return Response({'detail': str(e)}, status=HTTP_422_UNPROCESSABLE_ENTITY)
+
+        return Response(
+            ApplicationListSerializer(application).data,
+            status=HTTP_201_CREATED if created else HTTP_200_OK,
+        )
+
+
+# 지원 내역 상세 (매니저 또는 지원한 강사 본인)
+# GET /api/lectures/applications/<id>/
+class ApplicationDetailView(generics.RetrieveAPIView):
+    serializer_class = ApplicationDetailSerializer
+
+    def get_queryset(self):
+        queryset = Application.objects.select_related('user', 'portfolio')
+        if self.request.user.role != User.Role.MANAGER:
+            queryset = queryset.filter(user_id=self.request.user.id)
+        return queryset
+
+
+# 강의 일괄 배정 (매니저)
+# POST /api/lectures/allocations/ {"lecture_ids": [...]}
+class LectureAllocationView(APIView):
+    permission_classes = [IsAuthenticated, IsManager]
+
+    def post(self, request):
+        serializer = LectureAllocationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = allocate_lectures(serializer.validated_data['lecture_ids'])
+        except SlotConflict as e:
+            return Response({'detail': str(e)}, status=HTTP_409_CONFLICT)
+        return Response(result.as_dict())
+
+
+# 강의 일괄 가져오기 (매니저)
+# POST /api/lectures/import/ multipart: file(.csv/.xlsx), encoding, dry_run, notify
+# CSV 는 첫 청크를 저장하기 전에 파일 전체의 인코딩을 확인함
+# 큰 업로드는 Django 가 임시 파일로 받아 두므로 행 단위로 읽어도 메모리에 전부 올라가지 않음
+class LectureImportView(APIView):
+    permission_classes = [IsAuthenticated, IsManager]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        serializer = LectureImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        upload = data['file']
+        importer = LectureImporter(dry_run=data['dry_run'], notify=data['notify'])
+        try:
+            rows = read_rows(upload, detect_format(upload.name), data['encoding'])
+            result = importer.run(rows)
+        except ImportFileError as e:
+            # 도중에 중단되면 이미 저장된 건수와 읽지 못한 행 번호도 함께 응답
+            return Response(e.as_dict(), status=HTTP_400_BAD_REQUEST)
+        return Response(result.as_dict())
+
+
+# 지원 내역 CSV 내보내기 (매니저, 정산/현장 명단용)
+# GET /api/lectures/applications/export/?lecture=&assignment_status=&start_from=&start_to=&gzip=1
+# 서버 측 커서로 읽으며 바로 스트리밍하므로 시즌 전체를 내보내도 메모리 사용량이 일정
+class ApplicationExportView(APIView):
+    permission_classes = [IsAuthenticated, IsManager]
+    filename = 'applications'
+
+    def get_queryset(self):
+        queryset = Application.objects.all()
+        params = self.request.query_params
+
+        lecture_id = params.get('lecture')
+        if lecture_id:
+            if not lecture_id.isdigit():
+                raise ValidationError({'lecture': '올바르지 않은 강의 ID 입니다.'})
+            queryset = queryset.filter(lecture_id=lecture_id)
+
+        queryset = filter_assignment_status(self.request, queryset)
+
+        start_from = parse_datetime_param(self.request, 'start_from')
+        if start_from:
+            queryset = queryset.filter(lecture__lecture_start_datetime__gte=start_from)
+
+        start_to = parse_datetime_param(self.request, 'start_to')
+        if start_to:
+            queryset = queryset.filter(lecture__lecture_start_datetime__lt=start_to)
+
+        return queryset
+
+    def get_filename(self):
+        return f"{self.filename}-{timezone.localdate():%Y%m%d}.csv"
+
+    def get(self, request, *args, **kwargs):
+        chunks = iter_csv(self.get_queryset())
+        filename = self.get_filename()
+        content_type = 'text/csv; charset=utf-8'
+        if request.query_params.get('gzip') in ('1', 'true'):
+            chunks = gzip_stream(chunks)
+            filename += '.gz'
+            content_type = 'application/gzip'
+
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+# 강의별 현장 명단 (배정된 강사만)
+# GET /api/lectures/<lecture_id>/roster/?gzip=1
+class LectureRosterExportView(ApplicationExportView):
+    filename = 'roster'
+
+    def get_queryset(self):
+        return Application.objects.filter(
+            lecture_id=self.kwargs['lecture_id'],
+            assignment_status=Application.AssignmentStatus.ASSIGNED,
+        )
+
+    def get_filename(self):
+        return f"{self.filename}-{self.kwargs['lecture_id']}.csv"
+
+
+# 강의별 강사 추천 (매니저, 배정 화면)
+# GET /api/lectures/<lecture_id>/recommendations/?role=main&k=20
+class LectureRecommendationView(APIView):
+    permission_classes = [IsAuthenticated, IsManager]
+
+    def get(self, request, lecture_id):
+        params = RecommendationQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        lecture = get_object_or_404(
+            Lecture.objects.only('id', 'type', 'category', 'location', 'lecture_start_datetime', 'lecture_end_datetime'),
+            pk=lecture_id,
+        )
+        try:
+            data = recommend(lecture, role=params.validated_data['role'], k=params.validated_data['k'])
+        except RecommendationUnavailable as e:
+            return Response({'detail': str(e)}, status=HTTP_503_SERVICE_UNAVAILABLE)
+        return Response(data)
+
+
+# 강사 일정 (배정된 강의 + 모집중 강의)
+# GET /api/lectures/calendar/?start=&end= (기본: 오늘부터 30일)
+# 일정이 바뀌지 않았으면 If-None-Match/If-Modified-Since 에 304 (본문을 만들지 않음)
+class LectureCalendarView(APIView):
+    permission_classes = [IsAuthenticated, IsInstructor]
+
+    def get(self, request):
+        start = parse_datetime_param(request, 'start') or start_of_today()
+        end = parse_datetime_param(request, 'end') or start + timedelta(days=30)
+        if end <= start:
+            raise ValidationError({'end': '종료 일시는 시작 일시 이후여야 합니다.'})
+        if end - start > MAX_RANGE:
+            raise ValidationError({'end': f'조회 기간은 {MAX_RANGE.days}일 이하여야 합니다.'})
+
+        user_id = request.user.id
+        # 구독 URL 이 본문에 들어가므로 토큰을 재발급하면 버전도 바뀌어야 함
+        token_version = request.user.calendar_token_version
+        etag, last_modified = calendar_version(user_id, start.isoformat(), end.isoformat(), token_version)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = Response({
+                'start': start,
+                'end': end,
+                'ical_url': ical_url(request, calendar_token(user_id, token_version)),
+                'assigned': CalendarAssignmentSerializer(
+                    CalendarAssignmentSerializer.project(assigned_slots(user_id, start, end)), many=True
+                ).data,
+                'recruiting': CalendarRecruitingSerializer(
+                    CalendarRecruitingSerializer.project(recruiting_lectures(start, end)), many=True
+                ).data,
+            })
+        return set_version_headers(response, etag, last_modified)
+
+
+def ical_url(request, token):
+    return request.build_absolute_uri(reverse('lecture-calendar-ical', args=[token]))
+
+
+# 일정 구독 URL 재발급 (이전 URL 은 더 이상 동작하지 않음)
+# POST /api/lectures/calendar/token/
+class LectureCalendarTokenView(APIView):
+    permission_classes = [IsAuthenticated, IsInstructor]
+
+    def post(self, request):
+        return Response({'ical_url': ical_url(request, rotate_calendar_token(request.user.id))})
+
+
+# 강사 일정 iCalendar 구독 (서명된 토큰으로 인증, 지난 30일 ~ 앞으로 1년)
+# GET /api/lectures/calendar/<token>.ics
+# 캘린더 앱이 Accept 헤더를 제각각 보내므로 DRF 콘텐츠 협상을 거치지 않는 일반 View
+class LectureCalendarICalView(View):
+    def get(self, request, token):
+        # 토큰 버전과 활성 여부는 304 응답 전에도 확인 (기본키 조회 한 번)
+        user_id = user_id_from_token(token)
+        if user_id is None:
+            raise Http404
+
+        today = start_of_today()
+        etag, last_modified = calendar_version(user_id, 'ical', today.isoformat())
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = HttpResponse(
+                render_ical(user_id, today - ICAL_PAST, today + ICAL_FUTURE, last_modified),
+                content_type='text/calendar; charset=utf-8',
+            )
+        return set_version_headers(response, etag, last_modified)
@@ -0,0 +1,159 @@
+import math
+import threading
+from collections import defaultdict
+
+from django.db import connection
+from django.db.models import FloatField, BooleanField
+from django.db.models.expressions import RawSQL
+
+from .models import SearchDocument
+from .tokenizer import tokenize
+
+
+def _filter_documents(queryset, kind=None, status=None, lecture_type=None):
+    if kind:
+        queryset = queryset.filter(kind=kind)
+    if status:
+        queryset = queryset.filter(status=status)
+    if lecture_type:
+        queryset = queryset.filter(type=lecture_type)
+    return queryset
+
+
+# 검색 결과는 (SearchDocument, 점수) 목록
+
+
+# PostgreSQL: search_vector GIN 인덱스 + ts_rank, 제목 trigram 유사도로 보정
+class PostgresSearchBackend:
+    def search(self, query, kind=None, status=None, lecture_type=None, offset=0, limit=20):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        tsquery = ' '.join(tokens)
+
+        queryset = (
+            _filter_documents(SearchDocument.objects.all(), kind, status, lecture_type)
+            .annotate(
+                matched=RawSQL(
+                    "search_vector @@ plainto_tsquery('simple', %s)", [tsquery], output_field=BooleanField()
+                ),
+                rank=RawSQL(
+                    "ts_rank(search_vector, plainto_tsquery('simple', %s)) + similarity(title, %s)",
+                    [tsquery, query],
+                    output_field=FloatField(),
+                ),
+            )
+            .filter(matched=True)
+            .order_by('-rank', '-created_at')
+        )
+        return [(document, document.rank) for document in queryset[offset:offset + limit]]
+
+    def update(self, documents):
+        pass
+
+    def remove(self, keys):
+        pass
+
+
+# SQLite 등: 프로세스 내부 역색인
+# 처음 검색할 때 SearchDocument 전체로 색인을 만들고 이후에는 변경분만 반영
+class InvertedIndexBackend:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._postings = defaultdict(dict)  # token -> {(kind, object_id): 빈도}
+        self._documents = {}                # (kind, object_id) -> SearchDocument
+
+    def _load(self):
+        if self._loaded:
+            return
+        for document in SearchDocument.objects.iterator(chunk_size=2000):
+            self._add(document)
+        self._loaded = True
+
+    def _key(self, document):
+        return document.kind, document.object_id
+
+    def _add(self, document):
+        key = self._key(document)
+        self._discard(key)
+        self._documents[key] = document
+        frequencies = defaultdict(int)
+        for token in document.document.split():
+            frequencies[token] += 1
+        for token, frequency in frequencies.items():
+            self._postings[token][key] = frequency
+
+    def _discard(self, key):
+        document = self._documents.pop(key, None)
+        if document is None:
+            return
+        for token in set(document.document.split()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[token]
+
+    def update(self, documents):
+        with self._lock:
+            if self._loaded:
+                for document in documents:
+                    self._add(document)
+
+    def remove(self, keys):
+        with self._lock:
+            if self._loaded:
+                for key in keys:
+                    self._discard(key)
+
+    def reset(self):
+        with self._lock:
+            self._loaded = False
+            self._postings.clear()
+            self._documents.clear()
+
+    def search(self, query, kind=None, status=None, lecture_type=None, offset=0, limit=20):
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+
+        with self._lock:
+            self._load()
+            postings = [self._postings.get(token, {}) for token in tokens]
+            if not all(postings):
+                return []
+
+            # 모든 토큰을 포함하는 문서만 (AND), 짧은 posting 부터 교집합
+            postings.sort(key=len)
+            keys = set(postings[0])
+            for posting in postings[1:]:
+                keys &= posting.keys()
+
+            total = len(self._documents)
+            scored = []
+            for key in keys:
+                document = self._documents[key]
+                if kind and document.kind != kind:
+                    continue
+                if status and document.status != status:
+                    continue
+                if lecture_type and document.type != lecture_type:
+                    continue
+                rank = sum(posting[key] * math.log(1 + total / len(posting)) for posting in postings)
+                scored.append((document, rank))
+
+        scored.sort(key=lambda item: (item[1], item[0].created_at), reverse=True)
+        return scored[offset:offset + limit]
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend():
+    vendor = connection.vendor
+    with _backends_lock:
+        if vendor not in _backends:
+            _backends[vendor] = PostgresSearchBackend() if vendor == 'postgresql' else InvertedIndexBackend()
+        return _backends[vendor]
@@ -0,0 +1,70 @@
+from django.db import transaction
+
+from announcements.models import Announcement
+from lectures.models import Lecture
+from .backends import get_backend
+from .models import SearchDocument
+from .tokenizer import build_document
+
+BATCH_SIZE = 500
+
+
+def _lecture_document(lecture):
+    return SearchDocument(
+        kind=SearchDocument.Kind.LECTURE,
+        object_id=lecture.id,
+        title=lecture.title,
+        document=build_document(lecture.title, lecture.content_description, lecture.location, lecture.category),
+        status=lecture.status,
+        type=lecture.type,
+        created_at=lecture.created_at,
+    )
+
+
+def _announcement_document(announcement):
+    return SearchDocument(
+        kind=SearchDocument.Kind.ANNOUNCEMENT,
+        object_id=announcement.id,
+        title=announcement.title,
+        document=build_document(announcement.title, announcement.content),
+        created_at=announcement.created_at,
+    )
+
+
+def _save(documents):
+    SearchDocument.objects.bulk_create(
+        documents,
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['kind', 'object_id'],
+        update_fields=['title', 'document', 'status', 'type', 'created_at'],
+    )
+    transaction.on_commit(lambda: get_backend().update(documents))
+
+
+def _index(queryset, build, ids=None):
+    if ids is not None:
+        queryset = queryset.filter(id__in=ids)
+    documents = []
+    for instance in queryset.order_by('id').iterator(chunk_size=BATCH_SIZE):
+        documents.append(build(instance))
+        if len(documents) >= BATCH_SIZE:
+            _save(documents)
+            documents = []
+    if documents:
+        _save(documents)
+
+
+# ids 를 생략하면 전체 재색인
+def index_lectures(ids=None):
+    _index(Lecture.objects.all(), _lecture_document, ids)
+
+
+def index_announcements(ids=None):
+    _index(Announcement.objects.all(), _announcement_document, ids)
+
+
+def remove_documents(kind, ids):
+    SearchDocument.objects.filter(kind=kind, object_id__in=ids).delete()
+    keys = [(kind, object_id) for object_id in ids]
+    transaction.on_commit(lambda: get_backend().remove(keys))
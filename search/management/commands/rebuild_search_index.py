@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from search.backends import get_backend
+from search.index import index_lectures, index_announcements
+
+
+class Command(BaseCommand):
+    help = '강의/공지사항 검색 문서를 전부 다시 만듭니다.'
+
+    def handle(self, *args, **options):
+        index_lectures()
+        index_announcements()
+        backend = get_backend()
+        if hasattr(backend, 'reset'):
+            backend.reset()
+        self.stdout.write(self.style.SUCCESS('검색 색인을 다시 만들었습니다.'))
@@ -0,0 +1,126 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:55
+
+import re
+
+from django.db import migrations, models
+
+# search.tokenizer 를 나중에 바꿔도 이 마이그레이션 결과가 달라지지 않도록 당시 구현을 그대로 복사해 둠
+WORD_RE = re.compile(r'[가-힣]+|[ㄱ-ㆎ]+|[0-9a-z]+')
+
+
+def tokenize(text):
+    if not text:
+        return []
+    tokens = []
+    for word in WORD_RE.findall(text.lower()):
+        if '가' <= word[0] <= '힣' and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def build_document(title, *fields):
+    title_tokens = tokenize(title)
+    body_tokens = [token for field in fields for token in tokenize(field)]
+    return ' '.join(title_tokens + title_tokens + body_tokens)
+
+
+# PostgreSQL 전용: tsvector 생성 컬럼 + GIN 인덱스, 제목 trigram GIN 인덱스
+def create_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        "ALTER TABLE search_searchdocument ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', document)) STORED"
+    )
+    schema_editor.execute(
+        'CREATE INDEX search_document_vector_gin ON search_searchdocument USING GIN (search_vector)'
+    )
+    schema_editor.execute(
+        'CREATE INDEX search_document_title_trgm ON search_searchdocument USING GIN (title gin_trgm_ops)'
+    )
+
+
+def drop_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS search_document_title_trgm')
+    schema_editor.execute('DROP INDEX IF EXISTS search_document_vector_gin')
+    schema_editor.execute('ALTER TABLE search_searchdocument DROP COLUMN IF EXISTS search_vector')
+
+
+# 기존 강의/공지사항으로 검색 문서 생성 (BATCH_SIZE 건씩 만들고 저장해 메모리에 전체를 올리지 않음)
+BATCH_SIZE = 500
+
+
+def backfill_documents(apps, schema_editor):
+    Lecture = apps.get_model('lectures', 'Lecture')
+    Announcement = apps.get_model('announcements', 'Announcement')
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+
+    def save_in_batches(documents):
+        batch = []
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= BATCH_SIZE:
+                SearchDocument.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            SearchDocument.objects.bulk_create(batch)
+
+    save_in_batches(
+        SearchDocument(
+            kind='lecture',
+            object_id=lecture.id,
+            title=lecture.title,
+            document=build_document(lecture.title, lecture.content_description, lecture.location, lecture.category),
+            status=lecture.status,
+            type=lecture.type,
+            created_at=lecture.created_at,
+        )
+        for lecture in Lecture.objects.order_by('id').iterator(chunk_size=BATCH_SIZE)
+    )
+    save_in_batches(
+        SearchDocument(
+            kind='announcement',
+            object_id=announcement.id,
+            title=announcement.title,
+            document=build_document(announcement.title, announcement.content),
+            created_at=announcement.created_at,
+        )
+        for announcement in Announcement.objects.order_by('id').iterator(chunk_size=BATCH_SIZE)
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('announcements', '0001_initial'),
+        ('lectures', '0002_lecture_cursor_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('lecture', '강의'), ('announcement', '공지사항')], max_length=20, verbose_name='문서 종류')),
+                ('object_id', models.BigIntegerField(verbose_name='원본 ID')),
+                ('title', models.CharField(max_length=255, verbose_name='제목')),
+                ('document', models.TextField(verbose_name='검색 토큰')),
+                ('status', models.CharField(blank=True, max_length=20, null=True, verbose_name='강의 상태')),
+                ('type', models.CharField(blank=True, max_length=20, null=True, verbose_name='강의 유형')),
+                ('created_at', models.DateTimeField(verbose_name='원본 생성일')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'status', 'type'], name='search_sear_kind_8d5a3e_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_document')],
+            },
+        ),
+        migrations.RunPython(create_postgres_indexes, drop_postgres_indexes),
+        migrations.RunPython(backfill_documents, migrations.RunPython.noop),
+    ]
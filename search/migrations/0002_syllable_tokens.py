@@ -0,0 +1,70 @@
+import re
+
+from django.db import migrations
+
+# search.tokenizer 를 나중에 바꿔도 이 마이그레이션 결과가 달라지지 않도록 당시 구현을 그대로 복사해 둠
+WORD_RE = re.compile(r'[가-힣]+|[ㄱ-ㆎ]+|[0-9a-z]+')
+BATCH_SIZE = 500
+
+
+def index_tokens(text):
+    if not text:
+        return []
+    tokens = []
+    syllables = []
+    for word in WORD_RE.findall(text.lower()):
+        if '가' <= word[0] <= '힣' and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+            syllables.extend(word)
+        else:
+            tokens.append(word)
+    return tokens + syllables
+
+
+def build_document(title, *fields):
+    title_tokens = index_tokens(title)
+    body_tokens = [token for field in fields for token in index_tokens(field)]
+    return ' '.join(title_tokens + title_tokens + body_tokens)
+
+
+# 한 글자 검색어를 찾을 수 있도록 한글 음절 토큰을 더해 기존 문서를 다시 만듦 (BATCH_SIZE 건씩)
+def rebuild_documents(apps, schema_editor):
+    Lecture = apps.get_model('lectures', 'Lecture')
+    Announcement = apps.get_model('announcements', 'Announcement')
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+
+    sources = (
+        ('lecture', Lecture, lambda lecture: build_document(
+            lecture.title, lecture.content_description, lecture.location, lecture.category,
+        )),
+        ('announcement', Announcement, lambda announcement: build_document(
+            announcement.title, announcement.content,
+        )),
+    )
+    for kind, model, build in sources:
+        batch = {}
+        for instance in model.objects.order_by('id').iterator(chunk_size=BATCH_SIZE):
+            batch[instance.id] = build(instance)
+            if len(batch) >= BATCH_SIZE:
+                _update(SearchDocument, kind, batch)
+                batch = {}
+        if batch:
+            _update(SearchDocument, kind, batch)
+
+
+def _update(SearchDocument, kind, documents):
+    rows = list(SearchDocument.objects.filter(kind=kind, object_id__in=documents).only('id', 'object_id'))
+    for row in rows:
+        row.document = documents[row.object_id]
+    SearchDocument.objects.bulk_update(rows, ['document'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_documents, migrations.RunPython.noop),
+    ]
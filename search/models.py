@@ -0,0 +1,33 @@
+from django.db import models
+
+
+# SearchDocument
+# 강의/공지사항 한 건당 하나씩 유지되는 검색 문서
+# PostgreSQL 에서는 document 로부터 생성되는 search_vector(tsvector) 컬럼과 GIN 인덱스가 추가됨 (마이그레이션 참고)
+class SearchDocument(models.Model):
+    class Kind(models.TextChoices):
+        LECTURE = 'lecture', '강의'
+        ANNOUNCEMENT = 'announcement', '공지사항'
+
+    kind = models.CharField('문서 종류', max_length=20, choices=Kind.choices)
+    object_id = models.BigIntegerField('원본 ID')
+
+    title = models.CharField('제목', max_length=255)
+    document = models.TextField('검색 토큰')
+
+    # 강의 필터용 (공지사항은 비어 있음)
+    status = models.CharField('강의 상태', max_length=20, blank=True, null=True)
+    type = models.CharField('강의 유형', max_length=20, blank=True, null=True)
+
+    created_at = models.DateTimeField('원본 생성일')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='unique_search_document'),
+        ]
+        indexes = [
+            models.Index(fields=['kind', 'status', 'type']),
+        ]
+
+    def __str__(self):
+        return f"[{self.get_kind_display()}] {self.title}"
@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+from lectures.models import Lecture
+from .models import SearchDocument
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=100)
+    kind = serializers.ChoiceField(choices=SearchDocument.Kind.choices, required=False)
+    status = serializers.ChoiceField(choices=Lecture.LectureStatus.choices, required=False)
+    type = serializers.ChoiceField(choices=Lecture.LectureType.choices, required=False)
+    offset = serializers.IntegerField(min_value=0, max_value=1000, default=0)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=20)
+
+
+class SearchResultSerializer(serializers.Serializer):
+    kind = serializers.CharField()
+    id = serializers.IntegerField(source='object_id')
+    title = serializers.CharField()
+    status = serializers.CharField(allow_null=True)
+    type = serializers.CharField(allow_null=True)
+    created_at = serializers.DateTimeField()
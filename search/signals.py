@@ -0,0 +1,37 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from announcements.models import Announcement
+from config.tasks import enqueue
+from lectures.models import Lecture
+from lectures.signals import lectures_bulk_changed
+from .index import index_lectures, index_announcements, remove_documents
+from .models import SearchDocument
+
+
+# 원본이 저장/삭제될 때 검색 문서를 같은 트랜잭션에서 갱신
+@receiver(post_save, sender=Lecture)
+def lecture_saved(sender, instance, **kwargs):
+    index_lectures([instance.id])
+
+
+@receiver(post_delete, sender=Lecture)
+def lecture_deleted(sender, instance, **kwargs):
+    remove_documents(SearchDocument.Kind.LECTURE, [instance.id])
+
+
+@receiver(post_save, sender=Announcement)
+def announcement_saved(sender, instance, **kwargs):
+    index_announcements([instance.id])
+
+
+@receiver(post_delete, sender=Announcement)
+def announcement_deleted(sender, instance, **kwargs):
+    remove_documents(SearchDocument.Kind.ANNOUNCEMENT, [instance.id])
+
+
+# 일괄 변경은 작업 큐에서 재색인
+@receiver(lectures_bulk_changed)
+def lectures_changed(sender, lecture_ids, **kwargs):
+    if lecture_ids:
+        enqueue(index_lectures, list(lecture_ids))
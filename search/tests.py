@@ -0,0 +1,91 @@
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from announcements.models import Announcement
+from lectures.models import Lecture
+from .backends import InvertedIndexBackend, get_backend
+from .index import index_lectures
+from .models import SearchDocument
+from .tokenizer import build_document, index_tokens, tokenize
+
+
+class TokenizerTests(SimpleTestCase):
+    def test_hangul_bigrams_and_words(self):
+        self.assertEqual(tokenize('로봇캠프 AI-2026'), ['로봇', '봇캠', '캠프', 'ai', '2026'])
+        self.assertEqual(tokenize('봇'), ['봇'])
+        self.assertEqual(tokenize(''), [])
+
+    def test_index_adds_syllables(self):
+        self.assertEqual(index_tokens('로봇 ai'), ['로봇', 'ai', '로', '봇'])
+        # 제목 토큰은 두 번
+        self.assertEqual(build_document('로봇', '캠프'), '로봇 로 봇 로봇 로 봇 캠프 캠 프')
+
+
+# SQLite 에서는 프로세스 내부 역색인(InvertedIndexBackend)을 사용
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class SearchTests(TestCase):
+    def setUp(self):
+        backend = get_backend()
+        self.assertIsInstance(backend, InvertedIndexBackend)
+        backend.reset()
+        self.addCleanup(backend.reset)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user(
+            username='instructor', email='instructor@example.com', password='password', name='강사',
+        ))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.robot = Lecture.objects.create(title='로봇 코딩 캠프', location='서울')
+            self.drone = Lecture.objects.create(
+                title='드론 교실', content_description='로봇 팔 실습', status=Lecture.LectureStatus.COMPLETED,
+            )
+            self.notice = Announcement.objects.create(title='캠프 안내', content='준비물: 노트북')
+
+    def search(self, q, **params):
+        response = self.client.get('/api/search/', {'q': q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(row['kind'], row['id']) for row in response.json()['results']]
+
+    def test_documents_are_indexed_on_save(self):
+        self.assertEqual(
+            set(SearchDocument.objects.values_list('kind', 'object_id')),
+            {('lecture', self.robot.id), ('lecture', self.drone.id), ('announcement', self.notice.id)},
+        )
+
+    def test_query_matches_all_terms_and_ranks_title_first(self):
+        # 제목에 있는 문서가 본문에만 있는 문서보다 앞
+        self.assertEqual(self.search('로봇'), [('lecture', self.robot.id), ('lecture', self.drone.id)])
+        self.assertEqual(set(self.search('캠프')), {('announcement', self.notice.id), ('lecture', self.robot.id)})
+        self.assertEqual(self.search('로봇 서울'), [('lecture', self.robot.id)])
+        self.assertEqual(self.search('없는 검색어'), [])
+
+    def test_filters(self):
+        self.assertEqual(self.search('캠프', kind='announcement'), [('announcement', self.notice.id)])
+        self.assertEqual(self.search('로봇', status=Lecture.LectureStatus.COMPLETED), [('lecture', self.drone.id)])
+
+    def test_single_syllable_query(self):
+        self.assertEqual(self.search('봇', kind='lecture'), [('lecture', self.robot.id), ('lecture', self.drone.id)])
+        self.assertEqual(self.search('팔'), [('lecture', self.drone.id)])
+
+    def test_reindexes_after_update_and_delete(self):
+        # 색인을 먼저 읽어 둔 뒤의 변경분 반영
+        self.assertEqual(self.search('드론'), [('lecture', self.drone.id)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.drone.title = '3D 프린팅 교실'
+            self.drone.save()
+        self.assertEqual(self.search('드론'), [])
+        self.assertEqual(self.search('프린팅'), [('lecture', self.drone.id)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Lecture.objects.filter(id=self.robot.id).update(title='코딩 교실')
+            index_lectures([self.robot.id])
+        self.assertEqual(self.search('교실'), [('lecture', self.drone.id), ('lecture', self.robot.id)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.drone.delete()
+            self.notice.delete()
+        self.assertEqual(self.search('교실'), [('lecture', self.robot.id)])
+        self.assertEqual(self.search('캠프'), [])
+        self.assertFalse(SearchDocument.objects.filter(object_id=self.drone.id, kind='lecture').exists())
@@ -0,0 +1,40 @@
+import re
+
+# 한글 음절, 한글 자모, 영문/숫자 단위로 분리
+WORD_RE = re.compile(r'[가-힣]+|[ㄱ-ㆎ]+|[0-9a-z]+')
+
+
+def _is_hangul(word):
+    return '가' <= word[0] <= '힣'
+
+
+# 한국어 친화적 토큰화 (검색어)
+# 한글은 형태소 분석 없이 2-gram 으로 나누어 조사/어미가 붙어도 검색되도록 하고
+# 영문/숫자는 단어 단위로 사용
+def tokenize(text):
+    if not text:
+        return []
+    tokens = []
+    for word in WORD_RE.findall(text.lower()):
+        if _is_hangul(word) and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+# 색인용 토큰화: 검색어 토큰에 한글 음절(1-gram)을 더함
+# 한 글자 검색어(예: '봇')는 2-gram 으로 나눌 수 없으므로 음절 토큰으로 찾음
+def index_tokens(text):
+    tokens = tokenize(text)
+    for word in WORD_RE.findall(text.lower()) if text else []:
+        if _is_hangul(word) and len(word) > 1:
+            tokens.extend(word)
+    return tokens
+
+
+# 검색 문서 (제목 토큰은 두 번 넣어 가중치를 줌)
+def build_document(title, *fields):
+    title_tokens = index_tokens(title)
+    body_tokens = [token for field in fields for token in index_tokens(field)]
+    return ' '.join(title_tokens + title_tokens + body_tokens)
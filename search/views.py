@@ -0,0 +1,29 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .backends import get_backend
+from .serializers import SearchQuerySerializer, SearchResultSerializer
+
+
+# 강의/공지사항 통합 검색
+# GET /api/search/?q=&kind=&status=&type=&offset=&limit=
+class SearchView(APIView):
+    def get(self, request):
+        params = SearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        results = get_backend().search(
+            data['q'],
+            kind=data.get('kind'),
+            status=data.get('status'),
+            lecture_type=data.get('type'),
+            offset=data['offset'],
+            limit=data['limit'],
+        )
+        return Response({
+            'results': [
+                {**SearchResultSerializer(document).data, 'rank': rank}
+                for document, rank in results
+            ],
+        })
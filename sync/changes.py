@@ -0,0 +1,123 @@
+import base64
+import binascii
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from .models import ChangeLog
+
+Kind = ChangeLog.Kind
+
+BATCH_SIZE = 1000
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+# 모든 사용자에게 보이는 변경 기록 (강의/모집 정보/공지사항)
+# 원본 변경과 같은 트랜잭션에서 INSERT 해야 함
+def record_changes(kind, object_ids, deleted=False):
+    record_user_changes(kind, ((object_id, None) for object_id in object_ids), deleted)
+
+
+# 한 사용자에게만 보이는 변경 기록 (알림/지원서). pairs: (object_id, user_id)
+def record_user_changes(kind, pairs, deleted=False):
+    ChangeLog.objects.bulk_create(
+        [ChangeLog(kind=kind, object_id=object_id, user_id=user_id, deleted=deleted) for object_id, user_id in pairs],
+        batch_size=BATCH_SIZE,
+    )
+
+
+def retention():
+    return timedelta(days=getattr(settings, 'SYNC_RETENTION_DAYS', 30))
+
+
+# 커서: (txid, change_id, 발급 시각) 를 base64 로 감싼 문자열
+# 기록 보관 기간(하루 여유)보다 오래된 커서는 만료 → 클라이언트가 전체를 다시 받음
+def encode_cursor(position):
+    txid, change_id = position
+    raw = f'{txid}.{change_id}.{int(timezone.now().timestamp())}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+# 만료된 커서면 None
+def decode_cursor(value):
+    try:
+        raw = base64.urlsafe_b64decode(value + '=' * (-len(value) % 4)).decode()
+        txid, change_id, issued_at = (int(part) for part in raw.split('.'))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor('올바르지 않은 커서입니다.')
+    if timezone.now().timestamp() - issued_at > (retention() - timedelta(days=1)).total_seconds():
+        return None
+    return txid, change_id
+
+
+# PostgreSQL: 진행 중인 가장 오래된 트랜잭션 ID
+# 이보다 작은 txid 의 기록은 모두 커밋(또는 롤백)되어, 이후에 끼어드는 기록이 없음
+def _horizon():
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint')
+        return cursor.fetchone()[0]
+
+
+# 처음 동기화하는 클라이언트의 시작 위치 (이후 변경만 받음)
+def current_position():
+    if connection.vendor == 'postgresql':
+        return _horizon(), 0
+    return 0, ChangeLog.objects.aggregate(last=Max('id'))['last'] or 0
+
+
+# position 이후 user_id 에게 보이는 변경을 순서대로 최대 limit 건
+# 반환: ([(kind, object_id, deleted)], 다음 위치, 남은 변경이 있는지)
+def read_changes(user_id, position, limit):
+    if connection.vendor == 'postgresql':
+        return _read_postgres(user_id, position, limit)
+
+    # 그 밖의 DB(개발용 SQLite 등)는 id 순서가 커밋 순서라고 보고 id 만 사용
+    _, change_id = position
+    rows = list(
+        ChangeLog.objects
+        .filter(id__gt=change_id)
+        .filter(Q(user_id__isnull=True) | Q(user_id=user_id))
+        .order_by('id')
+        .values_list('id', 'kind', 'object_id', 'deleted')[:limit]
+    )
+    if rows:
+        position = (0, rows[-1][0])
+    return [row[1:] for row in rows], position, len(rows) == limit
+
+
+def _read_postgres(user_id, position, limit):
+    horizon = _horizon()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT txid, id, kind, object_id, deleted FROM sync_changelog '
+            'WHERE (txid, id) > (%s, %s) AND txid < %s AND (user_id IS NULL OR user_id = %s) '
+            'ORDER BY txid, id LIMIT %s',
+            [*position, horizon, user_id, limit],
+        )
+        rows = cursor.fetchall()
+    if len(rows) == limit:
+        return [row[2:] for row in rows], tuple(rows[-1][:2]), True
+    # 범위를 다 읽었으면 다음에는 아직 진행 중이던 트랜잭션부터
+    return [row[2:] for row in rows], max(position, (horizon, 0)), False
+
+
+# 보관 기간이 지난 기록 삭제 (batch_size 건씩, id 순서로 오래된 것부터)
+def prune_changes(before=None, batch_size=10000):
+    before = before or timezone.now() - retention()
+    deleted = 0
+    while True:
+        ids = list(
+            ChangeLog.objects
+            .filter(changed_at__lt=before)
+            .order_by('id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        deleted += ChangeLog.objects.filter(id__in=ids).delete()[0]
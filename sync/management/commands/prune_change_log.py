@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from sync.changes import prune_changes, retention
+
+
+# 보관 기간(SYNC_RETENTION_DAYS)이 지난 동기화 변경 기록 삭제 (cron 등으로 하루 한 번)
+# 그보다 오래된 커서를 가진 클라이언트는 reset 응답을 받고 전체를 다시 받음
+class Command(BaseCommand):
+    help = '보관 기간이 지난 동기화 변경 기록을 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help='보관 일수 (기본: SYNC_RETENTION_DAYS)')
+        parser.add_argument('--batch-size', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        keep = timedelta(days=options['days']) if options['days'] else retention()
+        deleted = prune_changes(timezone.now() - keep, batch_size=options['batch_size'])
+        self.stdout.write(f'변경 기록 {deleted}건 삭제')
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:53
+
+from django.db import migrations, models
+
+
+# PostgreSQL 전용: 기록한 트랜잭션 ID 컬럼 + (txid, id) 인덱스 (PostgreSQL 13+)
+# 모델에는 없는 컬럼이라 INSERT 에서 빠지고 기본값(현재 트랜잭션 ID)이 들어감
+# 동기화는 진행 중인 가장 오래된 트랜잭션보다 앞선 기록만 읽으므로, 늦게 커밋된 변경을 건너뛰지 않음
+def create_postgres_columns(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'ALTER TABLE sync_changelog ADD COLUMN txid bigint NOT NULL '
+        'DEFAULT (pg_current_xact_id()::text::bigint)'
+    )
+    schema_editor.execute('CREATE INDEX sync_changelog_txid_id ON sync_changelog (txid, id)')
+
+
+def drop_postgres_columns(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS sync_changelog_txid_id')
+    schema_editor.execute('ALTER TABLE sync_changelog DROP COLUMN IF EXISTS txid')
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('lecture', '강의'), ('recruitment', '모집 정보'), ('announcement', '공지사항'), ('notification', '알림'), ('application', '지원서')], max_length=20, verbose_name='대상 종류')),
+                ('object_id', models.BigIntegerField(verbose_name='대상 ID')),
+                ('user_id', models.BigIntegerField(blank=True, null=True, verbose_name='대상 사용자 ID')),
+                ('deleted', models.BooleanField(default=False, verbose_name='삭제 여부')),
+                ('changed_at', models.DateTimeField(auto_now_add=True, verbose_name='변경 일시')),
+            ],
+        ),
+        migrations.RunPython(create_postgres_columns, drop_postgres_columns),
+    ]
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+# ChangeLog
+# 모바일 증분 동기화용 변경 기록. 생성/수정 한 건당 한 행, 삭제는 deleted=True 인 행(tombstone)
+# - id 가 변경 순서. PostgreSQL 에서는 기록한 트랜잭션 ID(txid) 컬럼과 (txid, id) 인덱스가 추가됨 (마이그레이션 참고)
+# - user_id 가 비어 있으면 모든 사용자, 있으면 그 사용자에게만 보이는 변경 (알림/지원서)
+#   사용자 탈퇴 시 함께 삭제되는 알림/지원서의 tombstone 도 남아야 하므로 FK 로 두지 않음
+class ChangeLog(models.Model):
+    class Kind(models.TextChoices):
+        LECTURE = 'lecture', '강의'
+        RECRUITMENT = 'recruitment', '모집 정보'
+        ANNOUNCEMENT = 'announcement', '공지사항'
+        NOTIFICATION = 'notification', '알림'
+        APPLICATION = 'application', '지원서'
+
+    kind = models.CharField('대상 종류', max_length=20, choices=Kind.choices)
+    object_id = models.BigIntegerField('대상 ID')
+    user_id = models.BigIntegerField('대상 사용자 ID', blank=True, null=True)
+    deleted = models.BooleanField('삭제 여부', default=False)
+    changed_at = models.DateTimeField('변경 일시', auto_now_add=True)
+
+    def __str__(self):
+        return f"[{self.get_kind_display()}] {self.object_id}{' 삭제' if self.deleted else ''}"
@@ -0,0 +1,46 @@
+from rest_framework import serializers
+
+from accounts.serializers import NotificationValuesSerializer
+from announcements.models import Announcement
+from announcements.serializers import AnnouncementSerializer
+from config.serializers import ValuesSerializer
+from lectures.models import LectureRecruitment
+from lectures.serializers import (
+    ApplicationListValuesSerializer,
+    LectureListValuesSerializer,
+    LectureRecruitmentSerializer,
+)
+
+
+class SyncQuerySerializer(serializers.Serializer):
+    cursor = serializers.CharField(required=False, allow_blank=True)
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=500)
+
+
+# 동기화 응답의 행은 목록 API 와 같은 형식 + updated_at
+class SyncLectureSerializer(LectureListValuesSerializer):
+    class Meta(LectureListValuesSerializer.Meta):
+        fields = LectureListValuesSerializer.Meta.fields + ['updated_at']
+
+
+class SyncRecruitmentSerializer(ValuesSerializer):
+    class Meta:
+        model = LectureRecruitment
+        fields = ['lecture'] + LectureRecruitmentSerializer.Meta.fields + ['updated_at']
+
+
+class SyncAnnouncementSerializer(ValuesSerializer):
+    class Meta:
+        model = Announcement
+        fields = AnnouncementSerializer.Meta.fields + ['updated_at']
+        sources = {'author_name': 'author__name'}
+
+
+class SyncNotificationSerializer(NotificationValuesSerializer):
+    class Meta(NotificationValuesSerializer.Meta):
+        fields = NotificationValuesSerializer.Meta.fields + ['updated_at']
+
+
+class SyncApplicationSerializer(ApplicationListValuesSerializer):
+    class Meta(ApplicationListValuesSerializer.Meta):
+        fields = ApplicationListValuesSerializer.Meta.fields + ['updated_at']
@@ -0,0 +1,52 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from accounts.models import Notification
+from announcements.models import Announcement
+from lectures.models import Lecture, LectureRecruitment, Application
+from lectures.signals import lectures_bulk_changed
+from .changes import Kind, record_changes, record_user_changes
+
+
+def _deleted(kwargs):
+    return kwargs['signal'] is post_delete
+
+
+# 저장/삭제를 같은 트랜잭션에서 변경 기록에 남김
+# (post_save 가 없는 일괄 변경은 각 경로에서 record_changes/record_user_changes 를 직접 호출)
+@receiver(post_save, sender=Lecture)
+@receiver(post_delete, sender=Lecture)
+def lecture_changed(sender, instance, **kwargs):
+    record_changes(Kind.LECTURE, [instance.id], deleted=_deleted(kwargs))
+
+
+@receiver(post_save, sender=LectureRecruitment)
+@receiver(post_delete, sender=LectureRecruitment)
+def recruitment_changed(sender, instance, **kwargs):
+    record_changes(Kind.RECRUITMENT, [instance.lecture_id], deleted=_deleted(kwargs))
+
+
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+def announcement_changed(sender, instance, **kwargs):
+    record_changes(Kind.ANNOUNCEMENT, [instance.id], deleted=_deleted(kwargs))
+
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def notification_changed(sender, instance, **kwargs):
+    record_user_changes(Kind.NOTIFICATION, [(instance.id, instance.user_id)], deleted=_deleted(kwargs))
+
+
+# 지원서가 생기거나 없어지면 강의 목록의 지원자 수도 바뀜
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def application_changed(sender, instance, **kwargs):
+    record_user_changes(Kind.APPLICATION, [(instance.id, instance.user_id)], deleted=_deleted(kwargs))
+    if kwargs.get('created') or _deleted(kwargs):
+        record_changes(Kind.LECTURE, [instance.lecture_id])
+
+
+@receiver(lectures_bulk_changed)
+def lectures_changed(sender, lecture_ids, **kwargs):
+    record_changes(Kind.LECTURE, lecture_ids)
@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User, Notification
+from announcements.models import Announcement
+from lectures.applications import submit_application
+from lectures.models import Lecture, LectureRecruitment
+
+
+def create_user(username, role=User.Role.INSTRUCTOR):
+    return User.objects.create_user(
+        username=username, email=f'{username}@example.com', password='password', name=username, role=role
+    )
+
+
+@override_settings(TASK_QUEUE_BACKEND='config.tasks.InlineBackend')
+class SyncViewTests(TestCase):
+    def setUp(self):
+        self.user = create_user('instructor')
+        self.other = create_user('other')
+        self.client = APIClient()
+
+    def sync(self, user, **params):
+        self.client.force_authenticate(user)
+        response = self.client.get('/api/sync/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def ids(self, data, key):
+        return [row.get('id', row.get('lecture')) for row in data[key]['updated']]
+
+    def test_first_sync_resets_and_later_syncs_return_only_changes(self):
+        Announcement.objects.create(title='기존 공지', content='내용')
+        start = self.sync(self.user)
+        self.assertTrue(start['reset'])
+
+        lecture = Lecture.objects.create(title='로봇 캠프', status=Lecture.LectureStatus.ALLOCATING)
+        today = timezone.localdate()
+        LectureRecruitment.objects.create(lecture=lecture, application_end_date=today + timedelta(days=1))
+        data = self.sync(self.user, cursor=start['cursor'])
+
+        self.assertFalse(data['reset'])
+        self.assertEqual(self.ids(data, 'lectures'), [lecture.id])
+        self.assertEqual(self.ids(data, 'recruitments'), [lecture.id])
+        self.assertEqual(data['announcements'], {'updated': [], 'deleted': []})
+        self.assertIn('updated_at', data['lectures']['updated'][0])
+
+        # 변경이 없으면 빈 응답
+        again = self.sync(self.user, cursor=data['cursor'])
+        self.assertEqual(sum(len(again[key]['updated']) for key in ('lectures', 'recruitments')), 0)
+
+    def test_user_rows_are_private_and_deletes_are_tombstones(self):
+        today = timezone.localdate()
+        lecture = Lecture.objects.create(title='로봇 캠프', status=Lecture.LectureStatus.ALLOCATING)
+        LectureRecruitment.objects.create(lecture=lecture, application_end_date=today + timedelta(days=1))
+        Lecture.objects.filter(id=lecture.id).update(status=Lecture.LectureStatus.RECRUITING)
+        mine = self.sync(self.user)['cursor']
+        theirs = self.sync(self.other)['cursor']
+
+        application, _ = submit_application(self.user.id, lecture.id, 'main')
+        notification = Notification.objects.create(user=self.other, message='알림')
+
+        data = self.sync(self.user, cursor=mine)
+        self.assertEqual(self.ids(data, 'applications'), [application.id])
+        self.assertEqual(data['lectures']['updated'][0]['main_applicant_count'], 1)
+        self.assertEqual(data['notifications']['updated'], [])
+        other = self.sync(self.other, cursor=theirs)
+        self.assertEqual(other['applications']['updated'], [])
+        self.assertEqual(self.ids(other, 'notifications'), [notification.id])
+
+        lecture_id = lecture.id
+        lecture.delete()
+        data = self.sync(self.user, cursor=data['cursor'])
+        self.assertEqual(data['lectures']['deleted'], [lecture_id])
+        self.assertEqual(data['applications']['deleted'], [application.id])
+
+    def test_limit_pages_through_changes(self):
+        cursor = self.sync(self.user)['cursor']
+        announcements = [Announcement.objects.create(title=f'공지 {i}', content='내용') for i in range(3)]
+
+        first = self.sync(self.user, cursor=cursor, limit=2)
+        second = self.sync(self.user, cursor=first['cursor'], limit=2)
+
+        self.assertTrue(first['has_more'])
+        self.assertFalse(second['has_more'])
+        self.assertEqual(
+            self.ids(first, 'announcements') + self.ids(second, 'announcements'),
+            [announcement.id for announcement in announcements],
+        )
+
+    def test_invalid_cursor_is_rejected(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get('/api/sync/', {'cursor': '!!'})
+        self.assertEqual(response.status_code, 400)
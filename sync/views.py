@@ -0,0 +1,87 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accounts.models import Notification
+from announcements.models import Announcement
+from lectures.models import Lecture, LectureRecruitment, Application
+from .changes import InvalidCursor, Kind, current_position, decode_cursor, encode_cursor, read_changes
+from .serializers import (
+    SyncAnnouncementSerializer,
+    SyncApplicationSerializer,
+    SyncLectureSerializer,
+    SyncNotificationSerializer,
+    SyncQuerySerializer,
+    SyncRecruitmentSerializer,
+)
+
+# 변경 종류별 응답 키, 현재 행 queryset (user_id 로 범위 제한), 시리얼라이저
+SOURCES = {
+    Kind.LECTURE: ('lectures', lambda user_id: Lecture.objects.with_applicant_counts(), SyncLectureSerializer),
+    Kind.RECRUITMENT: ('recruitments', lambda user_id: LectureRecruitment.objects.all(), SyncRecruitmentSerializer),
+    Kind.ANNOUNCEMENT: ('announcements', lambda user_id: Announcement.objects.all(), SyncAnnouncementSerializer),
+    Kind.NOTIFICATION: (
+        'notifications', lambda user_id: Notification.objects.filter(user_id=user_id), SyncNotificationSerializer,
+    ),
+    Kind.APPLICATION: (
+        'applications', lambda user_id: Application.objects.filter(user_id=user_id), SyncApplicationSerializer,
+    ),
+}
+
+
+# 모바일 증분 동기화
+# GET /api/sync/?cursor=&limit=
+# - cursor 가 없거나 만료되었으면 reset=true 와 새 커서만 돌려줌
+#   → 클라이언트는 목록 API 로 전체를 받은 뒤 그 커서부터 동기화 (그 사이 변경은 다음 동기화에 다시 포함됨)
+# - 종류별 updated(현재 행, 목록 API 와 같은 형식 + updated_at), deleted(ID) 와 다음 cursor
+# - has_more 가 true 면 다음 cursor 로 바로 이어서 요청
+# 한 번에 읽는 변경 기록은 limit 건이고, 현재 행은 변경된 ID 로만 조회
+class SyncView(APIView):
+    def get(self, request):
+        params = SyncQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        cursor = params.validated_data.get('cursor')
+
+        position = None
+        if cursor:
+            try:
+                position = decode_cursor(cursor)
+            except InvalidCursor as e:
+                raise ValidationError({'cursor': str(e)})
+
+        data = {key: {'updated': [], 'deleted': []} for key, _, _ in SOURCES.values()}
+        if position is None:
+            return Response({
+                'cursor': encode_cursor(current_position()),
+                'reset': True,
+                'has_more': False,
+                **data,
+            })
+
+        user_id = request.user.id
+        changes, position, has_more = read_changes(user_id, position, params.validated_data['limit'])
+
+        # 같은 대상의 변경은 마지막 것만 (삭제 여부)
+        latest = {}
+        for kind, object_id, deleted in changes:
+            latest[kind, object_id] = deleted
+
+        for kind, (key, queryset, serializer_class) in SOURCES.items():
+            ids = [object_id for (change_kind, object_id), deleted in latest.items() if change_kind == kind]
+            if not ids:
+                continue
+            deleted = {object_id for object_id in ids if latest[kind, object_id]}
+            rows = serializer_class.project(
+                queryset(user_id).filter(pk__in=[object_id for object_id in ids if object_id not in deleted]).order_by('pk')
+            )
+            data[key]['updated'] = serializer_class(rows, many=True).data
+            # 기록 뒤에 삭제되어 행이 없으면 삭제로 취급 (tombstone 은 다음 동기화에서 다시 옴)
+            found = {row['lecture' if kind == Kind.RECRUITMENT else 'id'] for row in data[key]['updated']}
+            data[key]['deleted'] = sorted(deleted | (set(ids) - found))
+
+        return Response({
+            'cursor': encode_cursor(position),
+            'reset': False,
+            'has_more': has_more,
+            **data,
+        })